@@ -54,6 +54,11 @@ setup(
         "joblib",
         "pyfiglet",
     ],
+    extras_require={
+        "http2": ["httpx[http2]"],
+        "zstd": ["zstandard"],
+        "lz4": ["lz4"],
+    },
     keywords=["python", "soccer", "data", "ligues", "api", "football"],
     classifiers=[
         "Development Status :: 1 - Planning",
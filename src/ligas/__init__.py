@@ -1,2 +1,7 @@
 from .fbref import Fbref
+from .async_fbref import AsyncFbref
+from .transport import Transport
+from .proxy_pool import ProxyPool
+from .rate_limiter import RateLimiter, SharedRateLimiter
+from .page_cache import PageCache
 from .logger import logger
\ No newline at end of file
@@ -0,0 +1,142 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Type
+
+from .fbref import Fbref
+from .transport import Transport, make_transport
+from .entity_config import SeasonUrls
+
+
+class AsyncFbref:
+    """
+    Asyncio client exposing every `Fbref` endpoint as a coroutine.
+
+    Each coroutine runs the matching `Fbref` endpoint on a bounded worker pool, so
+    many queries can be fanned out from one event loop with `asyncio.gather` while
+    at most `max_concurrency` of them are in flight. Requests still go through the
+    `Fbref` rate limiter, retry policy and cache, which are shared with synchronous
+    callers in the same process, and through its transport unless `http2` is set.
+
+    Coroutines take the arguments of their endpoint, keyword arguments included,
+    such as `timeout=`, `deadline=` and `with_status=`.
+
+    eg:
+        async with AsyncFbref(max_concurrency=8) as fbref:
+            fixtures, teams = await asyncio.gather(
+                fbref.Fixtures("2023-2024", "Serie A"),
+                fbref.TeamsInfos("Serie A"),
+            )
+
+    Args:
+        max_concurrency (int): Maximum number of endpoint calls running at once.
+        client (Type[Fbref]): The synchronous client whose endpoints are wrapped.
+        http2 (bool): Send the requests of this instance through its own transport
+            multiplexing them over HTTP/2, see `make_transport`; requests through
+            `Fbref.proxy_pool` use one HTTP/2 connection per proxy. Other users of
+            `client` keep its transport; the one of this instance is closed by
+            `close`.
+    """
+
+    def __init__(
+        self, max_concurrency: int = 8, client: Type[Fbref] = Fbref, http2: bool = False
+    ) -> None:
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._transport: Optional[Transport] = None
+
+        if http2:
+            self._transport = make_transport(
+                http2=True, pool_maxsize=max(max_concurrency, client.transport.pool_maxsize)
+            )
+            # A subclass carrying the transport, sharing everything else with `client`
+            self.client = type(client.__name__, (client,), {"transport": self._transport})
+
+    async def __aenter__(self) -> "AsyncFbref":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Shuts the worker pool down, waiting for running calls to finish, then closes
+        the transport of this instance if it has one.
+
+        The wait happens on the default executor of the loop, so other tasks keep
+        running meanwhile.
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, functools.partial(executor.shutdown, wait=True))
+
+        transport, self._transport = self._transport, None
+        if transport is not None:
+            transport.close()
+
+    async def _run(self, endpoint: Callable, *args, **kwargs) -> Any:
+        """Runs a blocking endpoint on the worker pool and awaits its result."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="ligas"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(endpoint, *args, **kwargs)
+        )
+
+    # ====================================== endpoints ==========================================#
+
+    async def get_valid_seasons(self, league: str, **kwargs) -> SeasonUrls:
+        """Coroutine version of `Fbref.get_valid_seasons`."""
+        return await self._run(self.client.get_valid_seasons, league, **kwargs)
+
+    async def LeagueInfos(self, year: str, league: str, **kwargs) -> dict:
+        """Coroutine version of `Fbref.LeagueInfos`."""
+        return await self._run(self.client.LeagueInfos, year, league, **kwargs)
+
+    async def TopScorers(self, league: str, **kwargs) -> dict:
+        """Coroutine version of `Fbref.TopScorers`."""
+        return await self._run(self.client.TopScorers, league, **kwargs)
+
+    async def TopScorer(self, league: str, currentSeason: str, **kwargs) -> dict:
+        """Coroutine version of `Fbref.TopScorer`."""
+        return await self._run(self.client.TopScorer, league, currentSeason, **kwargs)
+
+    async def Fixtures(self, year: str, league: str, **kwargs) -> dict:
+        """Coroutine version of `Fbref.Fixtures`."""
+        return await self._run(self.client.Fixtures, year, league, **kwargs)
+
+    async def MatchReport(self, year: str, league: str, **kwargs) -> dict:
+        """Coroutine version of `Fbref.MatchReport`."""
+        return await self._run(self.client.MatchReport, year, league, **kwargs)
+
+    async def HeadHead(self, year: str, league: str, **kwargs) -> dict:
+        """Coroutine version of `Fbref.HeadHead`."""
+        return await self._run(self.client.HeadHead, year, league, **kwargs)
+
+    async def Matches(self, date: str, year: str, league: str, **kwargs) -> dict:
+        """Coroutine version of `Fbref.Matches`."""
+        return await self._run(self.client.Matches, date, year, league, **kwargs)
+
+    async def FixturesByTeam(self, team: str, year: str, league: str, **kwargs) -> dict:
+        """Coroutine version of `Fbref.FixturesByTeam`."""
+        return await self._run(self.client.FixturesByTeam, team, year, league, **kwargs)
+
+    async def MatchReportByTeam(self, team: str, year: str, league: str, **kwargs) -> dict:
+        """Coroutine version of `Fbref.MatchReportByTeam`."""
+        return await self._run(self.client.MatchReportByTeam, team, year, league, **kwargs)
+
+    async def HeadHeadByTeam(self, team: str, year: str, league: str, **kwargs) -> dict:
+        """Coroutine version of `Fbref.HeadHeadByTeam`."""
+        return await self._run(self.client.HeadHeadByTeam, team, year, league, **kwargs)
+
+    async def TeamsInfos(self, league: str, **kwargs) -> dict:
+        """Coroutine version of `Fbref.TeamsInfos`."""
+        return await self._run(self.client.TeamsInfos, league, **kwargs)
+
+    async def TeamInfos(self, team: str, league: str, **kwargs) -> dict:
+        """Coroutine version of `Fbref.TeamInfos`."""
+        return await self._run(self.client.TeamInfos, team, league, **kwargs)
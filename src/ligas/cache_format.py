@@ -0,0 +1,210 @@
+import io
+import json
+import os
+import pickle
+import tempfile
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+import pandas as pd
+
+from .cache_policy import CacheEntry
+from .logger import logger
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+# Extension of the cache files
+CACHE_SUFFIX = ".cache"
+# First bytes of every cache file
+MAGIC = b"LIGAS-CACHE\n"
+# Layout of the files; readers skip files of another layout
+FORMAT_VERSION = 1
+# Version of the data produced by the parsers. Bump it whenever an endpoint returns
+# differently shaped data: entries written with another version are ignored.
+SCHEMA_VERSION = 1
+
+# Compression codecs, preferred first; zlib ships with Python
+CODECS: Tuple[str, ...] = ("zstd", "lz4", "zlib")
+
+
+@lru_cache(maxsize=None)
+def is_available(codec: str) -> bool:
+    """Returns True if `codec` can be used."""
+    return {"zstd": zstandard, "lz4": lz4_frame, "zlib": zlib}.get(codec) is not None
+
+
+def available_codecs() -> Tuple[str, ...]:
+    """Returns the installed codecs among `CODECS`, preferred first."""
+    return tuple(codec for codec in CODECS if is_available(codec))
+
+
+def best_codec() -> str:
+    """
+    Returns the preferred installed codec.
+
+    zstd (`pip install ligas[zstd]`) gives the smallest files, lz4
+    (`pip install ligas[lz4]`) the fastest loads, zlib is always available.
+    """
+    return available_codecs()[0]
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    if codec == "lz4":
+        return lz4_frame.compress(data)
+    if codec == "zlib":
+        return zlib.compress(data, 6)
+    raise ValueError(f"Unsupported codec {codec!r}, choose one of {CODECS}")
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if not is_available(codec):
+        raise ValueError(f"Codec {codec!r} is not installed")
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "lz4":
+        return lz4_frame.decompress(data)
+    return zlib.decompress(data)
+
+
+# ====================================== DataFrames ==========================================#
+
+
+def _frame(columns: pd.Index, index: pd.Index, arrays: List[Any], attrs: dict) -> pd.DataFrame:
+    """Rebuilds a DataFrame from the columns written by `_Pickler`."""
+    frame = pd.DataFrame(dict(enumerate(arrays)), index=index)
+    frame.columns = columns
+    frame.attrs = attrs
+    return frame
+
+
+class _Pickler(pickle.Pickler):
+    """
+    Pickler storing DataFrames column by column.
+
+    Each column is stored as one array (numpy or pandas extension array), so the
+    values of a column sit together in the payload and entries do not depend on
+    the internal block layout of pandas.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        if type(obj) is pd.DataFrame:
+            arrays = [obj.iloc[:, i].array for i in range(obj.shape[1])]
+            return _frame, (obj.columns, obj.index, arrays, dict(obj.attrs))
+        return NotImplemented
+
+
+def dump(data: Any) -> bytes:
+    """Returns the uncompressed payload of a cache entry holding `data`."""
+    buffer = io.BytesIO()
+    _Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(data)
+    return buffer.getvalue()
+
+
+# ====================================== entries ==========================================#
+
+
+def write_entry(entry: CacheEntry, path: Path, codec: Optional[str] = None) -> None:
+    """
+    Writes a cache entry to `path` atomically.
+
+    The file holds `MAGIC`, a JSON header line (format and schema versions, codec,
+    expiry and creation times, uncompressed size, pages read) and the compressed
+    payload.
+    `entry.size` is set to the uncompressed size. It is written to a
+    temporary file renamed over `path`, so readers never see a partial entry.
+
+    Args:
+        entry (CacheEntry): The entry.
+        path (Path): The file.
+        codec (str, optional): One of `CODECS`, defaults to `best_codec()`.
+    """
+    codec = codec or best_codec()
+    raw = dump(entry.data)
+    entry.size = len(raw)
+    payload = compress(raw, codec)
+    header = {
+        "format": FORMAT_VERSION,
+        "schema": SCHEMA_VERSION,
+        "codec": codec,
+        "expires": entry.expires,
+        "created": entry.created,
+        "size": entry.size,
+        "pages": entry.pages,
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC + json.dumps(header).encode("utf-8") + b"\n")
+            f.write(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    logger.info(f"Cache entry saved at: {path}")
+
+
+def read_header(path: Path) -> Optional[dict]:
+    """
+    Returns the header of the entry in `path`, without reading its payload.
+
+    Returns:
+        dict | None: The header, None if the file is missing, is not a cache entry,
+            or was written with another format or schema version.
+    """
+    try:
+        with open(path, "rb") as f:
+            return _header(f, path)
+    except FileNotFoundError:
+        return None
+
+
+def read_entry(path: Path) -> Optional[CacheEntry]:
+    """
+    Returns the entry stored in `path`, even expired.
+
+    Returns:
+        CacheEntry | None: The entry, None if there is none or it is not readable
+            (older format or schema, unknown codec, corrupted file).
+    """
+    try:
+        with open(path, "rb") as f:
+            header = _header(f, path)
+            if header is None:
+                return None
+            data = pickle.loads(decompress(f.read(), header["codec"]))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error(f"Ignoring unreadable cache entry {path}: {e!r}")
+        return None
+    logger.info(f"Cache entry loaded from: {path}")
+    return CacheEntry(
+        data, header["expires"], header["created"], header.get("size"), header.get("pages")
+    )
+
+
+def _header(f, path: Path) -> Optional[dict]:
+    if f.read(len(MAGIC)) != MAGIC:
+        return None
+    try:
+        header = json.loads(f.readline())
+    except ValueError:
+        logger.error(f"Ignoring cache entry {path} with a corrupted header")
+        return None
+    if header.get("format") != FORMAT_VERSION or header.get("schema") != SCHEMA_VERSION:
+        return None
+    return header
@@ -0,0 +1,157 @@
+import shutil
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from .cache_format import CACHE_SUFFIX, best_codec, read_header
+from .page_cache import PageCache
+from .utils import metadata_root
+from .logger import logger
+
+# Name of the daily directories of earlier versions
+DATE_FORMAT = "%Y-%m-%d"
+
+
+class CacheManager:
+    """
+    Location and upkeep of the files kept by ligas.
+
+    Everything lives under `root`: the result cache of `cache_data`, the raw page
+    cache (`page_cache`, in `pages`) and the state files of other components, see
+    `file`. Each result is one file in the `results` directory; when it expires
+    (see `CachePolicy`) it is refetched and the file replaced. The root is resolved
+    once, so the cache does not follow later changes of the working directory, and
+    the directory is created on the first lookup only: a lookup just builds a path.
+
+    Entries are written in the format of `cache_format`, compressed with `codec`.
+    A janitor thread, started at most every `janitor_interval` seconds off the path
+    of the calls, deletes the entries no longer readable (written by an earlier
+    version of the parsers or of the format, or left over by an interrupted write),
+    the entries expired for more than `max_stale` seconds, past the window in which
+    they may be served stale, and the expired pages of `page_cache`. Earlier versions also kept results in
+    one directory per day under `root`; the janitor deletes those directories
+    `duration_days` after their day.
+
+    Args:
+        root (Path | str): Directory holding the cache.
+        duration_days (int): Days a daily directory is kept.
+        janitor_interval (float): Seconds between two cleanups.
+        codec (str, optional): Compression of the entries, one of
+            `cache_format.CODECS`, defaults to the best installed one.
+        page_ttl (float): Seconds a page of `page_cache` stays fresh.
+        max_stale (float, optional): Seconds an expired entry is kept, None to keep
+            it for good. Keep it at least `CachePolicy.max_stale`, the entries are
+            served stale within it.
+        clock (Callable): Monotonic clock, in seconds.
+    """
+
+    def __init__(
+        self,
+        root: Union[Path, str] = metadata_root,
+        duration_days: int = 3,
+        janitor_interval: float = 3600.0,
+        codec: Optional[str] = None,
+        page_ttl: float = 24 * 3600,
+        max_stale: Optional[float] = 30 * 24 * 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.root = Path(root).expanduser().resolve()
+        self.codec = codec or best_codec()
+        self.page_cache = PageCache(self.root / "pages", ttl=page_ttl)
+        self.duration_days = duration_days
+        self.janitor_interval = janitor_interval
+        self.max_stale = max_stale
+        self._clock = clock
+        self._results: Optional[Path] = None
+        self._last_cleanup: Optional[float] = None
+        self._janitor: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def path(self, name: str) -> Path:
+        """Returns the file holding the result `name`."""
+        directory = self._results
+        if directory is None:
+            directory = self.root / "results"
+            directory.mkdir(parents=True, exist_ok=True)
+            self._results = directory
+            logger.info(f"Caching results in {directory}")
+        self._schedule_cleanup()
+        return directory / name
+
+    def file(self, name: str) -> Path:
+        """Returns the path of the state file `name` under `root`, e.g. "proxies.json"."""
+        return self.root / name
+
+    def purge(self) -> int:
+        """
+        Deletes the unreadable entries, the entries expired for more than `max_stale`,
+        the expired pages and the daily directories of earlier versions older than
+        `duration_days`.
+
+        Returns:
+            int: Number of entries, pages and directories deleted.
+        """
+        deleted = self._purge_entries() + self.page_cache.purge()
+        expiration = datetime.now() - timedelta(days=self.duration_days)
+        try:
+            folders = list(self.root.iterdir())
+        except FileNotFoundError:
+            return 0
+        for folder in folders:
+            try:
+                folder_date = datetime.strptime(folder.name, DATE_FORMAT)
+            except ValueError:
+                continue
+            if folder_date < expiration and folder.is_dir():
+                logger.info(f"Deleting expired directory: {folder}")
+                shutil.rmtree(folder, ignore_errors=True)
+                deleted += 1
+        return deleted
+
+    def _purge_entries(self) -> int:
+        deleted = 0
+        for file in (self.root / "results").glob("*"):
+            try:
+                if file.suffix == ".tmp":
+                    # Keep the temporary files of writes that may be in progress
+                    stale = time.time() - file.stat().st_mtime > self.janitor_interval
+                elif file.suffix != CACHE_SUFFIX:
+                    stale = True
+                else:
+                    header = read_header(file)
+                    stale = header is None or self._past_stale_window(header)
+                if stale and file.is_file():
+                    file.unlink()
+                    deleted += 1
+            except FileNotFoundError:
+                continue
+        return deleted
+
+    def _past_stale_window(self, header: dict) -> bool:
+        expires = header.get("expires")
+        if expires is None or self.max_stale is None:
+            return False
+        return time.time() > expires + self.max_stale
+
+    def _schedule_cleanup(self) -> None:
+        """Starts the janitor if the last cleanup is older than `janitor_interval`."""
+        now = self._clock()
+        last = self._last_cleanup
+        if last is not None and now - last < self.janitor_interval:
+            return
+        with self._lock:
+            if self._last_cleanup is not None and now - self._last_cleanup < self.janitor_interval:
+                return
+            self._last_cleanup = now
+            self._janitor = threading.Thread(
+                target=self._cleanup, name="ligas-cache-janitor", daemon=True
+            )
+            self._janitor.start()
+
+    def _cleanup(self) -> None:
+        try:
+            self.purge()
+        except OSError as e:
+            logger.error(f"Cache cleanup of {self.root} failed: {e}")
@@ -0,0 +1,226 @@
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import requests
+
+from .exceptions import FbrefCircuitOpenException, FbrefRateLimitException, FbrefTimeoutException
+from .schedule import ScheduleTable
+
+# A season argument, e.g. "2023-2024", or "2022" for calendar-year competitions
+SEASON = re.compile(r"^(\d{4})(?:-(\d{4}))?$")
+
+# Endpoints reading the history page of a league
+HISTORY_ENDPOINTS = ("_history", "get_valid_seasons", "TopScorers", "TopScorer")
+
+
+@dataclass
+class CacheEntry:
+    """
+    A result stored by `cache_data`, with the time it expires.
+
+    Attributes:
+        data (Any): The result.
+        expires (float | None): Unix time after which the result is refetched, None
+            if it never expires.
+        created (float | None): Unix time the result was computed.
+        size (int | None): Bytes of the pickled result, as held before compression.
+        pages (Dict[str, str] | None): Digest of each page the result was parsed
+            from, by URL, None if they are not known (see `page_cache.PageLog`).
+    """
+
+    data: Any
+    expires: Optional[float] = None
+    created: Optional[float] = None
+    size: Optional[int] = None
+    pages: Optional[Dict[str, str]] = None
+
+    def fresh(self, now: Optional[float] = None) -> bool:
+        """Returns True if the entry has not expired at `now` (default: now)."""
+        return self.expires is None or (time.time() if now is None else now) < self.expires
+
+
+@dataclass
+class CacheStatus:
+    """
+    How a call of a `cache_data` endpoint was served, returned with its result when
+    it is given `with_status=True`.
+
+    Attributes:
+        fresh (bool): False if the result has expired and is served stale.
+        expires (float | None): Unix time the result expires, None if never.
+        created (float | None): Unix time the result was computed, if known.
+        revalidating (bool): A background refresh of the result was scheduled.
+        error (BaseException | None): The error of the refresh that failed, when a
+            stale result is served in its place.
+    """
+
+    fresh: bool
+    expires: Optional[float] = None
+    created: Optional[float] = None
+    revalidating: bool = False
+    error: Optional[BaseException] = None
+
+    @property
+    def stale(self) -> bool:
+        return not self.fresh
+
+
+class CachePolicy:
+    """
+    Decides how long each result of `cache_data` stays fresh, from what it holds.
+
+    - Results about a completed season never change and never expire.
+    - Results read from the history page of a league (`get_valid_seasons`,
+      `TopScorers`, ...) list the ongoing season and, before long, the next one:
+      they expire after `history_ttl`, or earlier when the next match of the
+      current season is over, so that new seasons and top scorers are picked up.
+    - Results about the current season (schedules, fixtures, standings, team
+      stats) expire when the next match of the league should be over, that is
+      `match_duration` after its kickoff, read from the season's schedule. They
+      stay at least `min_ttl` and at most `max_ttl`, so that postponed matches and
+      new fixtures are still picked up.
+    - Other results expire after `default_ttl`.
+
+    A season "YYYY-YYYY" is completed from the first of `season_end_month` of its
+    second year, a calendar-year season "YYYY" (World Cup, MLS, ...) once that year
+    has ended.
+
+    Expired results are kept and can still be served:
+
+    - With `stale_while_revalidate`, an expired result is returned at once and
+      refreshed in the background, so callers never wait on FBref.
+    - With `stale_on_error`, an expired result is returned when its refresh fails
+      with one of `stale_errors` (rate limiting, timeouts, network errors).
+
+    Either way, results expired for more than `max_stale` seconds are not served.
+
+    Args:
+        default_ttl (float): Seconds a result stays fresh when no rule applies.
+        history_ttl (float, optional): Longest lifetime of a history result, None
+            for never.
+        match_duration (float): Seconds from kickoff until a result is published.
+        min_ttl (float): Shortest lifetime of a current season result.
+        max_ttl (float): Longest lifetime of a current season result.
+        season_end_month (int): Month from which a season is completed.
+        stale_while_revalidate (bool): Serve expired results while refreshing them.
+        stale_on_error (bool): Serve expired results when their refresh fails.
+        max_stale (float, optional): Seconds after expiry during which a result may be
+            served, None for no limit.
+        stale_errors (Tuple[type, ...]): Errors of a refresh on which the expired
+            result is served.
+        clock (Callable): Wall clock, in unix seconds.
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = 24 * 3600,
+        history_ttl: Optional[float] = 24 * 3600,
+        match_duration: float = 2.5 * 3600,
+        min_ttl: float = 15 * 60,
+        max_ttl: float = 7 * 24 * 3600,
+        season_end_month: int = 7,
+        stale_while_revalidate: bool = False,
+        stale_on_error: bool = True,
+        max_stale: Optional[float] = None,
+        stale_errors: Tuple[type, ...] = (
+            FbrefRateLimitException,
+            FbrefCircuitOpenException,
+            FbrefTimeoutException,
+            requests.RequestException,
+        ),
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.default_ttl = default_ttl
+        self.history_ttl = history_ttl
+        self.match_duration = match_duration
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.season_end_month = season_end_month
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_on_error = stale_on_error
+        self.max_stale = max_stale
+        self.stale_errors = stale_errors
+        self._clock = clock
+
+    def now(self) -> float:
+        """Returns the current unix time of the policy's clock."""
+        return self._clock()
+
+    def fresh(self, entry: CacheEntry) -> bool:
+        """Returns True if `entry` has not expired."""
+        return entry.fresh(self._clock())
+
+    def ttl(self, entry: CacheEntry) -> Optional[float]:
+        """Returns the seconds until `entry` expires, None if it never does."""
+        return None if entry.expires is None else entry.expires - self._clock()
+
+    def servable(self, entry: CacheEntry) -> bool:
+        """Returns True if `entry` may be served, fresh or stale within `max_stale`."""
+        ttl = self.ttl(entry)
+        return ttl is None or self.max_stale is None or ttl > -self.max_stale
+
+    def status(self, entry: CacheEntry, **details: Any) -> CacheStatus:
+        """Describes how `entry` is served, see `CacheStatus`."""
+        return CacheStatus(self.fresh(entry), entry.expires, entry.created, **details)
+
+    def completed(self, season: str) -> bool:
+        """Returns True if `season` ("YYYY-YYYY" or "YYYY") is over."""
+        match = SEASON.match(season)
+        if match is None:
+            return False
+        if match.group(2) is None:
+            end = datetime(int(match.group(1)) + 1, 1, 1, tzinfo=timezone.utc)
+        else:
+            end = datetime(int(match.group(2)), self.season_end_month, 1, tzinfo=timezone.utc)
+        return self._clock() >= end.timestamp()
+
+    def expires(
+        self,
+        name: str,
+        arguments: Dict[str, Any],
+        data: Any,
+        schedule: Optional[Callable[[Optional[str], str], Optional[ScheduleTable]]] = None,
+    ) -> Optional[float]:
+        """
+        Returns the unix time at which a result expires, None if it never does.
+
+        Args:
+            name (str): The endpoint, e.g. "Fixtures".
+            arguments (Dict[str, Any]): Its arguments by name, e.g.
+                `{"year": "2023-2024", "league": "Serie A"}`.
+            data (Any): The result.
+            schedule (Callable, optional): Returns the schedule of a league season
+                (None for the current one) if it is cached, without fetching it.
+        """
+        now = self._clock()
+        seasons = [v for v in arguments.values() if isinstance(v, str) and SEASON.match(v)]
+        if seasons and all(self.completed(season) for season in seasons):
+            return None
+
+        league = arguments.get("league")
+        if name in HISTORY_ENDPOINTS:
+            if self.history_ttl is None:
+                return None
+            expires = now + self.history_ttl
+            table = None
+            if schedule is not None and isinstance(league, str):
+                table = schedule(None, league)
+            if table is not None:
+                expires = min(expires, self.after_next_match(table.kickoffs(), now))
+            return expires
+
+        table = data if isinstance(data, ScheduleTable) else None
+        if table is None and schedule is not None and isinstance(league, str):
+            table = schedule(seasons[0] if seasons else None, league)
+        if table is None:
+            return now + self.default_ttl
+        return self.after_next_match(table.kickoffs(), now)
+
+    def after_next_match(self, kickoffs: Iterable[float], now: float) -> float:
+        """Returns when the first match not over at `now` will be, within the bounds."""
+        ends = [kickoff + self.match_duration for kickoff in kickoffs]
+        end = min((end for end in ends if end > now), default=now + self.max_ttl)
+        return min(max(end, now + self.min_ttl), now + self.max_ttl)
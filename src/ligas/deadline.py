@@ -0,0 +1,111 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Iterator, Optional, Tuple, Union
+
+from .exceptions import FbrefTimeoutException
+
+
+class Deadline:
+    """
+    Point in time by which a call, and every request it makes, must be done.
+
+    Deadlines are kept on the monotonic clock so that they are not affected by
+    changes of the system time.
+
+    Args:
+        at (float): Monotonic time of the deadline, see `time.monotonic`.
+        budget (float): Seconds the caller granted, reported in timeout errors.
+    """
+
+    def __init__(self, at: float, budget: float) -> None:
+        self.at = at
+        self.budget = budget
+
+    @classmethod
+    def after(cls, timeout: float) -> "Deadline":
+        """Returns the deadline `timeout` seconds from now."""
+        return cls(time.monotonic() + timeout, timeout)
+
+    @classmethod
+    def parse(cls, deadline=None, timeout: Optional[float] = None) -> Optional["Deadline"]:
+        """
+        Builds a deadline from the `deadline=` and `timeout=` arguments of an endpoint.
+
+        Args:
+            deadline (Deadline | datetime | float, optional): Absolute deadline, a
+                `datetime` or a unix timestamp as returned by `time.time`.
+            timeout (float, optional): Seconds from now.
+
+        Returns:
+            Deadline | None: The earliest of both, None if neither is given.
+        """
+        candidates = []
+        if timeout is not None:
+            candidates.append(cls.after(timeout))
+        if isinstance(deadline, Deadline):
+            candidates.append(deadline)
+        elif deadline is not None:
+            if isinstance(deadline, datetime):
+                deadline = deadline.timestamp()
+            budget = deadline - time.time()
+            candidates.append(cls(time.monotonic() + budget, budget))
+        return min(candidates, key=lambda d: d.at, default=None)
+
+    def remaining(self) -> float:
+        """Returns the seconds left, never negative."""
+        return max(0.0, self.at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self, url: Optional[str] = None) -> None:
+        """Raises `FbrefTimeoutException` if the deadline has passed."""
+        if self.expired:
+            raise FbrefTimeoutException(self.budget, url)
+
+    def clamp(self, timeout: Union[float, Tuple[float, float]]):
+        """
+        Shortens a (connect, read) or single timeout so it ends before the deadline.
+        """
+        remaining = self.remaining()
+        if isinstance(timeout, tuple):
+            return tuple(min(t, remaining) for t in timeout)
+        return min(timeout, remaining)
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("ligas_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Returns the deadline of the call being run, None if it has none."""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """
+    Makes `deadline` the current deadline while the block runs.
+
+    A nested scope can only tighten the deadline of its caller: the earliest of
+    both applies, so an endpoint called by another one never outlives it.
+
+    Args:
+        deadline (Deadline, optional): The deadline of the block, None to inherit
+            the current one.
+
+    Yields:
+        Deadline | None: The deadline in effect inside the block.
+    """
+    outer = _current.get()
+    if deadline is None or (outer is not None and outer.at <= deadline.at):
+        yield outer
+        return
+
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
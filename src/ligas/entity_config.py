@@ -1,5 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 @dataclass
 class SeasonUrls():
-    seasonUrls : dict
\ No newline at end of file
+    seasonUrls : dict
+
+@dataclass
+class FetchTask():
+    endpoint : str
+    args : tuple = ()
+    kwargs : dict = field(default_factory=dict)
+    priority : int = 0
+
+    def key(self) -> tuple:
+        return (self.endpoint, self.args, tuple(sorted(self.kwargs.items())))
@@ -1,5 +1,5 @@
 from requests import exceptions
-from typing import Sequence
+from typing import Optional, Sequence
 from ligas import logger
 import logging
 
@@ -114,3 +114,41 @@ class FbrefInvalidTeamException(Exception):
             f"InvalidTeam:  {self.year} season--{self.team}  is not valid "
             + f"when using  {self.module} module, please choose right team which is in {self.teams}"
         )
+
+
+class FbrefCircuitOpenException(Exception):
+    """
+    Raised this exception when requests to a host are suspended because it kept failing
+    """
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        self.host = host
+        self.retry_in = retry_in
+
+        super().__init__()
+
+    def __str__(self) -> str:
+
+        return (
+            f"CircuitOpen: too many failed requests to {self.host}, "
+            + f"requests are suspended for another {self.retry_in:.0f}s"
+        )
+
+
+class FbrefTimeoutException(Exception):
+    """
+    Raised this exception when a call did not complete within the time granted by the client
+    """
+
+    def __init__(self, budget: float, url: Optional[str] = None) -> None:
+        self.budget = budget
+        self.url = url
+
+        super().__init__()
+
+    def __str__(self) -> str:
+
+        return (
+            f"Timeout: the {self.budget:.1f}s budget of the call ran out"
+            + (f" while fetching {self.url}" if self.url else "")
+        )
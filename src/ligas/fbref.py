@@ -1,7 +1,7 @@
 import os
-import re
+import copy
+import inspect
 import time
-import random
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -9,10 +9,18 @@ import requests
 import threading
 import numpy as np
 import pandas as pd
-from io import StringIO
-from bs4 import BeautifulSoup
-from typing import Sequence, List, Dict
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Sequence, List, Dict, Optional, Tuple, Iterable, Iterator, Union
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+    FIRST_COMPLETED,
+    as_completed,
+    wait,
+)
 from functools import wraps
+from urllib.parse import urlsplit
 
 from .exceptions import (
     FbrefRequestException,
@@ -21,17 +29,33 @@ from .exceptions import (
     FbrefInvalidYearException,
     FbrefInvalidSeasonsException,
     FbrefInvalidTeamException,
+    FbrefTimeoutException,
 )
-from .entity_config import SeasonUrls
-from .utils import (
-    compositions,
-    browserHeaders,
-    browser,
-    save_bin,
-    load_bin,
-    get_proxy,
-    get_cache_directory,
+from .entity_config import SeasonUrls, FetchTask
+from .transport import Transport, SingleFlight
+from .page_cache import (
+    PageCache,
+    canonical_url,
+    current_page_log,
+    current_pages_since,
+    page_digest,
+    page_log_scope,
+    pages_since_scope,
 )
+from .proxy_pool import ProxyPool
+from .rate_limiter import RateLimiter, SharedRateLimiter, parse_retry_after
+from .retry import RetryPolicy, CircuitBreaker, AttemptRecord, AttemptMetrics
+from .hedging import HedgePolicy
+from .deadline import Deadline, current_deadline, deadline_scope
+from .parsing import best_parser, css_class, make_soup, table_frame
+from .schedule import ScheduleTable, MATCH_REPORT, HEAD_TO_HEAD
+from .history import LeagueHistory
+from .team_page import TeamPage, commented_tables
+from .memory_cache import MemoryCache
+from .cache_manager import CacheManager
+from .cache_policy import CacheEntry, CachePolicy
+from .cache_format import CACHE_SUFFIX, dump, read_entry, read_header, write_entry
+from .utils import compositions
 from .logger import logger
 
 cuurentYear = datetime.now(tz=timezone.utc).year
@@ -40,8 +64,25 @@ cache_duration_days = 3
 
 
 class Fbref:
-    wait_time: int = 10
     baseurl: str = "https://fbref.com/"
+    transport: Transport = Transport()
+    inflight: SingleFlight = SingleFlight()
+    cache_manager: CacheManager = CacheManager(duration_days=cache_duration_days)
+    page_cache: Optional[PageCache] = cache_manager.page_cache
+    proxy_pool: Optional[ProxyPool] = ProxyPool(path=cache_manager.file("proxies.json"))
+    rate_limiter: RateLimiter = RateLimiter()
+    retry_policy: RetryPolicy = RetryPolicy()
+    circuit_breaker: CircuitBreaker = CircuitBreaker()
+    metrics: AttemptMetrics = AttemptMetrics()
+    hedge_policy: Optional[HedgePolicy] = None
+    parser: str = best_parser()
+    result_cache: Optional[MemoryCache] = MemoryCache()
+    cache_policy: CachePolicy = CachePolicy()
+    refresh_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=2, thread_name_prefix="ligas-refresh"
+    )
+    _revalidating: set = set()
+    _revalidating_lock = threading.Lock()
 
     # ====================================== wraper for save data ==========================================#
     @staticmethod
@@ -49,31 +90,297 @@ class Fbref:
         """
         Decorator to check if the data is already stored in a file.
         If yes, it loads the data. Otherwise, it executes the function, saves the data, and then returns it.
+
+        Results are also kept in `result_cache`, an in-memory LRU checked before the
+        files: repeated calls within a process return without touching the disk. Set
+        `result_cache` to None to disable it, and see `result_cache.summary()` for its
+        hit and miss counters. Results are shared between callers, do not mutate them.
+
+        How long a result stays fresh is decided by `cache_policy` from the endpoint,
+        its arguments and the data: completed seasons never expire, current season
+        results expire once the next match of the league is over. An expired result
+        whose pages did not change (FBref answers 304) is renewed without parsing them
+        again. Expired results are kept: they are served when their refresh fails on
+        rate limiting or a network error, and, with
+        `cache_policy.stale_while_revalidate`, served at once while `refresh_executor`
+        refreshes them in the background. Pass `with_status=True`
+        to get a `(result, CacheStatus)` pair telling whether the result is stale.
+
+        Every decorated endpoint also accepts `timeout=` (seconds) and `deadline=` (a unix
+        timestamp, `datetime` or `Deadline`). The remaining budget applies to every request
+        made by the call, nested endpoint calls, retries and backoff included, and
+        `FbrefTimeoutException` is raised as soon as it runs out.
+
+        eg:
+            Fbref.TeamInfos("Inter", "Serie A", timeout=60)
+            fixtures, status = Fbref.Fixtures("2023-2024", "Serie A", with_status=True)
         """
+        signature = inspect.signature(func)
+
+        def refresh(
+            cls, file_path: Path, args: tuple, kwargs: dict, expired: Optional[CacheEntry] = None
+        ) -> CacheEntry:
+            """
+            Computes the result, stores it and returns its entry. When it replaces the
+            `expired` entry, pages cached before that entry expired are fetched again,
+            and if none of the pages it was parsed from changed (e.g. FBref answers
+            304), the entry is renewed without parsing them again.
+            """
+            policy = cls.cache_policy
+            with pages_since_scope(expired.expires if expired is not None else None):
+                if expired is not None and cls._pages_unchanged(expired.pages):
+                    logger.info(f"Pages of {file_path} not modified, renewing it")
+                    data, created, pages = expired.data, expired.created, expired.pages
+                else:
+                    logger.info(f"Downloading data and saving to {file_path}")
+                    with page_log_scope() as log:
+                        data = func(cls, *args, **kwargs)
+                    created, pages = policy.now(), log.result()
+
+            arguments = dict(signature.bind(cls, *args, **kwargs).arguments)
+            arguments.pop(next(iter(signature.parameters)))
+            expires = policy.expires(func.__name__, arguments, data, cls._cached_schedule)
+            entry = CacheEntry(data, expires, created, pages=pages)
+            write_entry(entry, file_path, cls.cache_manager.codec)
+            cls._remember(cls._cache_key(func.__name__, args, kwargs), entry)
+            return entry
 
         @wraps(func)
-        def wrapper(cls, *args, **kwargs):
-            # Create a unique filename based on the function and its arguments
-            args_str = "_".join(map(str, args))
-            kwargs_str = "_".join(f"{k}={v}" for k, v in kwargs.items())
-            file_name = f"{func.__name__}_{args_str}_{kwargs_str}.json"
-
-            # Path to today's directory
-            directory = get_cache_directory(cache_duration_days)
-            file_path = directory / file_name
-
-            if file_path.exists():
-                logger.info(f"Loading data from {file_path}")
-                data = load_bin(file_path)
-            else:
-                logger.info(f"Downloading data and saving to {file_path}")
-                data = func(cls, *args, **kwargs)
-                save_bin(data, file_path)
+        def wrapper(cls, *args, deadline=None, timeout=None, with_status=False, **kwargs):
+            policy = cls.cache_policy
+            key = cls._cache_key(func.__name__, args, kwargs)
+            entry = cls.result_cache.get(key) if cls.result_cache is not None else None
 
-            return data
+            if entry is not None:
+                status = None
+            else:
+                file_path = cls._cache_path(func.__name__, args, kwargs)
+                entry = cls._load_entry(file_path)
+                servable = entry is not None and policy.servable(entry)
+
+                if entry is not None and policy.fresh(entry):
+                    cls._remember(key, entry)
+                    status = None
+                elif servable and policy.stale_while_revalidate:
+                    logger.info(f"Serving stale {file_path}, refreshing it in the background")
+                    cls._revalidate(
+                        key, lambda stale=entry: refresh(cls, file_path, args, kwargs, stale)
+                    )
+                    status = policy.status(entry, revalidating=True)
+                else:
+                    try:
+                        with deadline_scope(Deadline.parse(deadline, timeout)) as scope:
+                            if scope is not None:
+                                scope.check()
+                            entry = refresh(cls, file_path, args, kwargs, entry)
+                        status = None
+                    except policy.stale_errors as error:
+                        if not (servable and policy.stale_on_error):
+                            raise
+                        logger.error(f"Serving stale {file_path} after {error!r}")
+                        status = policy.status(entry, error=error)
+
+            log = current_page_log()
+            if log is not None:
+                # The result of an enclosing endpoint is built from the same pages
+                log.merge(entry.pages)
+
+            if with_status:
+                return entry.data, status or policy.status(entry)
+            return entry.data
 
         return wrapper
 
+    @classmethod
+    def _remember(cls, key: str, entry: CacheEntry) -> None:
+        """
+        Keeps a fresh entry in `result_cache` until it expires, sized by its
+        uncompressed payload rather than by its compressed file.
+        """
+        if cls.result_cache is not None:
+            ttl = cls.cache_policy.ttl(entry)
+            size = entry.size if entry.size is not None else len(dump(entry.data))
+            cls.result_cache.put(key, entry, size, ttl)
+
+    @classmethod
+    def _pages_unchanged(cls, pages: Optional[Dict[str, str]]) -> bool:
+        """
+        Fetches (or revalidates) `pages` and returns True if none changed, False if
+        one did or if they are not known.
+        """
+        if not pages:
+            return False
+        return all(page_digest(cls._get(url).content) == digest for url, digest in pages.items())
+
+    @classmethod
+    def _revalidate(cls, key: str, refresh) -> None:
+        """Runs `refresh` in `refresh_executor` unless the same key is already refreshing."""
+        with cls._revalidating_lock:
+            if key in cls._revalidating:
+                return
+            cls._revalidating.add(key)
+
+        def run() -> None:
+            try:
+                refresh()
+            except Exception as error:
+                logger.error(f"Background refresh of {key} failed: {error!r}")
+            finally:
+                with cls._revalidating_lock:
+                    cls._revalidating.discard(key)
+
+        cls.refresh_executor.submit(run)
+
+    @staticmethod
+    def _cache_key(name: str, args: tuple, kwargs: dict) -> str:
+        """
+        Returns the key identifying the result of `name(*args, **kwargs)` in the caches.
+        """
+        args_str = "_".join(map(str, args))
+        kwargs_str = "_".join(f"{k}={v}" for k, v in kwargs.items())
+        return f"{name}_{args_str}_{kwargs_str}"
+
+    @classmethod
+    def _cache_path(cls, name: str, args: tuple, kwargs: dict) -> Path:
+        """
+        Returns the file where `cache_data` stores the result of `name(*args, **kwargs)`.
+        """
+        # Create a unique filename based on the function and its arguments
+        file_name = f"{cls._cache_key(name, args, kwargs)}{CACHE_SUFFIX}"
+        return cls.cache_manager.path(file_name)
+
+    @staticmethod
+    def _load_entry(path: Path) -> Optional[CacheEntry]:
+        """Returns the entry stored in `path`, even expired, None if there is none."""
+        return read_entry(path)
+
+    @classmethod
+    def _fresh_in_cache(cls, name: str, args: tuple, kwargs: dict) -> bool:
+        """
+        Returns True if `name(*args, **kwargs)` has a fresh cached result, reading only
+        the header of its entry. Expired entries kept for stale serving do not count.
+        """
+        key = cls._cache_key(name, args, kwargs)
+        if cls.result_cache is not None and key in cls.result_cache:
+            return True
+        header = read_header(cls._cache_path(name, args, kwargs))
+        return header is not None and cls.cache_policy.fresh(CacheEntry(None, header["expires"]))
+
+    @classmethod
+    def _cached(cls, name: str, args: tuple) -> Optional[object]:
+        """Returns the cached result of `name(*args)`, even expired, without computing it."""
+        entry = None
+        if cls.result_cache is not None:
+            entry = cls.result_cache.peek(cls._cache_key(name, args, {}))
+        if entry is None:
+            entry = cls._load_entry(cls._cache_path(name, args, {}))
+        return entry.data if entry is not None else None
+
+    @classmethod
+    def _cached_schedule(cls, year: Optional[str], league: str) -> Optional[ScheduleTable]:
+        """
+        Returns the cached schedule of a league season, the current one if `year` is
+        None, or None if it is not cached. Used by `cache_policy` to read kickoffs.
+        """
+        if year is None:
+            history = cls._cached("_history", (league,))
+            if not isinstance(history, LeagueHistory) or not history.seasons:
+                return None
+            year = history.seasons[0]
+        schedule = cls._cached("_schedule", (year, league))
+        return schedule if isinstance(schedule, ScheduleTable) else None
+
+    @classmethod
+    def use_cache_manager(cls, manager: CacheManager) -> None:
+        """
+        Keeps every file written by ligas under the root of `manager`: the results,
+        the raw pages, the proxy pool and the ledger of a `SharedRateLimiter`.
+
+        eg:
+            Fbref.use_cache_manager(CacheManager(root="/var/cache/ligas", codec="zstd"))
+        """
+        cls.cache_manager = manager
+        if cls.page_cache is not None:
+            cls.page_cache = manager.page_cache
+        if cls.proxy_pool is not None:
+            cls.proxy_pool.path = manager.file("proxies.json")
+        if isinstance(cls.rate_limiter, SharedRateLimiter):
+            cls.rate_limiter.path = manager.file("ratelimit.sqlite")
+
+    # ====================================== bulk fetch ==========================================#
+
+    @classmethod
+    def fetch_many(
+        cls,
+        tasks: Iterable[Union[FetchTask, tuple]],
+        max_workers: int = 4,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Tuple[FetchTask, Future]]:
+        """
+        Runs a batch of endpoint calls concurrently and yields them as they complete.
+
+        Identical calls are run once. Calls already in the cache are scheduled first,
+        since they cost no request, then the others by ascending `priority`. Several
+        workers run at once so that one of them is always waiting on the rate limiter,
+        keeping it saturated, and pages shared by several calls (e.g. the Scores and
+        Fixtures page of a season) are fetched once thanks to request coalescing.
+
+        Args:
+            tasks (Iterable[FetchTask | tuple]): The calls to make. A tuple is read as
+                `(endpoint, args)` or `(endpoint, args, kwargs)`, e.g.
+                `("Fixtures", ("2023-2024", "Serie A"))`.
+            max_workers (int): Number of calls running at once.
+            timeout (float, optional): Seconds granted to the whole batch. Calls that
+                do not complete in time fail with `FbrefTimeoutException` while the
+                others keep their results.
+
+        Yields:
+            Tuple[FetchTask, Future]: Each task with its completed future; call
+                `future.result()` to get the data or raise the call's error.
+
+        Raises:
+            AttributeError: If a task names an endpoint that does not exist.
+
+        eg:
+            for task, future in Fbref.fetch_many([
+                FetchTask("Fixtures", ("2023-2024", "Serie A")),
+                FetchTask("TeamsInfos", ("Serie A",), priority=1),
+            ]):
+                print(task.endpoint, future.result())
+        """
+        tasks = [
+            task if isinstance(task, FetchTask) else FetchTask(*task) for task in tasks
+        ]
+
+        # Group identical calls so that they are run once
+        groups: Dict[tuple, List[FetchTask]] = {}
+        for task in tasks:
+            if not task.endpoint[:1].isalpha() or not hasattr(cls, task.endpoint):
+                raise AttributeError(f"Fbref has no endpoint {task.endpoint!r}")
+            groups.setdefault(task.key(), []).append(task)
+
+        def order(group: List[FetchTask]) -> tuple:
+            task = group[0]
+            cached = cls._fresh_in_cache(task.endpoint, task.args, task.kwargs)
+            return (not cached, min(t.priority for t in group))
+
+        deadline = Deadline.after(timeout) if timeout is not None else None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for group in sorted(groups.values(), key=order):
+                task = group[0]
+                endpoint = getattr(cls, task.endpoint)
+                kwargs = dict(task.kwargs)
+                if deadline is not None:
+                    kwargs.setdefault("deadline", deadline)
+                future = executor.submit(endpoint, *task.args, **kwargs)
+                futures[future] = group
+
+            for future in as_completed(futures):
+                for task in futures[future]:
+                    yield task, future
+
     # ====================================== request http ==========================================#
     @classmethod
     def _get(cls, url: str) -> requests.Response:
@@ -81,9 +388,20 @@ class Fbref:
         Sends a GET request to the specified URL and handles potential HTTP errors.
 
         This method is responsible for sending an HTTP GET request to the specified URL
-        (typically an endpoint on the FBref website). It initiates a request using the
-        `requests` library, handles rate limiting and certain HTTP errors, and starts
-        a waiting thread to manage delays between requests.
+        (typically an endpoint on the FBref website). Pages fetched less than
+        `page_cache.ttl` seconds ago are read from the raw page cache instead of the
+        network (set `page_cache` to None to disable it), unless they were fetched
+        before the expiry of the result being refreshed, and expired ones are
+        revalidated with a conditional GET. Concurrent calls for the same URL are
+        coalesced by `inflight`: only one request is sent and every caller receives the
+        same response, unless it fails on the deadline of the caller who sent it, in
+        which case the others fetch the page again. Transient failures (connection
+        errors, timeouts, 429 and 5xx responses) are retried according to `retry_policy`
+        with exponential backoff and jitter, honoring `Retry-After`. Every attempt is
+        recorded in `metrics`, and `circuit_breaker` stops traffic to a host that keeps
+        refusing us, so long crawls survive transient errors but do not hammer a site
+        that is down. When the calling endpoint was given a `timeout` or `deadline`,
+        every attempt, backoff and rate limiter wait is bounded by the remaining budget.
 
         Args:
             url (str): The URL endpoint to which the GET request should be sent. This
@@ -95,31 +413,136 @@ class Fbref:
                             including the status code, headers, and content.
 
         Raises:
-            FbrefRateLimitException: If the server responds with a 429 status code,
-                                    indicating that the rate limit has been exceeded.
-            FbrefRequestException: If the server responds with a 404 or 504 status code,
-                                indicating a "Not Found" or "Gateway Timeout" error,
-                                respectively.
-        """
-
-        # Choose a random browser header if needed
-        webBrowser = random.choice(browser)
-        header = browserHeaders.get(webBrowser)
-        proxy = get_proxy()
-
-        response = requests.get(
-            url=url,
-            headers=header,
-            proxies={"http": proxy, "https:": proxy} if proxy else None,
-        )
+            FbrefRateLimitException: If the server still responds with a 429 status code
+                                    once the retries are exhausted.
+            FbrefRequestException: If the server responds with a 404 status code, or with
+                                a 504 status code once the retries are exhausted.
+            FbrefCircuitOpenException: If requests to the host are currently suspended.
+            FbrefTimeoutException: If the deadline of the call passes first.
+            requests.RequestException: If the connection keeps failing once the retries
+                                    are exhausted.
+        """
 
-        wait_thread = threading.Thread(target=cls._wait())
-        wait_thread.start()
-        wait_thread.join()
+        stale = None
+        if cls.page_cache is not None:
+            entry = cls.page_cache.lookup(url, current_pages_since())
+            if entry is not None:
+                cached, fresh = entry
+                if fresh:
+                    return cls._logged(url, cached)
+                stale = cached
+
+        deadline = current_deadline()
+        try:
+            # A caller whose deadline passed gives up alone: the callers coalesced
+            # with it fetch the page again within their own budget
+            response = cls.inflight.do(
+                canonical_url(url),
+                lambda: cls._fetch_and_store(url, stale),
+                timeout=deadline.remaining() if deadline is not None else None,
+                retry_on=(FbrefTimeoutException,),
+            )
+        except FutureTimeoutError:
+            # Another caller is fetching the page and did not finish in our budget
+            raise FbrefTimeoutException(deadline.budget, url) from None
+        return cls._logged(url, response)
 
-        # Check the status code of the response and handle errors
-        status = response.status_code
+    @staticmethod
+    def _logged(url: str, response: requests.Response) -> requests.Response:
+        """Records `response` in the page log of the result being computed, if any."""
+        log = current_page_log()
+        if log is not None:
+            log.record(url, response.content)
+        return response
+
+    @classmethod
+    def _fetch_and_store(
+        cls, url: str, stale: Optional[requests.Response] = None
+    ) -> requests.Response:
+        """
+        Fetches `url` and stores the response in the page cache.
+
+        When an expired copy of the page is available, the request is made conditional
+        on its validators (ETag, Last-Modified); a 304 answer renews the cached copy
+        and returns it without transferring the body again.
+        """
+        headers = cls.page_cache.validators(stale) if stale is not None else None
+        response = cls._fetch(url, headers)
+
+        if response.status_code == 304 and stale is not None:
+            logger.info(f"{url} not modified, renewing cached page")
+            cls.page_cache.renew(url)
+            return stale
 
+        if cls.page_cache is not None:
+            cls.page_cache.put(url, response)
+        return response
+
+    @classmethod
+    def _fetch(cls, url: str, headers: Optional[dict] = None) -> requests.Response:
+        """
+        Fetches `url`, retrying transient failures. See `_get` for the details.
+
+        Args:
+            url (str): The URL to fetch.
+            headers (dict, optional): Extra request headers, e.g. conditional ones.
+        """
+        host = urlsplit(url).netloc
+        policy = cls.retry_policy
+        deadline = current_deadline()
+
+        for attempt in range(1, policy.max_attempts + 1):
+            if deadline is not None:
+                deadline.check(url)
+            cls.circuit_breaker.before_request(host)
+
+            start = time.monotonic()
+            response, error = cls._send(url, headers, deadline)
+            status = response.status_code if response is not None else None
+            record = AttemptRecord(
+                url=url,
+                attempt=attempt,
+                status=status,
+                error=type(error).__name__ if error is not None else None,
+                elapsed=time.monotonic() - start,
+            )
+
+            if not policy.is_transient(status, error):
+                cls.metrics.record(record)
+                cls.circuit_breaker.record_success(host)
+                break
+
+            cls.circuit_breaker.record_failure(host)
+            if attempt == policy.max_attempts:
+                cls.metrics.record(record)
+                break
+
+            retry_after = (
+                parse_retry_after(response.headers.get("Retry-After"))
+                if response is not None
+                else None
+            )
+            if status == 429:
+                # `rate_limiter` already holds every request back for Retry-After
+                # (see `_attempt`), the next `_acquire` waits it out
+                record.delay = policy.delay(attempt)
+                wait = record.delay + (retry_after or 0.0)
+            else:
+                record.delay = wait = policy.delay(attempt, retry_after)
+            cls.metrics.record(record)
+            if deadline is not None and wait >= deadline.remaining():
+                # Waiting would exhaust the budget, give up now
+                raise FbrefTimeoutException(deadline.budget, url) from error
+            logger.info(
+                f"Attempt {attempt} on {url} failed ({record.error or status}), "
+                + f"retrying in {record.delay:.1f}s"
+            )
+            time.sleep(record.delay)
+
+        if error is not None:
+            raise error
+
+        # Check the status code of the response and handle errors
         if status == 429:
             raise FbrefRateLimitException()  # Raised when too many requests are sent
 
@@ -128,27 +551,190 @@ class Fbref:
 
         return response
 
-    # ====================================== Waiting time to avoid rate limit error ====================#
-
     @classmethod
-    def _wait(cls):
+    def _send(
+        cls, url: str, headers: Optional[dict] = None, deadline: Optional[Deadline] = None
+    ) -> Tuple[Optional[requests.Response], Optional[Exception]]:
         """
-        Implements a waiting period to avoid triggering rate limit errors.
-
-        This method pauses the execution of the program for a specified amount of time,
-        defined by `self.wait_time`. It is primarily used to prevent sending too many
-        requests in a short period, which could result in rate limiting by the server.
+        Performs a single attempt of a GET request.
 
-        The method should be invoked before making HTTP requests to ensure compliance
-        with the server's request rate policies.
+        The request is sent through the shared pooled `transport`, so connections,
+        cookies and headers are reused across calls. It is paced by the adaptive
+        `rate_limiter`, which only blocks when the request budget is spent and slows
+        down whenever FBref answers 429. A proxy is taken from `proxy_pool` (set it to
+        None to always connect directly) and the outcome of the request is reported back
+        so that failing proxies are evicted. When `hedge_policy` is set, a request that
+        is slower than usual is duplicated through another route, see `_hedged`.
 
         Args:
-            None
+            url (str): The URL to fetch.
+            headers (dict, optional): Extra request headers.
+            deadline (Deadline, optional): Bounds the rate limiter wait and the
+                transport timeouts.
 
         Returns:
-            None
+            tuple: `(response, None)` when the server answered, `(None, error)` when the
+                request raised a `requests.RequestException`.
+
+        Raises:
+            FbrefTimeoutException: If no request can be sent before `deadline`.
+        """
+        proxy = cls.proxy_pool.get() if cls.proxy_pool is not None else None
+
+        cls._acquire(url, deadline)
+
+        timeout = deadline.clamp(cls.transport.timeout) if deadline is not None else None
+        if cls.hedge_policy is not None:
+            return cls._hedged(url, headers, proxy, timeout, deadline)
+        return cls._attempt(url, headers, proxy, timeout)
+
+    @classmethod
+    def _acquire(cls, url: str, deadline: Optional[Deadline]) -> None:
+        """Takes a rate limiter token, failing fast if it comes after `deadline`."""
+        if deadline is None:
+            cls.rate_limiter.acquire()
+        elif cls.rate_limiter.acquire(timeout=deadline.remaining()) is None:
+            raise FbrefTimeoutException(deadline.budget, url)
+
+    @classmethod
+    def _hedged(
+        cls,
+        url: str,
+        headers: Optional[dict],
+        proxy: Optional[str],
+        timeout=None,
+        deadline: Optional[Deadline] = None,
+    ) -> Tuple[Optional[requests.Response], Optional[Exception]]:
+        """
+        Sends the request and, if it is still pending after the hedging delay of
+        `hedge_policy`, a duplicate through another proxy or a direct connection.
+
+        The first successful answer wins; the other request is cancelled if it has
+        not started yet, otherwise its response is discarded.
+        """
+        policy = cls.hedge_policy
+        delay = policy.delay()
+        primary = policy.executor.submit(cls._attempt, url, headers, proxy, timeout)
+
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+
+        backup_proxy = cls.proxy_pool.get() if cls.proxy_pool is not None else None
+        if backup_proxy == proxy:
+            backup_proxy = None
+
+        if deadline is not None:
+            # The backup only gets what is left of the budget
+            timeout = deadline.clamp(cls.transport.timeout)
+            if cls.rate_limiter.acquire(timeout=deadline.remaining()) is None:
+                # No token left within the budget, stick to the primary request
+                return primary.result()
+        else:
+            cls.rate_limiter.acquire()
+        backup = policy.executor.submit(cls._attempt, url, headers, backup_proxy, timeout)
+        policy.hedged += 1
+        logger.info(f"{url} slower than {delay:.1f}s, hedging the request")
+
+        outcome, winner, pending = None, None, {primary, backup}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                response, error = future.result()
+                if outcome is None or (outcome[1] is not None and error is None):
+                    outcome, winner = (response, error), future
+            if outcome[1] is None:
+                break
+
+        if winner is backup:
+            policy.hedge_wins += 1
+        for future in pending:
+            if not future.cancel():
+                future.add_done_callback(cls._discard)
+
+        return outcome
+
+    @staticmethod
+    def _discard(future: Future) -> None:
+        """Releases the connection held by the response of a losing hedged request."""
+        response, _ = future.result()
+        if response is not None and response.raw is not None:
+            response.close()
+
+    @classmethod
+    def _attempt(
+        cls, url: str, headers: Optional[dict], proxy: Optional[str], timeout=None
+    ) -> Tuple[Optional[requests.Response], Optional[Exception]]:
+        """
+        Sends one request through `proxy` (or directly) and reports its outcome to
+        the proxy pool, the rate limiter and the hedging policy. `timeout` overrides
+        the default timeouts of the transport.
         """
-        time.sleep(cls.wait_time)
+        try:
+            response = cls.transport.get(
+                url,
+                headers=headers,
+                proxies={"http": proxy, "https": proxy} if proxy else None,
+                timeout=timeout,
+            )
+        except requests.RequestException as error:
+            if proxy:
+                cls.proxy_pool.report_failure(proxy)
+            return None, error
+
+        if proxy:
+            if response.status_code in {403, 407, 429}:
+                cls.proxy_pool.report_failure(proxy)
+            else:
+                cls.proxy_pool.report_success(
+                    proxy, response.elapsed.total_seconds()
+                )
+
+        if response.status_code == 429:
+            cls.rate_limiter.on_rate_limited(
+                parse_retry_after(response.headers.get("Retry-After"))
+            )
+        else:
+            cls.rate_limiter.on_success()
+            if cls.hedge_policy is not None:
+                cls.hedge_policy.record(response.elapsed.total_seconds())
+
+        return response, None
+
+    # ====================================== html parsing ==========================================#
+
+    @classmethod
+    def _soup(cls, content: bytes, only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        Parses a page with the `parser` backend.
+
+        `parser` defaults to the fastest installed tree builder (lxml, a dependency of
+        ligas); set it to "html5lib" or "html.parser" to use another one, e.g.
+        `Fbref.parser = "html.parser"`. Every backend yields the same data.
+
+        Endpoints pass `only` to declare the elements they read (e.g. the tables of the
+        page), so that only those subtrees are built instead of the whole page.
+        """
+        return make_soup(content, cls.parser, only)
+
+    # ====================================== league history ==========================================#
+
+    @classmethod
+    @cache_data
+    def _history(cls, league: str) -> LeagueHistory:
+        """
+        Fetches and parses the history page of a league once.
+
+        `get_valid_seasons`, `TopScorers` and `TopScorer` read the returned
+        `LeagueHistory`, which is cached like an endpoint result.
+
+        Args:
+            league (str): The league, e.g. "Serie A".
+        """
+        r = cls._get(compositions[league]["history url"])
+        soup = cls._soup(r.content, only=SoupStrainer("tr"))
+        return LeagueHistory.parse(soup.find_all("tr"), league)
 
     # ====================================== get current seasons ==========================================#
 
@@ -190,21 +776,8 @@ class Fbref:
         if league not in validLeagues:
             raise FbrefInvalidLeagueException(league, "FBref", validLeagues)
 
-        # Get the URL for the league's history page from the compositions dictionary
-        url = compositions[league]["history url"]
-
-        # Send a GET request to the URL and parse the content using BeautifulSoup
-        r = cls._get(url)
-        soup = BeautifulSoup(r.content, "html.parser")
-
-        # Extract the season years and their corresponding URLs
-        seasonUrls = dict(
-            [
-                (x.text, x.find("a")["href"])
-                for x in soup.find_all("th", {"data-stat": True, "class": True})
-                if x.find("a") is not None
-            ]
-        )
+        # Read the seasons from the league history, parsed once per league
+        seasonUrls = cls._history(league).season_url_map()
 
         # Return the result wrapped in a SeasonUrls object
         return SeasonUrls(seasonUrls)
@@ -273,8 +846,8 @@ class Fbref:
         url = urls.seasonUrls[year]
 
         # Send a GET request to the constructed URL and parse the content
-        response = requests.get(os.path.join(cls.baseurl, url[1:]))
-        soup = BeautifulSoup(response.content, "html.parser")
+        response = cls._get(os.path.join(cls.baseurl, url[1:]))
+        soup = cls._soup(response.content, only=SoupStrainer("div", attrs={"id": "meta"}))
 
         # Extract league information from the HTML content
         r = soup.find("div", attrs={"id": "meta"})
@@ -349,33 +922,8 @@ class Fbref:
         if league not in validLeagues:
             raise FbrefInvalidLeagueException(league, "FBref", validLeagues)
 
-        # Retrieve the URL for the league's historical data
-        url = compositions[league]["history url"]
-        r = cls._get(url)
-        soup = BeautifulSoup(r.content, "html.parser")
-
-        # Extract top scorer information from the parsed HTML
-        top_scorers = {
-            f'{league} season {row.find("th", {"data-stat": "year_id"}).text.strip()}': {
-                "year": row.find("th", {"data-stat": "year_id"}).text.strip(),
-                "top_scorer": row.find("td", {"data-stat": "top_scorers"})
-                .find("a")
-                .text.strip(),
-                "goals": row.find("td", {"data-stat": "top_scorers"})
-                .find("span")
-                .text.strip(),
-                "stats_link": cls.baseurl
-                + row.find("td", {"data-stat": "top_scorers"}).find("a")["href"],
-                "club": (
-                    row.find("td", {"data-stat": "champ"}).text.split("-")[0].strip()
-                    if row.find("td", {"data-stat": "champ"})
-                    else "Unknown"
-                ),
-            }
-            for row in soup.find_all("tr")
-            if row.find("td", {"data-stat": "top_scorers"})
-            and row.find("td", {"data-stat": "top_scorers"}).find("a")
-        }
+        # Read the top scorers from the league history, parsed once per league
+        top_scorers = cls._history(league).top_scorer_records(cls.baseurl)
 
         if not top_scorers:
             raise ValueError(f"No top scorer data found for the league: {league}")
@@ -423,24 +971,47 @@ class Fbref:
 
             TypeError:
                 If the required statistics table is not found on the player's stats page.
+
+            FbrefInvalidLeagueException:
+                If the provided league is not recognized or is not in the list of valid leagues.
+
+            FbrefInvalidSeasonsException:
+                If the league history names no top scorer for the season.
         """
 
-        # Fetch the top scorers data for the given league using the TopScorers method
-        response = cls.TopScorers(league=league)
-        key = f"{league} season {currentSeason}"
+        # Validate that the league parameter is a string
+        if not isinstance(league, str):
+            raise TypeError('`league` must be a str, e.g., "Champions League".')
+
+        # Validate that the league is in the list of valid leagues
+        if league not in validLeagues:
+            raise FbrefInvalidLeagueException(league, "FBref", validLeagues)
+
+        # Look the season up in the league history, parsed once per league
+        history = cls._history(league)
+        scorer = (
+            history.top_scorer(currentSeason, cls.baseurl)
+            if currentSeason in history
+            else None
+        )
 
-        # Check if the season data exists in the fetched response
-        if key not in response:
+        # Check if the season has a top scorer
+        if scorer is None:
             raise FbrefInvalidSeasonsException(
-                currentSeason, "Fbref", league, response.keys()
+                currentSeason,
+                "Fbref",
+                league,
+                history.top_scorer_records(cls.baseurl).keys(),
             )
 
         # Extract the statistics link for the top scorer
-        stats_link = response[key]["stats_link"]
+        stats_link = scorer["stats_link"]
 
         # Fetch and parse the top scorer's detailed statistics page
         r = cls._get(stats_link)
-        soup = BeautifulSoup(r.content, "html.parser")
+        soup = cls._soup(
+            r.content, only=SoupStrainer("table", attrs={"id": "scout_summary_FW"})
+        )
 
         # Locate the table containing detailed statistics for forwards (FW)
         table = soup.find("table", {"id": "scout_summary_FW"})
@@ -459,13 +1030,43 @@ class Fbref:
 
         # Return a structured dictionary containing the top scorer's details and statistics
         return {
-            "top_scorer": response[key]["top_scorer"],
-            "goals": response[key]["goals"],
+            "top_scorer": scorer["top_scorer"],
+            "goals": scorer["goals"],
             "stats_link": stats_link,
-            "club": response[key]["club"],
+            "club": scorer["club"],
             "detailed_stats": stats,
         }
 
+    # ====================================== schedule ==========================================#
+
+    @classmethod
+    @cache_data
+    def _schedule(cls, year: str, league: str) -> ScheduleTable:
+        """
+        Fetches and parses the Scores and Fixtures page of a league season once.
+
+        The fixture endpoints are views over the returned `ScheduleTable`, which is
+        cached like an endpoint result.
+
+        Args:
+            year (str): The season, e.g. "2023-2024".
+            league (str): The league, e.g. "Serie A".
+        """
+        urls = cls.get_valid_seasons(league)
+        season_link = urls.seasonUrls[year]
+        fixtures_url = cls.baseurl + "/".join(
+            season_link.split("/")[:-1]
+            + [
+                "schedule",
+                "-".join(season_link.split("/")[-1].split("-")[:-1])
+                + "-Scores-and-Fixtures",
+            ]
+        )
+
+        r = cls._get(fixtures_url)
+        soup = cls._soup(r.content, only=SoupStrainer("table"))
+        return ScheduleTable.parse(soup.find("table"), league, year, cls.baseurl)
+
     # ====================================== Fixtures ==========================================#
 
     @classmethod
@@ -518,151 +1119,10 @@ class Fbref:
         if int(year.split("-")[-1]) > int(cuurentYear):
             raise FbrefInvalidYearException(year, "FBref", cuurentYear)
 
-        # Retrieve the valid seasons and construct the fixtures URL
-        urls = cls.get_valid_seasons(league)
-        season_link = urls.seasonUrls[year]
-
-        fixtures_url = cls.baseurl + "/".join(
-            season_link.split("/")[:-1]
-            + [
-                "schedule",
-                "-".join(season_link.split("/")[-1].split("-")[:-1])
-                + "-Scores-and-Fixtures",
-            ]
-        )
-
-        # Fetch the fixtures page
-        r = cls._get(fixtures_url)
-        soup = BeautifulSoup(r.content, "html.parser")
-
-        # Locate the table containing the fixtures
-        table = soup.find("table")
-
-        # Extract data from each row of matches using list comprehension
-        fixtures = {
-            league
-            + "-Scores-and-Fixture": [
-                {
-                    "match link": (
-                        cls.baseurl
-                        + row.find("td", {"data-stat": "date"}).find("a")["href"]
-                        if row.find("td", {"data-stat": "date"})
-                        and row.find("td", {"data-stat": "date"}).find("a")
-                        else np.nan
-                    ),
-                    "match-date": (
-                        row.find("td", {"data-stat": "date"}).text.strip()
-                        if row.find("td", {"data-stat": "date"})
-                        else np.nan
-                    ),
-                    "data-venue-time": (
-                        row.find("td", {"data-stat": "start_time"}).find(
-                            "span", {"data-venue-time": True}
-                        )["data-venue-time"]
-                        if row.find("td", {"data-stat": "start_time"})
-                        and row.find("td", {"data-stat": "start_time"}).find(
-                            "span", {"data-venue-time": True}
-                        )
-                        else np.nan
-                    ),
-                    "referee": (
-                        row.find("td", {"data-stat": "referee"}).text.strip()
-                        if row.find("td", {"data-stat": "referee"})
-                        else np.nan
-                    ),
-                    "stats": {
-                        "home": {
-                            "xg": (
-                                row.find("td", {"data-stat": "home_xg"}).text.strip()
-                                if row.find("td", {"data-stat": "home_xg"})
-                                else np.nan
-                            ),
-                            "link team stats": (
-                                cls.baseurl
-                                + row.find("td", {"data-stat": "home_team"}).find("a")[
-                                    "href"
-                                ]
-                                if row.find("td", {"data-stat": "home_team"})
-                                and row.find("td", {"data-stat": "home_team"}).find("a")
-                                else np.nan
-                            ),
-                        },
-                        "away": {
-                            "xg": (
-                                row.find("td", {"data-stat": "away_xg"}).text.strip()
-                                if row.find("td", {"data-stat": "away_xg"})
-                                else np.nan
-                            ),
-                            "link team stats": (
-                                cls.baseurl
-                                + row.find("td", {"data-stat": "away_team"}).find("a")[
-                                    "href"
-                                ]
-                                if row.find("td", {"data-stat": "away_team"})
-                                and row.find("td", {"data-stat": "away_team"}).find("a")
-                                else np.nan
-                            ),
-                        },
-                    },
-                    "Attendance": (
-                        row.find("td", {"data-stat": "attendance"}).text.strip()
-                        if row.find("td", {"data-stat": "attendance"})
-                        else np.nan
-                    ),
-                    "score": {
-                        "home": (
-                            row.find("td", {"data-stat": "score"})
-                            .find("a")
-                            .text.strip()
-                            .split("–")[0]
-                            .strip()
-                            if row.find("td", {"data-stat": "score"})
-                            and row.find("td", {"data-stat": "score"}).find("a")
-                            else np.nan
-                        ),
-                        "away": (
-                            row.find("td", {"data-stat": "score"})
-                            .find("a")
-                            .text.strip()
-                            .split("–")[1]
-                            .strip()
-                            if row.find("td", {"data-stat": "score"})
-                            and row.find("td", {"data-stat": "score"}).find("a")
-                            else np.nan
-                        ),
-                    },
-                    "venue": (
-                        row.find("td", {"data-stat": "venue"}).text.strip()
-                        if row.find("td", {"data-stat": "venue"})
-                        else np.nan
-                    ),
-                    "teams": {
-                        "home": (
-                            row.find("td", {"data-stat": "home_team"})
-                            .find("a")
-                            .text.strip()
-                            if row.find("td", {"data-stat": "home_team"})
-                            and row.find("td", {"data-stat": "home_team"}).find("a")
-                            else np.nan
-                        ),
-                        "away": (
-                            row.find("td", {"data-stat": "away_team"})
-                            .find("a")
-                            .text.strip()
-                            if row.find("td", {"data-stat": "away_team"})
-                            and row.find("td", {"data-stat": "away_team"}).find("a")
-                            else np.nan
-                        ),
-                    },
-                }
-                for row in table.find_all("tr")
-                if row.find("td", {"data-stat": "match_report"})
-                and any(
-                    term in row.find("td", {"data-stat": "match_report"}).text
-                    for term in ["Head-to-Head", "Match Report"]
-                )
-            ]
-        }
+        # Select the matches from the season schedule, parsed once per season
+        schedule = cls._schedule(year, league)
+        matches = schedule.matches(attendance_first=True)
+        fixtures = {league + "-Scores-and-Fixture": matches}
 
         return fixtures
 
@@ -709,145 +1169,10 @@ class Fbref:
         if league not in validLeagues:
             raise FbrefInvalidLeagueException(league, "FBref", validLeagues)
 
-        # Construct the season link and fixtures URL
-        urls = cls.get_valid_seasons(league)
-        season_link = urls.seasonUrls[year]
-        fixtures_url = cls.baseurl + "/".join(
-            season_link.split("/")[:-1]
-            + [
-                "schedule",
-                "-".join(season_link.split("/")[-1].split("-")[:-1])
-                + "-Scores-and-Fixtures",
-            ]
-        )
-
-        # Retrieve and parse the page
-        r = cls._get(fixtures_url)
-        soup = BeautifulSoup(r.content, "html.parser")
-        table = soup.find("table")
-
-        # Extract data from each row of matches
-        fixtures = {
-            league
-            + "-Scores-and-Fixture": [
-                {
-                    "match link": (
-                        cls.baseurl
-                        + row.find("td", {"data-stat": "date"}).find("a")["href"]
-                        if row.find("td", {"data-stat": "date"})
-                        and row.find("td", {"data-stat": "date"}).find("a")
-                        else np.nan
-                    ),
-                    "match-date": (
-                        row.find("td", {"data-stat": "date"}).text.strip()
-                        if row.find("td", {"data-stat": "date"})
-                        else np.nan
-                    ),
-                    "data-venue-time": (
-                        row.find("td", {"data-stat": "start_time"}).find(
-                            "span", {"data-venue-time": True}
-                        )["data-venue-time"]
-                        if row.find("td", {"data-stat": "start_time"})
-                        and row.find("td", {"data-stat": "start_time"}).find(
-                            "span", {"data-venue-time": True}
-                        )
-                        else np.nan
-                    ),
-                    "referee": (
-                        row.find("td", {"data-stat": "referee"}).text.strip()
-                        if row.find("td", {"data-stat": "referee"})
-                        else np.nan
-                    ),
-                    "stats": {
-                        "home": {
-                            "xg": (
-                                row.find("td", {"data-stat": "home_xg"}).text.strip()
-                                if row.find("td", {"data-stat": "home_xg"})
-                                else np.nan
-                            ),
-                            "link team stats": (
-                                cls.baseurl
-                                + row.find("td", {"data-stat": "home_team"}).find("a")[
-                                    "href"
-                                ]
-                                if row.find("td", {"data-stat": "home_team"})
-                                and row.find("td", {"data-stat": "home_team"}).find("a")
-                                else np.nan
-                            ),
-                        },
-                        "away": {
-                            "xg": (
-                                row.find("td", {"data-stat": "away_xg"}).text.strip()
-                                if row.find("td", {"data-stat": "away_xg"})
-                                else np.nan
-                            ),
-                            "link team stats": (
-                                cls.baseurl
-                                + row.find("td", {"data-stat": "away_team"}).find("a")[
-                                    "href"
-                                ]
-                                if row.find("td", {"data-stat": "away_team"})
-                                and row.find("td", {"data-stat": "away_team"}).find("a")
-                                else np.nan
-                            ),
-                        },
-                    },
-                    "Attendance": (
-                        row.find("td", {"data-stat": "attendance"}).text.strip()
-                        if row.find("td", {"data-stat": "attendance"})
-                        else np.nan
-                    ),
-                    "score": {
-                        "home": (
-                            row.find("td", {"data-stat": "score"})
-                            .find("a")
-                            .text.strip()
-                            .split("–")[0]
-                            .strip()
-                            if row.find("td", {"data-stat": "score"})
-                            and row.find("td", {"data-stat": "score"}).find("a")
-                            else np.nan
-                        ),
-                        "away": (
-                            row.find("td", {"data-stat": "score"})
-                            .find("a")
-                            .text.strip()
-                            .split("–")[1]
-                            .strip()
-                            if row.find("td", {"data-stat": "score"})
-                            and row.find("td", {"data-stat": "score"}).find("a")
-                            else np.nan
-                        ),
-                    },
-                    "venue": (
-                        row.find("td", {"data-stat": "venue"}).text.strip()
-                        if row.find("td", {"data-stat": "venue"})
-                        else np.nan
-                    ),
-                    "teams": {
-                        "home": (
-                            row.find("td", {"data-stat": "home_team"})
-                            .find("a")
-                            .text.strip()
-                            if row.find("td", {"data-stat": "home_team"})
-                            and row.find("td", {"data-stat": "home_team"}).find("a")
-                            else np.nan
-                        ),
-                        "away": (
-                            row.find("td", {"data-stat": "away_team"})
-                            .find("a")
-                            .text.strip()
-                            if row.find("td", {"data-stat": "away_team"})
-                            and row.find("td", {"data-stat": "away_team"}).find("a")
-                            else np.nan
-                        ),
-                    },
-                }
-                for row in table.find_all("tr")
-                if row.find("td", {"data-stat": "match_report"})
-                and "Match Report" in row.find("td", {"data-stat": "match_report"}).text
-            ]
-        }
+        # Select the matches from the season schedule, parsed once per season
+        schedule = cls._schedule(year, league)
+        matches = schedule.matches((MATCH_REPORT,), attendance_first=True)
+        fixtures = {league + "-Scores-and-Fixture": matches}
 
         return fixtures
 
@@ -892,135 +1217,10 @@ class Fbref:
         if league not in validLeagues:
             raise FbrefInvalidLeagueException(league, "FBref", validLeagues)
 
-        # Construct the season link and fixtures URL
-        urls = cls.get_valid_seasons(league)
-        season_link = urls.seasonUrls[year]
-        fixtures_url = cls.baseurl + "/".join(
-            season_link.split("/")[:-1]
-            + [
-                "schedule",
-                "-".join(season_link.split("/")[-1].split("-")[:-1])
-                + "-Scores-and-Fixtures",
-            ]
-        )
-
-        # Retrieve and parse the page
-        r = cls._get(fixtures_url)
-        soup = BeautifulSoup(r.content, "html.parser")
-        table = soup.find("table")
-
-        # Extract data from each row of matches
-        fixtures = {
-            league
-            + "-Scores-and-Fixture": [
-                {
-                    "match link": (
-                        cls.baseurl
-                        + row.find("td", {"data-stat": "date"}).find("a")["href"]
-                        if row.find("td", {"data-stat": "date"})
-                        and row.find("td", {"data-stat": "date"}).find("a")
-                        else np.nan
-                    ),
-                    "match-date": (
-                        row.find("td", {"data-stat": "date"}).text.strip()
-                        if row.find("td", {"data-stat": "date"})
-                        else np.nan
-                    ),
-                    "data-venue-time": (
-                        row.find("td", {"data-stat": "start_time"}).find(
-                            "span", {"data-venue-time": True}
-                        )["data-venue-time"]
-                        if row.find("td", {"data-stat": "start_time"})
-                        and row.find("td", {"data-stat": "start_time"}).find(
-                            "span", {"data-venue-time": True}
-                        )
-                        else np.nan
-                    ),
-                    "referee": (
-                        row.find("td", {"data-stat": "referee"}).text.strip()
-                        if row.find("td", {"data-stat": "referee"})
-                        else np.nan
-                    ),
-                    "stats": {
-                        "home": {
-                            "link team stats": (
-                                cls.baseurl
-                                + row.find("td", {"data-stat": "home_team"}).find("a")[
-                                    "href"
-                                ]
-                                if row.find("td", {"data-stat": "home_team"})
-                                and row.find("td", {"data-stat": "home_team"}).find("a")
-                                else np.nan
-                            )
-                        },
-                        "away": {
-                            "link team stats": (
-                                cls.baseurl
-                                + row.find("td", {"data-stat": "away_team"}).find("a")[
-                                    "href"
-                                ]
-                                if row.find("td", {"data-stat": "away_team"})
-                                and row.find("td", {"data-stat": "away_team"}).find("a")
-                                else np.nan
-                            )
-                        },
-                    },
-                    "score": {
-                        "home": (
-                            row.find("td", {"data-stat": "score"})
-                            .find("a")
-                            .text.strip()
-                            .split("–")[0]
-                            .strip()
-                            if row.find("td", {"data-stat": "score"})
-                            and row.find("td", {"data-stat": "score"}).find("a")
-                            else np.nan
-                        ),
-                        "away": (
-                            row.find("td", {"data-stat": "score"})
-                            .find("a")
-                            .text.strip()
-                            .split("–")[1]
-                            .strip()
-                            if row.find("td", {"data-stat": "score"})
-                            and row.find("td", {"data-stat": "score"}).find("a")
-                            else np.nan
-                        ),
-                    },
-                    "Attendance": (
-                        row.find("td", {"data-stat": "attendance"}).text.strip()
-                        if row.find("td", {"data-stat": "attendance"})
-                        else np.nan
-                    ),
-                    "venue": (
-                        row.find("td", {"data-stat": "venue"}).text.strip()
-                        if row.find("td", {"data-stat": "venue"})
-                        else np.nan
-                    ),
-                    "teams": {
-                        "home": (
-                            row.find("td", {"data-stat": "home_team"})
-                            .find("a")
-                            .text.strip()
-                            if row.find("td", {"data-stat": "home_team"})
-                            and row.find("td", {"data-stat": "home_team"}).find("a")
-                            else np.nan
-                        ),
-                        "away": (
-                            row.find("td", {"data-stat": "away_team"})
-                            .find("a")
-                            .text.strip()
-                            if row.find("td", {"data-stat": "away_team"})
-                            and row.find("td", {"data-stat": "away_team"}).find("a")
-                            else np.nan
-                        ),
-                    },
-                }
-                for row in table.find_all("tr")
-                if row.find("td", {"data-stat": "match_report"})
-                and "Head-to-Head" in row.find("td", {"data-stat": "match_report"}).text
-            ]
-        }
+        # Select the matches from the season schedule, parsed once per season
+        schedule = cls._schedule(year, league)
+        matches = schedule.matches((HEAD_TO_HEAD,), xg=False)
+        fixtures = {league + "-Scores-and-Fixture": matches}
 
         return fixtures
 
@@ -1067,150 +1267,10 @@ class Fbref:
         if league not in validLeagues:
             raise FbrefInvalidLeagueException(league, "FBref", validLeagues)
 
-        # Construct the season link and fixtures URL
-        urls = cls.get_valid_seasons(league)
-        season_link = urls.seasonUrls[year]
-        fixtures_url = cls.baseurl + "/".join(
-            season_link.split("/")[:-1]
-            + [
-                "schedule",
-                "-".join(season_link.split("/")[-1].split("-")[:-1])
-                + "-Scores-and-Fixtures",
-            ]
-        )
-
-        # Retrieve and parse the page
-        r = cls._get(fixtures_url)
-        soup = BeautifulSoup(r.content, "html.parser")
-        table = soup.find("table")
-
-        # Extract data from each row of matches
-        fixtures = {
-            league
-            + "-Scores-and-Fixture": [
-                {
-                    "match link": (
-                        cls.baseurl
-                        + row.find("td", {"data-stat": "date"}).find("a")["href"]
-                        if row.find("td", {"data-stat": "date"})
-                        and row.find("td", {"data-stat": "date"}).find("a")
-                        else np.nan
-                    ),
-                    "match-date": (
-                        row.find("td", {"data-stat": "date"}).text.strip()
-                        if row.find("td", {"data-stat": "date"})
-                        else np.nan
-                    ),
-                    "data-venue-time": (
-                        row.find("td", {"data-stat": "start_time"}).find(
-                            "span", {"data-venue-time": True}
-                        )["data-venue-time"]
-                        if row.find("td", {"data-stat": "start_time"})
-                        and row.find("td", {"data-stat": "start_time"}).find(
-                            "span", {"data-venue-time": True}
-                        )
-                        else np.nan
-                    ),
-                    "referee": (
-                        row.find("td", {"data-stat": "referee"}).text.strip()
-                        if row.find("td", {"data-stat": "referee"})
-                        else np.nan
-                    ),
-                    "stats": {
-                        "home": {
-                            "xg": (
-                                row.find("td", {"data-stat": "home_xg"}).text.strip()
-                                if row.find("td", {"data-stat": "home_xg"})
-                                else np.nan
-                            ),
-                            "link team stats": (
-                                cls.baseurl
-                                + row.find("td", {"data-stat": "home_team"}).find("a")[
-                                    "href"
-                                ]
-                                if row.find("td", {"data-stat": "home_team"})
-                                and row.find("td", {"data-stat": "home_team"}).find("a")
-                                else np.nan
-                            ),
-                        },
-                        "away": {
-                            "xg": (
-                                row.find("td", {"data-stat": "away_xg"}).text.strip()
-                                if row.find("td", {"data-stat": "away_xg"})
-                                else np.nan
-                            ),
-                            "link team stats": (
-                                cls.baseurl
-                                + row.find("td", {"data-stat": "away_team"}).find("a")[
-                                    "href"
-                                ]
-                                if row.find("td", {"data-stat": "away_team"})
-                                and row.find("td", {"data-stat": "away_team"}).find("a")
-                                else np.nan
-                            ),
-                        },
-                    },
-                    "score": {
-                        "home": (
-                            row.find("td", {"data-stat": "score"})
-                            .find("a")
-                            .text.strip()
-                            .split("–")[0]
-                            .strip()
-                            if row.find("td", {"data-stat": "score"})
-                            and row.find("td", {"data-stat": "score"}).find("a")
-                            else np.nan
-                        ),
-                        "away": (
-                            row.find("td", {"data-stat": "score"})
-                            .find("a")
-                            .text.strip()
-                            .split("–")[1]
-                            .strip()
-                            if row.find("td", {"data-stat": "score"})
-                            and row.find("td", {"data-stat": "score"}).find("a")
-                            else np.nan
-                        ),
-                    },
-                    "Attendance": (
-                        row.find("td", {"data-stat": "attendance"}).text.strip()
-                        if row.find("td", {"data-stat": "attendance"})
-                        else np.nan
-                    ),
-                    "venue": (
-                        row.find("td", {"data-stat": "venue"}).text.strip()
-                        if row.find("td", {"data-stat": "venue"})
-                        else np.nan
-                    ),
-                    "teams": {
-                        "home": (
-                            row.find("td", {"data-stat": "home_team"})
-                            .find("a")
-                            .text.strip()
-                            if row.find("td", {"data-stat": "home_team"})
-                            and row.find("td", {"data-stat": "home_team"}).find("a")
-                            else np.nan
-                        ),
-                        "away": (
-                            row.find("td", {"data-stat": "away_team"})
-                            .find("a")
-                            .text.strip()
-                            if row.find("td", {"data-stat": "away_team"})
-                            and row.find("td", {"data-stat": "away_team"}).find("a")
-                            else np.nan
-                        ),
-                    },
-                }
-                for row in table.find_all("tr")
-                if row.find("td", {"data-stat": "match_report"})
-                and any(
-                    term in row.find("td", {"data-stat": "match_report"}).text
-                    for term in ["Head-to-Head", "Match Report"]
-                )
-                and row.find("td", {"data-stat": "date"})
-                and row.find("td", {"data-stat": "date"}).text.strip() == date
-            ]
-        }
+        # Select the matches from the season schedule, parsed once per season
+        schedule = cls._schedule(year, league)
+        matches = schedule.matches(date=date)
+        fixtures = {league + "-Scores-and-Fixture": matches}
 
         return fixtures
 
@@ -1259,187 +1319,12 @@ class Fbref:
         if league not in validLeagues:
             raise FbrefInvalidLeagueException(league, "FBref", validLeagues)
 
-        # Construct the season link and fixtures URL
-        urls = cls.get_valid_seasons(league)
-        season_link = urls.seasonUrls[year]
-        fixtures_url = cls.baseurl + "/".join(
-            season_link.split("/")[:-1]
-            + [
-                "schedule",
-                "-".join(season_link.split("/")[-1].split("-")[:-1])
-                + "-Scores-and-Fixtures",
-            ]
+        # Select the matches from the season schedule, parsed once per season
+        schedule = cls._schedule(year, league)
+        matches = schedule.matches(
+            team=team, team_stats=lambda name: cls.TeamInfos(name, league)
         )
-
-        # Fetch and parse the fixtures page
-        r = cls._get(fixtures_url)
-        soup = BeautifulSoup(r.content, "html.parser")
-        table = soup.find("table")
-
-        # Extract data from each row of matches
-        fixtures = {
-            league
-            + "-Scores-and-Fixture": [
-                {
-                    "match link": (
-                        cls.baseurl
-                        + row.find("td", {"data-stat": "date"}).find("a")["href"]
-                        if row.find("td", {"data-stat": "date"})
-                        and row.find("td", {"data-stat": "date"}).find("a")
-                        else np.nan
-                    ),
-                    "match-date": (
-                        row.find("td", {"data-stat": "date"}).text.strip()
-                        if row.find("td", {"data-stat": "date"})
-                        else np.nan
-                    ),
-                    "data-venue-time": (
-                        row.find("td", {"data-stat": "start_time"}).find(
-                            "span", {"data-venue-time": True}
-                        )["data-venue-time"]
-                        if row.find("td", {"data-stat": "start_time"})
-                        and row.find("td", {"data-stat": "start_time"}).find(
-                            "span", {"data-venue-time": True}
-                        )
-                        else np.nan
-                    ),
-                    "referee": (
-                        row.find("td", {"data-stat": "referee"}).text.strip()
-                        if row.find("td", {"data-stat": "referee"})
-                        else np.nan
-                    ),
-                    "stats": {
-                        "home": {
-                            "xg": (
-                                row.find("td", {"data-stat": "home_xg"}).text.strip()
-                                if row.find("td", {"data-stat": "home_xg"})
-                                else np.nan
-                            ),
-                            "link team stats": (
-                                cls.baseurl
-                                + row.find("td", {"data-stat": "home_team"}).find("a")[
-                                    "href"
-                                ]
-                                if row.find("td", {"data-stat": "home_team"})
-                                and row.find("td", {"data-stat": "home_team"}).find("a")
-                                else np.nan
-                            ),
-                            "team stats": (
-                                cls.TeamInfos(
-                                    row.find("td", {"data-stat": "home_team"})
-                                    .find("a")
-                                    .text.strip(),
-                                    league,
-                                )
-                                if row.find("td", {"data-stat": "home_team"})
-                                and row.find("td", {"data-stat": "home_team"}).find("a")
-                                else np.nan
-                            ),
-                        },
-                        "away": {
-                            "xg": (
-                                row.find("td", {"data-stat": "away_xg"}).text.strip()
-                                if row.find("td", {"data-stat": "away_xg"})
-                                else np.nan
-                            ),
-                            "link team stats": (
-                                cls.baseurl
-                                + row.find("td", {"data-stat": "away_team"}).find("a")[
-                                    "href"
-                                ]
-                                if row.find("td", {"data-stat": "away_team"})
-                                and row.find("td", {"data-stat": "away_team"}).find("a")
-                                else np.nan
-                            ),
-                            "team stats": (
-                                cls.TeamInfos(
-                                    row.find("td", {"data-stat": "away_team"})
-                                    .find("a")
-                                    .text.strip(),
-                                    league,
-                                )
-                                if row.find("td", {"data-stat": "away_team"})
-                                and row.find("td", {"data-stat": "away_team"}).find("a")
-                                else np.nan
-                            ),
-                        },
-                    },
-                    "score": {
-                        "home": (
-                            row.find("td", {"data-stat": "score"})
-                            .find("a")
-                            .text.strip()
-                            .split("–")[0]
-                            .strip()
-                            if row.find("td", {"data-stat": "score"})
-                            and row.find("td", {"data-stat": "score"}).find("a")
-                            else np.nan
-                        ),
-                        "away": (
-                            row.find("td", {"data-stat": "score"})
-                            .find("a")
-                            .text.strip()
-                            .split("–")[1]
-                            .strip()
-                            if row.find("td", {"data-stat": "score"})
-                            and row.find("td", {"data-stat": "score"}).find("a")
-                            else np.nan
-                        ),
-                    },
-                    "Attendance": (
-                        row.find("td", {"data-stat": "attendance"}).text.strip()
-                        if row.find("td", {"data-stat": "attendance"})
-                        else np.nan
-                    ),
-                    "venue": (
-                        row.find("td", {"data-stat": "venue"}).text.strip()
-                        if row.find("td", {"data-stat": "venue"})
-                        else np.nan
-                    ),
-                    "teams": {
-                        "home": (
-                            row.find("td", {"data-stat": "home_team"})
-                            .find("a")
-                            .text.strip()
-                            if row.find("td", {"data-stat": "home_team"})
-                            and row.find("td", {"data-stat": "home_team"}).find("a")
-                            else np.nan
-                        ),
-                        "away": (
-                            row.find("td", {"data-stat": "away_team"})
-                            .find("a")
-                            .text.strip()
-                            if row.find("td", {"data-stat": "away_team"})
-                            and row.find("td", {"data-stat": "away_team"}).find("a")
-                            else np.nan
-                        ),
-                    },
-                }
-                for row in table.find_all("tr")
-                if row.find("td", {"data-stat": "match_report"})
-                and any(
-                    term in row.find("td", {"data-stat": "match_report"}).text
-                    for term in ["Head-to-Head", "Match Report"]
-                )
-                # Filter matches where the team is either the home or away team
-                if (
-                    (
-                        row.find("td", {"data-stat": "home_team"})
-                        and row.find("td", {"data-stat": "home_team"})
-                        .find("a")
-                        .text.strip()
-                        == team
-                    )
-                    or (
-                        row.find("td", {"data-stat": "away_team"})
-                        and row.find("td", {"data-stat": "away_team"})
-                        .find("a")
-                        .text.strip()
-                        == team
-                    )
-                )
-            ]
-        }
+        fixtures = {league + "-Scores-and-Fixture": matches}
 
         return fixtures
 
@@ -1493,184 +1378,14 @@ class Fbref:
         if int(year.split("-")[-1]) > int(cuurentYear):
             raise FbrefInvalidYearException(year, "FBref", cuurentYear)
 
-        # Construct the season link and fixtures URL
-        urls = cls.get_valid_seasons(league)
-        season_link = urls.seasonUrls[year]
-        fixtures_url = cls.baseurl + "/".join(
-            season_link.split("/")[:-1]
-            + [
-                "schedule",
-                "-".join(season_link.split("/")[-1].split("-")[:-1])
-                + "-Scores-and-Fixtures",
-            ]
+        # Select the matches from the season schedule, parsed once per season
+        schedule = cls._schedule(year, league)
+        matches = schedule.matches(
+            (MATCH_REPORT,),
+            team=team,
+            team_stats=lambda name: cls.TeamInfos(name, league),
         )
-
-        # Fetch and parse the fixtures page
-        r = cls._get(fixtures_url)
-        soup = BeautifulSoup(r.content, "html.parser")
-        table = soup.find("table")
-
-        # Extract data from each row of matches
-        fixtures = {
-            league
-            + "-Scores-and-Fixture": [
-                {
-                    "match link": (
-                        cls.baseurl
-                        + row.find("td", {"data-stat": "date"}).find("a")["href"]
-                        if row.find("td", {"data-stat": "date"})
-                        and row.find("td", {"data-stat": "date"}).find("a")
-                        else np.nan
-                    ),
-                    "match-date": (
-                        row.find("td", {"data-stat": "date"}).text.strip()
-                        if row.find("td", {"data-stat": "date"})
-                        else np.nan
-                    ),
-                    "data-venue-time": (
-                        row.find("td", {"data-stat": "start_time"}).find(
-                            "span", {"data-venue-time": True}
-                        )["data-venue-time"]
-                        if row.find("td", {"data-stat": "start_time"})
-                        and row.find("td", {"data-stat": "start_time"}).find(
-                            "span", {"data-venue-time": True}
-                        )
-                        else np.nan
-                    ),
-                    "referee": (
-                        row.find("td", {"data-stat": "referee"}).text.strip()
-                        if row.find("td", {"data-stat": "referee"})
-                        else np.nan
-                    ),
-                    "stats": {
-                        "home": {
-                            "xg": (
-                                row.find("td", {"data-stat": "home_xg"}).text.strip()
-                                if row.find("td", {"data-stat": "home_xg"})
-                                else np.nan
-                            ),
-                            "link team stats": (
-                                cls.baseurl
-                                + row.find("td", {"data-stat": "home_team"}).find("a")[
-                                    "href"
-                                ]
-                                if row.find("td", {"data-stat": "home_team"})
-                                and row.find("td", {"data-stat": "home_team"}).find("a")
-                                else np.nan
-                            ),
-                            "team stats": (
-                                cls.TeamInfos(
-                                    row.find("td", {"data-stat": "home_team"})
-                                    .find("a")
-                                    .text.strip(),
-                                    league,
-                                )
-                                if row.find("td", {"data-stat": "home_team"})
-                                and row.find("td", {"data-stat": "home_team"}).find("a")
-                                else np.nan
-                            ),
-                        },
-                        "away": {
-                            "xg": (
-                                row.find("td", {"data-stat": "away_xg"}).text.strip()
-                                if row.find("td", {"data-stat": "away_xg"})
-                                else np.nan
-                            ),
-                            "link team stats": (
-                                cls.baseurl
-                                + row.find("td", {"data-stat": "away_team"}).find("a")[
-                                    "href"
-                                ]
-                                if row.find("td", {"data-stat": "away_team"})
-                                and row.find("td", {"data-stat": "away_team"}).find("a")
-                                else np.nan
-                            ),
-                            "team stats": (
-                                cls.TeamInfos(
-                                    row.find("td", {"data-stat": "away_team"})
-                                    .find("a")
-                                    .text.strip(),
-                                    league,
-                                )
-                                if row.find("td", {"data-stat": "away_team"})
-                                and row.find("td", {"data-stat": "away_team"}).find("a")
-                                else np.nan
-                            ),
-                        },
-                    },
-                    "score": {
-                        "home": (
-                            row.find("td", {"data-stat": "score"})
-                            .find("a")
-                            .text.strip()
-                            .split("–")[0]
-                            .strip()
-                            if row.find("td", {"data-stat": "score"})
-                            and row.find("td", {"data-stat": "score"}).find("a")
-                            else np.nan
-                        ),
-                        "away": (
-                            row.find("td", {"data-stat": "score"})
-                            .find("a")
-                            .text.strip()
-                            .split("–")[1]
-                            .strip()
-                            if row.find("td", {"data-stat": "score"})
-                            and row.find("td", {"data-stat": "score"}).find("a")
-                            else np.nan
-                        ),
-                    },
-                    "Attendance": (
-                        row.find("td", {"data-stat": "attendance"}).text.strip()
-                        if row.find("td", {"data-stat": "attendance"})
-                        else np.nan
-                    ),
-                    "venue": (
-                        row.find("td", {"data-stat": "venue"}).text.strip()
-                        if row.find("td", {"data-stat": "venue"})
-                        else np.nan
-                    ),
-                    "teams": {
-                        "home": (
-                            row.find("td", {"data-stat": "home_team"})
-                            .find("a")
-                            .text.strip()
-                            if row.find("td", {"data-stat": "home_team"})
-                            and row.find("td", {"data-stat": "home_team"}).find("a")
-                            else np.nan
-                        ),
-                        "away": (
-                            row.find("td", {"data-stat": "away_team"})
-                            .find("a")
-                            .text.strip()
-                            if row.find("td", {"data-stat": "away_team"})
-                            and row.find("td", {"data-stat": "away_team"}).find("a")
-                            else np.nan
-                        ),
-                    },
-                }
-                for row in table.find_all("tr")
-                if row.find("td", {"data-stat": "match_report"})
-                and "Match Report" in row.find("td", {"data-stat": "match_report"}).text
-                # Filter matches where the target team is either the home or away team
-                if (
-                    (
-                        row.find("td", {"data-stat": "home_team"})
-                        and row.find("td", {"data-stat": "home_team"})
-                        .find("a")
-                        .text.strip()
-                        == team
-                    )
-                    or (
-                        row.find("td", {"data-stat": "away_team"})
-                        and row.find("td", {"data-stat": "away_team"})
-                        .find("a")
-                        .text.strip()
-                        == team
-                    )
-                )
-            ]
-        }
+        fixtures = {league + "-Scores-and-Fixture": matches}
 
         return fixtures
 
@@ -1724,184 +1439,14 @@ class Fbref:
         if int(year.split("-")[-1]) > int(cuurentYear):
             raise FbrefInvalidYearException(year, "FBref", cuurentYear)
 
-        # Construct the season link and fixtures URL
-        urls = cls.get_valid_seasons(league)
-        season_link = urls.seasonUrls[year]
-        fixtures_url = cls.baseurl + "/".join(
-            season_link.split("/")[:-1]
-            + [
-                "schedule",
-                "-".join(season_link.split("/")[-1].split("-")[:-1])
-                + "-Scores-and-Fixtures",
-            ]
+        # Select the matches from the season schedule, parsed once per season
+        schedule = cls._schedule(year, league)
+        matches = schedule.matches(
+            (HEAD_TO_HEAD,),
+            team=team,
+            team_stats=lambda name: cls.TeamInfos(name, league),
         )
-
-        # Fetch and parse the fixtures page
-        r = cls._get(fixtures_url)
-        soup = BeautifulSoup(r.content, "html.parser")
-        table = soup.find("table")
-
-        # Extract data from each row of matches
-        fixtures = {
-            league
-            + "-Scores-and-Fixture": [
-                {
-                    "match link": (
-                        cls.baseurl
-                        + row.find("td", {"data-stat": "date"}).find("a")["href"]
-                        if row.find("td", {"data-stat": "date"})
-                        and row.find("td", {"data-stat": "date"}).find("a")
-                        else np.nan
-                    ),
-                    "match-date": (
-                        row.find("td", {"data-stat": "date"}).text.strip()
-                        if row.find("td", {"data-stat": "date"})
-                        else np.nan
-                    ),
-                    "data-venue-time": (
-                        row.find("td", {"data-stat": "start_time"}).find(
-                            "span", {"data-venue-time": True}
-                        )["data-venue-time"]
-                        if row.find("td", {"data-stat": "start_time"})
-                        and row.find("td", {"data-stat": "start_time"}).find(
-                            "span", {"data-venue-time": True}
-                        )
-                        else np.nan
-                    ),
-                    "referee": (
-                        row.find("td", {"data-stat": "referee"}).text.strip()
-                        if row.find("td", {"data-stat": "referee"})
-                        else np.nan
-                    ),
-                    "stats": {
-                        "home": {
-                            "xg": (
-                                row.find("td", {"data-stat": "home_xg"}).text.strip()
-                                if row.find("td", {"data-stat": "home_xg"})
-                                else np.nan
-                            ),
-                            "link team stats": (
-                                cls.baseurl
-                                + row.find("td", {"data-stat": "home_team"}).find("a")[
-                                    "href"
-                                ]
-                                if row.find("td", {"data-stat": "home_team"})
-                                and row.find("td", {"data-stat": "home_team"}).find("a")
-                                else np.nan
-                            ),
-                            "team stats": (
-                                cls.TeamInfos(
-                                    row.find("td", {"data-stat": "home_team"})
-                                    .find("a")
-                                    .text.strip(),
-                                    league,
-                                )
-                                if row.find("td", {"data-stat": "home_team"})
-                                and row.find("td", {"data-stat": "home_team"}).find("a")
-                                else np.nan
-                            ),
-                        },
-                        "away": {
-                            "xg": (
-                                row.find("td", {"data-stat": "away_xg"}).text.strip()
-                                if row.find("td", {"data-stat": "away_xg"})
-                                else np.nan
-                            ),
-                            "link team stats": (
-                                cls.baseurl
-                                + row.find("td", {"data-stat": "away_team"}).find("a")[
-                                    "href"
-                                ]
-                                if row.find("td", {"data-stat": "away_team"})
-                                and row.find("td", {"data-stat": "away_team"}).find("a")
-                                else np.nan
-                            ),
-                            "team stats": (
-                                cls.TeamInfos(
-                                    row.find("td", {"data-stat": "away_team"})
-                                    .find("a")
-                                    .text.strip(),
-                                    league,
-                                )
-                                if row.find("td", {"data-stat": "away_team"})
-                                and row.find("td", {"data-stat": "away_team"}).find("a")
-                                else np.nan
-                            ),
-                        },
-                    },
-                    "score": {
-                        "home": (
-                            row.find("td", {"data-stat": "score"})
-                            .find("a")
-                            .text.strip()
-                            .split("–")[0]
-                            .strip()
-                            if row.find("td", {"data-stat": "score"})
-                            and row.find("td", {"data-stat": "score"}).find("a")
-                            else np.nan
-                        ),
-                        "away": (
-                            row.find("td", {"data-stat": "score"})
-                            .find("a")
-                            .text.strip()
-                            .split("–")[1]
-                            .strip()
-                            if row.find("td", {"data-stat": "score"})
-                            and row.find("td", {"data-stat": "score"}).find("a")
-                            else np.nan
-                        ),
-                    },
-                    "Attendance": (
-                        row.find("td", {"data-stat": "attendance"}).text.strip()
-                        if row.find("td", {"data-stat": "attendance"})
-                        else np.nan
-                    ),
-                    "venue": (
-                        row.find("td", {"data-stat": "venue"}).text.strip()
-                        if row.find("td", {"data-stat": "venue"})
-                        else np.nan
-                    ),
-                    "teams": {
-                        "home": (
-                            row.find("td", {"data-stat": "home_team"})
-                            .find("a")
-                            .text.strip()
-                            if row.find("td", {"data-stat": "home_team"})
-                            and row.find("td", {"data-stat": "home_team"}).find("a")
-                            else np.nan
-                        ),
-                        "away": (
-                            row.find("td", {"data-stat": "away_team"})
-                            .find("a")
-                            .text.strip()
-                            if row.find("td", {"data-stat": "away_team"})
-                            and row.find("td", {"data-stat": "away_team"}).find("a")
-                            else np.nan
-                        ),
-                    },
-                }
-                for row in table.find_all("tr")
-                if row.find("td", {"data-stat": "match_report"})
-                and "Head-to-Head" in row.find("td", {"data-stat": "match_report"}).text
-                # Filter matches where the target team is either the home or away team
-                if (
-                    (
-                        row.find("td", {"data-stat": "home_team"})
-                        and row.find("td", {"data-stat": "home_team"})
-                        .find("a")
-                        .text.strip()
-                        == team
-                    )
-                    or (
-                        row.find("td", {"data-stat": "away_team"})
-                        and row.find("td", {"data-stat": "away_team"})
-                        .find("a")
-                        .text.strip()
-                        == team
-                    )
-                )
-            ]
-        }
+        fixtures = {league + "-Scores-and-Fixture": matches}
 
         return fixtures
 
@@ -1957,7 +1502,10 @@ class Fbref:
         # Retrieve current season team stats
         current_season_url = urls.seasonUrls[f"{cuurentYear}-{int(cuurentYear)+1}"]
         response = cls._get(os.path.join(cls.baseurl, current_season_url[1:]))
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = cls._soup(
+            response.content,
+            only=SoupStrainer("table", attrs={"class": css_class("stats_table")}),
+        )
         table = soup.find("table", class_="stats_table")
 
         current_team_stats = {
@@ -2000,7 +1548,10 @@ class Fbref:
         previous_season_url = urls.seasonUrls[f"{int(cuurentYear)-1}-{cuurentYear}"]
 
         response = cls._get(os.path.join(cls.baseurl, previous_season_url[1:]))
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = cls._soup(
+            response.content,
+            only=SoupStrainer("table", attrs={"class": css_class("stats_table")}),
+        )
         table = soup.find("table", class_="stats_table")
 
         # Collecting data into a dictionary with team names as keys and including rank
@@ -2100,35 +1651,13 @@ class Fbref:
                 cuurentYear, "FBref", league, team, list(validTeams)
             )
 
-        teamInfos = teamsInfo[team]
+        # The result of `TeamsInfos` is shared with its other callers
+        teamInfos = copy.deepcopy(teamsInfo[team])
 
         # Adding additional stats current season
         team_url = os.path.join(cls.baseurl, teamInfos["url"][1:])
 
-        response = cls._get(team_url)
-
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        stats_categories = {
-            "players": {"re": "players", "header": 1},
-            "Scores & Fixtures": {"re": "for", "header": 0},
-            "keeper": {"re": "keeper", "header": 1},
-            "passing": {"re": "passing", "header": 1},
-            "shooting": {"re": "shooting", "header": 1},
-            "passing type": {"re": "passing_type", "header": 1},
-            "goal shot creation": {"re": "gca", "header": 1},
-            "defensive actions": {"re": "defense", "header": 1},
-            "possession": {"re": "possession", "header": 1},
-            "playing time": {"re": "playing_time", "header": 1},
-        }
-
-        for cat in stats_categories.keys():
-            if cat != "players":
-                teamInfos["current stats"][cat] = cls._categorystats(
-                    soup, stats_categories[cat]["re"], stats_categories[cat]["header"]
-                )
-            else:
-                teamInfos["current stats"]["players"] = cls._players(soup)
+        teamInfos["current stats"].update(cls._teamstats(cls._team_page(team_url)))
 
         # Adding additional stats previous season
         team_url = (
@@ -2141,39 +1670,77 @@ class Fbref:
             ).replace("https:/", "https://", 1)
         )
 
-        response = cls._get(team_url)
+        teamInfos["previous stats"].update(cls._teamstats(cls._team_page(team_url)))
 
-        soup = BeautifulSoup(response.content, "html.parser")
+        return teamInfos
 
-        for cat in stats_categories.keys():
-            if cat != "players":
-                teamInfos["previous stats"][cat] = cls._categorystats(
-                    soup, stats_categories[cat]["re"], stats_categories[cat]["header"]
-                )
-            else:
-                teamInfos["previous stats"]["players"] = cls._players(soup)
+    # ====================================== team page =========================================#
+
+    # Stats read from each team page: key -> (pattern of the table id, header row);
+    # "players" is read by `_players`
+    team_stats_categories: Dict[str, Tuple[str, int]] = {
+        "players": ("stats_standard_12", 1),
+        "Scores & Fixtures": ("for", 0),
+        "keeper": ("keeper", 1),
+        "passing": ("passing", 1),
+        "shooting": ("shooting", 1),
+        "passing type": ("passing_type", 1),
+        "goal shot creation": ("gca", 1),
+        "defensive actions": ("defense", 1),
+        "possession": ("possession", 1),
+        "playing time": ("playing_time", 1),
+    }
 
-        return teamInfos
+    @classmethod
+    def _team_page(cls, url: str) -> TeamPage:
+        """
+        Fetches a team page and indexes its stats tables, including the ones FBref
+        ships inside HTML comments.
+
+        Only the tables of the page are built, and the comments holding tables are
+        parsed once on their own, so every byte of the page is parsed at most once.
+        """
+        content = cls._get(url).content
+        soups = [cls._soup(content, only=SoupStrainer("table"))]
+        hidden = commented_tables(content)
+        if hidden:
+            soups.append(cls._soup(hidden, only=SoupStrainer("table")))
+        return TeamPage.parse(soups)
+
+    @classmethod
+    def _teamstats(cls, page: TeamPage) -> dict:
+        """Reads every category of `team_stats_categories` from an indexed team page."""
+        stats = {}
+        for category, (pattern, header) in cls.team_stats_categories.items():
+            if category == "players":
+                stats[category] = cls._players(page)
+            else:
+                stats[category] = cls._categorystats(page, pattern, header)
+        return stats
 
     # ====================================== _players =========================================#
 
     @staticmethod
-    def _players(soup: BeautifulSoup) -> pd.DataFrame:
+    def _players(page: TeamPage) -> pd.DataFrame:
         """
         Extracts and returns a DataFrame containing player statistics and their corresponding URLs
-        from an HTML table within the provided BeautifulSoup object.
+        from the player statistics table of a team page.
 
         Args:
-            soup (BeautifulSoup): A BeautifulSoup object containing the HTML of the webpage
-                                with the player statistics table.
+            page (TeamPage): The indexed tables of the team page.
 
         Returns:
             pd.DataFrame: A DataFrame containing player statistics with additional player URLs.
                         The columns include various stats like appearances, goals, assists,
                         and more, along with the player's name and URL.
+
+        Raises:
+            ValueError: If the page has no player statistics table.
         """
         # Locate the table containing player statistics
-        table = soup.find("table", {"class": "stats_table", "id": "stats_standard_12"})
+        table = page.tables.get("stats_standard_12")
+        if table is None:
+            raise ValueError("No player statistics table on the team page")
 
         # Extract player names and their corresponding URLs
         data = {
@@ -2186,8 +1753,8 @@ class Fbref:
         # Convert the player URLs to a DataFrame
         players_urls = pd.DataFrame(list(data.items()), columns=["Player", "Url"])
 
-        # Read the HTML table into a DataFrame
-        players = pd.read_html(StringIO(str(table)), header=1)[0].fillna("-")
+        # Read the parsed table into a DataFrame
+        players = table_frame(table, header=1).fillna("-")
 
         # Merge the players DataFrame with the URLs DataFrame
         players = players.merge(players_urls, how="left", on="Player")
@@ -2197,7 +1764,7 @@ class Fbref:
     # ====================================== _categorystats =========================================#
 
     @staticmethod
-    def _categorystats(soup: BeautifulSoup, category: str, header: int) -> pd.DataFrame:
+    def _categorystats(page: TeamPage, category: str, header: int) -> pd.DataFrame:
         """
         Extracts and returns a DataFrame containing statistics from a specified table on a webpage.
 
@@ -2206,24 +1773,28 @@ class Fbref:
         fills any missing values with a placeholder ('-').
 
         Args:
-            soup (BeautifulSoup): A BeautifulSoup object containing the HTML of the webpage with the table.
-            category (str): The identifier for the table's `id` attribute, which determines which table to extract.
+            page (TeamPage): The indexed tables of the webpage.
+            category (str): Regular expression matched against the tables' `id` attribute, which determines
+                            which table to extract.
             header (int): The row index to use as the header for the DataFrame.
 
         Returns:
             pd.DataFrame: A DataFrame containing the statistics from the specified table, with any missing values
                         filled with '-'.
 
+        Raises:
+            ValueError: If no table of the page matches `category`.
+
         Example:
             # Example usage
-            df = _categorystats(soup, 'passing', 0)
+            df = _categorystats(page, 'passing', 0)
         """
         # Locate the table containing statistics
-        table = soup.find(
-            "table", {"class": re.compile("stats"), "id": re.compile(f"{category}")}
-        )
+        table = page.table(category)
+        if table is None:
+            raise ValueError(f"No {category!r} statistics table on the team page")
 
-        # Convert the HTML table into a DataFrame and fill any missing values with '-'
-        stats = pd.read_html(StringIO(str(table)), header=header)[0].fillna("-")
+        # Convert the parsed table into a DataFrame and fill any missing values with '-'
+        stats = table_frame(table, header=header).fillna("-")
 
         return stats
@@ -0,0 +1,62 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+
+class HedgePolicy:
+    """
+    Decides when a slow request gets a duplicate sent through another route.
+
+    Latencies of recent successful requests are kept in a sliding window. Once
+    `min_samples` are known, a request still pending after the `percentile` of that
+    window (never less than `min_delay`) is hedged: the same request is sent again
+    through a second proxy, or directly, and the first answer wins. Both requests
+    take a token from the rate limiter.
+
+    Hedging is opt-in: `Fbref.hedge_policy = HedgePolicy()`.
+
+    Args:
+        percentile (float): Percentile of recent latency after which to hedge, 0-100.
+        min_samples (int): Samples needed before hedging starts.
+        min_delay (float): Lower bound of the hedging delay in seconds.
+        window (int): Number of recent latencies kept.
+        max_workers (int): Threads available to run primary and hedged requests.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        min_delay: float = 0.5,
+        window: int = 200,
+        max_workers: int = 16,
+    ) -> None:
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.latencies: deque = deque(maxlen=window)
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ligas-hedge"
+        )
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        """Adds the latency in seconds of a successful request to the window."""
+        with self._lock:
+            self.latencies.append(latency)
+
+    def delay(self) -> Optional[float]:
+        """
+        Returns the seconds to wait before hedging, or None while the window holds
+        fewer than `min_samples` latencies.
+        """
+        with self._lock:
+            if len(self.latencies) < self.min_samples:
+                return None
+            samples = list(self.latencies)
+        return max(self.min_delay, float(np.percentile(samples, self.percentile)))
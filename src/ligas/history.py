@@ -0,0 +1,121 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from bs4 import Tag
+
+from .parsing import row_cells
+
+
+@dataclass
+class LeagueHistory:
+    """
+    Seasons of a league, parsed once from its history page.
+
+    `get_valid_seasons`, `TopScorers` and `TopScorer` all read this page; they now
+    share one parse of it, cached per league. Each attribute is a column with one
+    entry per season, newest first as on FBref, and `index` maps a season to its
+    row so that lookups by season are O(1).
+
+    Attributes:
+        league (str): The league, e.g. "Serie A".
+        seasons (List[str]): Season names, e.g. "2023-2024".
+        season_urls (List[str]): Relative URL of each season's page.
+        champions (List[str | None]): Champion of each season, e.g. "Inter - 89".
+        top_scorers (List[str | None]): Top scorer of each season.
+        goals (List[str | None]): Goals of the top scorer.
+        top_scorer_urls (List[str | None]): Relative URL of the top scorer's page.
+        index (Dict[str, int]): Row of each season.
+    """
+
+    league: str
+    seasons: List[str] = field(default_factory=list)
+    season_urls: List[str] = field(default_factory=list)
+    champions: List[Optional[str]] = field(default_factory=list)
+    top_scorers: List[Optional[str]] = field(default_factory=list)
+    goals: List[Optional[str]] = field(default_factory=list)
+    top_scorer_urls: List[Optional[str]] = field(default_factory=list)
+    index: Dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.index = {season: row for row, season in enumerate(self.seasons)}
+
+    def __len__(self) -> int:
+        return len(self.seasons)
+
+    def __contains__(self, season: str) -> bool:
+        return season in self.index
+
+    @classmethod
+    def parse(cls, rows: Iterable[Tag], league: str) -> "LeagueHistory":
+        """
+        Builds the history from the rows of the seasons table.
+
+        A row is a season when its header cell links to the season's page.
+
+        Args:
+            rows (Iterable[Tag]): The `<tr>` elements of the history page.
+            league (str): The league of the page.
+        """
+        history = cls(league)
+        for row in rows:
+            cells = row_cells(row)
+            season = next(
+                (
+                    cell
+                    for cell in cells.values()
+                    if cell.name == "th" and cell.has_attr("class") and cell.find("a")
+                ),
+                None,
+            )
+            if season is None:
+                continue
+
+            champion = cells.get("champ")
+            scorer = cells.get("top_scorers")
+            link = scorer.find("a") if scorer is not None else None
+            goals = scorer.find("span") if link is not None else None
+
+            history.seasons.append(season.text.strip())
+            history.season_urls.append(season.find("a")["href"])
+            history.champions.append(champion.text if champion is not None else None)
+            history.top_scorers.append(link.text.strip() if link is not None else None)
+            history.goals.append(goals.text.strip() if goals is not None else None)
+            history.top_scorer_urls.append(link["href"] if link is not None else None)
+
+        history.__post_init__()
+        return history
+
+    def url(self, season: str) -> str:
+        """Returns the relative URL of a season's page, raises KeyError if unknown."""
+        return self.season_urls[self.index[season]]
+
+    def season_url_map(self) -> Dict[str, str]:
+        """Returns the URL of every season, keyed by season."""
+        return dict(zip(self.seasons, self.season_urls))
+
+    def top_scorer(self, season: str, baseurl: str) -> Optional[dict]:
+        """
+        Returns the top scorer of a season in the format of `Fbref.TopScorers`,
+        None if the page names none.
+        """
+        row = self.index[season]
+        if self.top_scorers[row] is None:
+            return None
+
+        champion = self.champions[row]
+        return {
+            "year": season,
+            "top_scorer": self.top_scorers[row],
+            "goals": self.goals[row],
+            "stats_link": baseurl + self.top_scorer_urls[row],
+            "club": champion.split("-")[0].strip() if champion is not None else "Unknown",
+        }
+
+    def top_scorer_records(self, baseurl: str) -> Dict[str, dict]:
+        """Returns the top scorer of every season, keyed as in `Fbref.TopScorers`."""
+        records = {}
+        for season in self.seasons:
+            record = self.top_scorer(season, baseurl)
+            if record is not None:
+                records[f"{self.league} season {season}"] = record
+        return records
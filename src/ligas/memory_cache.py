@@ -0,0 +1,127 @@
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+# Default of `MemoryCache.get` telling a miss apart from a cached None
+MISSING = object()
+
+
+class MemoryCache:
+    """
+    Thread-safe in-process LRU cache of endpoint results, in front of the disk cache.
+
+    A hit on the disk cache of `cache_data` still costs a file read and unpickling;
+    results kept here are returned as is, in microseconds. The cache is bounded both
+    by number of entries and by their total size (the size of their file in the
+    disk cache), and evicts the least recently used entries first. Entries also
+    expire after `ttl` seconds, after which they are read from the disk cache again.
+
+    Results are shared between callers: do not mutate them in place.
+
+    Args:
+        max_entries (int): Maximum number of results kept.
+        max_bytes (int): Maximum total size of the results kept, in bytes.
+        ttl (float): Seconds a result stays in memory.
+        clock (Callable): Monotonic clock, in seconds.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.totals: Counter = Counter()
+        self._clock = clock
+        # key -> (value, size, expiry)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[2] > self._clock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the result stored for `key`, or `default` if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= self._clock():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.totals["misses"] += 1
+                return default
+            self._entries.move_to_end(key)
+            self.totals["hits"] += 1
+            return entry[0]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Like `get`, without counting a hit or a miss nor refreshing the entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] <= self._clock():
+                return default
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int = 0, ttl: Optional[float] = None) -> None:
+        """
+        Stores a result, evicting the least recently used ones to make room.
+
+        Args:
+            key (Hashable): The key of the result.
+            value (Any): The result.
+            size (int): Its size in bytes. Results larger than `max_bytes` are not kept.
+            ttl (float, optional): Seconds until the result expires, when it is sooner
+                than `ttl` of the cache.
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes or self.max_entries <= 0 or ttl <= 0:
+                return
+            self._entries[key] = (value, size, self._clock() + ttl)
+            self.size += size
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.totals["evictions"] += 1
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Removes and returns the result stored for `key`, None if there is none."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._remove(key)
+            return entry[0]
+
+    def clear(self) -> None:
+        """Drops every result; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def summary(self) -> dict:
+        """Returns the hit, miss and eviction counters with the current occupancy."""
+        with self._lock:
+            return {
+                "hits": self.totals["hits"],
+                "misses": self.totals["misses"],
+                "evictions": self.totals["evictions"],
+                "entries": len(self._entries),
+                "bytes": self.size,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.size -= size
@@ -0,0 +1,293 @@
+import os
+import re
+import gzip
+import json
+import time
+import hashlib
+import tempfile
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .utils import metadata_root
+from .logger import logger
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalizes a URL so that every spelling of the same page maps to one cache key.
+
+    The scheme and host are lower-cased, duplicate slashes in the path (produced when
+    joining `baseurl` with a link starting with "/") are collapsed, query parameters
+    are sorted and the fragment is dropped.
+
+    Args:
+        url (str): The URL to normalize.
+
+    Returns:
+        str: The canonical URL.
+    """
+    parts = urlsplit(url.strip())
+    path = re.sub(r"/{2,}", "/", parts.path) or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+_since: ContextVar[Optional[float]] = ContextVar("ligas_pages_since", default=None)
+
+
+def current_pages_since() -> Optional[float]:
+    """Returns the unix time before which cached pages are expired, None if unset."""
+    return _since.get()
+
+
+@contextmanager
+def pages_since_scope(since: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Treats the pages cached before `since` as expired while the block runs.
+
+    `cache_data` opens it when refreshing an expired result, so that the result is
+    parsed from pages fetched after it expired instead of the cached pages it was
+    computed from. A nested scope can only move the time later.
+
+    Args:
+        since (float, optional): Unix time, None to inherit the current one.
+
+    Yields:
+        float | None: The time in effect inside the block.
+    """
+    outer = _since.get()
+    if since is None or (outer is not None and outer >= since):
+        yield outer
+        return
+
+    token = _since.set(since)
+    try:
+        yield since
+    finally:
+        _since.reset(token)
+
+
+def page_digest(content: bytes) -> str:
+    """Returns the digest identifying the content of a page."""
+    return hashlib.sha1(content).hexdigest()
+
+
+class PageLog:
+    """
+    Pages a result is built from, by canonical URL, with the digest of their content.
+
+    `cache_data` stores it with each result so that, when the result expires, it
+    can revalidate the pages and renew the result without parsing them again if
+    none changed. The log is incomplete when part of the result comes from an
+    entry that did not record its pages.
+    """
+
+    def __init__(self) -> None:
+        self.pages: Dict[str, str] = {}
+        self.complete = True
+
+    def record(self, url: str, content: bytes) -> None:
+        self.pages[canonical_url(url)] = page_digest(content)
+
+    def merge(self, pages: Optional[Dict[str, str]]) -> None:
+        """Adds the pages of a nested result, None if it did not record them."""
+        if pages is None:
+            self.complete = False
+        else:
+            self.pages.update(pages)
+
+    def result(self) -> Optional[Dict[str, str]]:
+        """Returns the pages read, None if they are not all known."""
+        return dict(self.pages) if self.complete and self.pages else None
+
+
+_log: ContextVar[Optional[PageLog]] = ContextVar("ligas_page_log", default=None)
+
+
+def current_page_log() -> Optional[PageLog]:
+    """Returns the log of the result being computed, None outside `cache_data`."""
+    return _log.get()
+
+
+@contextmanager
+def page_log_scope() -> Iterator[PageLog]:
+    """Records the pages read while the block runs in a new `PageLog`."""
+    log = PageLog()
+    token = _log.set(log)
+    try:
+        yield log
+    finally:
+        _log.reset(token)
+
+
+class PageCache:
+    """
+    Disk cache of raw HTTP response bodies keyed by canonical URL.
+
+    It sits beneath the result cache of `cache_data`: endpoints that parse the same
+    page (the seven schedule-based ones share the Scores and Fixtures page) only
+    download it once per `ttl`. Each entry is a single gzip file holding a JSON
+    header line (url, status, headers) followed by the body, written to a temporary
+    file and renamed so that readers never see a partial entry. Freshness is the
+    file's modification time, so an entry confirmed unchanged by the server (a 304
+    answer to a conditional GET) is renewed without rewriting it.
+
+    Expired pages are deleted by `purge`, which the janitor of `CacheManager` runs
+    for the page cache under its root.
+
+    Args:
+        root (Path): Directory holding the cached pages, resolved once.
+        ttl (float): Seconds a page stays fresh.
+    """
+
+    def __init__(self, root: Path = metadata_root / "pages", ttl: float = 24 * 3600) -> None:
+        self.root = Path(root).expanduser().resolve()
+        self.ttl = ttl
+
+    def path(self, url: str) -> Path:
+        """Returns the file holding the page of `url`."""
+        digest = hashlib.sha1(canonical_url(url).encode("utf-8")).hexdigest()
+        return self.root / digest[:2] / f"{digest}.gz"
+
+    def get(self, url: str) -> Optional[requests.Response]:
+        """
+        Returns the cached response of `url`, or None if it is missing or expired.
+        """
+        entry = self.lookup(url)
+        if entry is None or not entry[1]:
+            return None
+        return entry[0]
+
+    def lookup(
+        self, url: str, since: Optional[float] = None
+    ) -> Optional[Tuple[requests.Response, bool]]:
+        """
+        Returns the cached response of `url`, even expired, and whether it is fresh.
+
+        Args:
+            url (str): The page.
+            since (float, optional): Unix time before which the page is expired
+                whatever its age, see `pages_since_scope`.
+
+        Returns:
+            tuple | None: `(response, fresh)`, or None if `url` was never cached.
+        """
+        path = self.path(url)
+        entry = self._read(path)
+        if entry is None:
+            return None
+
+        header, content = entry
+        try:
+            fetched = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        fresh = time.time() - fetched < self.ttl and (since is None or fetched >= since)
+        return self._response(header, content), fresh
+
+    def renew(self, url: str) -> None:
+        """Marks the cached page of `url` as fetched now."""
+        try:
+            os.utime(self.path(url))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def validators(response: requests.Response) -> dict:
+        """
+        Returns the conditional request headers revalidating a cached response.
+
+        Args:
+            response (requests.Response): A response returned by `lookup`.
+
+        Returns:
+            dict: `If-None-Match` and/or `If-Modified-Since`, empty if the server sent
+                neither an ETag nor a Last-Modified header.
+        """
+        headers = {}
+        if response.headers.get("ETag"):
+            headers["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = response.headers["Last-Modified"]
+        return headers
+
+    def put(self, url: str, response: requests.Response) -> None:
+        """Stores a successful response for `url`."""
+        if response.status_code != 200:
+            return
+
+        header = {
+            "url": canonical_url(url),
+            "status": response.status_code,
+            # The body is stored decoded, so transfer headers no longer apply
+            "headers": {
+                k: v
+                for k, v in response.headers.items()
+                if k.lower() not in {"content-encoding", "content-length", "transfer-encoding"}
+            },
+            "encoding": response.encoding,
+        }
+        self._write(self.path(url), header, response.content)
+
+    def purge(self) -> int:
+        """
+        Deletes every expired page.
+
+        Returns:
+            int: Number of pages deleted.
+        """
+        deleted = 0
+        now = time.time()
+        for file in self.root.glob("*/*.gz"):
+            try:
+                if now - file.stat().st_mtime >= self.ttl:
+                    file.unlink()
+                    deleted += 1
+            except FileNotFoundError:
+                continue
+        return deleted
+
+    # ====================================== storage ==========================================#
+
+    @staticmethod
+    def _read(path: Path) -> Optional[tuple]:
+        try:
+            with gzip.open(path, "rb") as f:
+                header = json.loads(f.readline())
+                content = f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, EOFError) as e:
+            logger.error(f"Ignoring corrupted page cache entry {path}: {e}")
+            return None
+        return header, content
+
+    @staticmethod
+    def _write(path: Path, header: dict, content: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(json.dumps(header).encode("utf-8") + b"\n")
+                f.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _response(header: dict, content: bytes) -> requests.Response:
+        """Rebuilds a `requests.Response` from a cache entry."""
+        response = requests.Response()
+        response.status_code = header["status"]
+        response.headers = CaseInsensitiveDict(header["headers"])
+        response.encoding = header.get("encoding")
+        response.url = header["url"]
+        response._content = content
+        return response
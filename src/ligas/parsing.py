@@ -0,0 +1,335 @@
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from bs4 import BeautifulSoup, FeatureNotFound, NavigableString, SoupStrainer, Tag
+from pandas.io.parsers import TextParser
+
+# Tree builders supported by BeautifulSoup, fastest first
+PARSERS: Tuple[str, ...] = ("lxml", "html5lib", "html.parser")
+
+
+@lru_cache(maxsize=None)
+def is_available(parser: str) -> bool:
+    """Returns True if BeautifulSoup can build trees with `parser`."""
+    try:
+        BeautifulSoup("", parser)
+    except FeatureNotFound:
+        return False
+    return True
+
+
+def available_parsers() -> Tuple[str, ...]:
+    """Returns the installed parsers among `PARSERS`, fastest first."""
+    return tuple(parser for parser in PARSERS if is_available(parser))
+
+
+def best_parser() -> str:
+    """
+    Returns the fastest installed parser.
+
+    lxml is a dependency of ligas, so it is normally picked; "html.parser" ships
+    with Python and is always available.
+    """
+    return available_parsers()[0]
+
+
+def css_class(name: str) -> "re.Pattern":
+    """
+    Returns a pattern matching elements having the class `name`, for `SoupStrainer`.
+
+    While the page is parsed, strainers see the class attribute as a single string
+    ("stats_table sortable"), so a plain string only matches elements with no other
+    class. The pattern matches one class of the list in both cases.
+    """
+    return re.compile(rf"(^|\s){re.escape(name)}(\s|$)")
+
+
+def make_soup(
+    markup: Union[str, bytes],
+    parser: Optional[str] = None,
+    only: Optional[SoupStrainer] = None,
+) -> BeautifulSoup:
+    """
+    Parses an HTML page.
+
+    Args:
+        markup (str | bytes): The page, e.g. `response.content`.
+        parser (str, optional): One of `PARSERS`, defaults to `best_parser()`.
+        only (SoupStrainer, optional): Builds only the elements it matches, with
+            their descendants, instead of the whole document. This cuts parse time
+            and memory on large pages. html5lib does not support it and always
+            builds the whole document.
+
+    Returns:
+        BeautifulSoup: The parsed document.
+
+    Raises:
+        ValueError: If `parser` is unknown or not installed.
+    """
+    parser = parser or best_parser()
+    if parser not in PARSERS or not is_available(parser):
+        raise ValueError(
+            f"Unsupported HTML parser {parser!r}, choose one of {available_parsers()}"
+        )
+    if parser == "html5lib":
+        only = None
+    return BeautifulSoup(markup, parser, parse_only=only)
+
+
+# ====================================== row extraction ==========================================#
+
+# Cells of a table row keyed by their `data-stat` attribute
+Cells = Dict[str, Tag]
+# Output key -> field reading the cells of a row, or a nested schema
+Schema = Dict[str, Union[Callable[[Cells], Any], "Schema"]]
+
+
+def row_cells(row: Tag) -> Cells:
+    """
+    Maps the `data-stat` attribute of every cell of a table row to the cell.
+
+    The row is scanned once, so a schema can read any number of fields from it
+    without searching the row again. When two cells share a `data-stat`, the
+    first one is kept.
+    """
+    cells: Cells = {}
+    for cell in row.find_all(("td", "th"), recursive=False):
+        stat = cell.get("data-stat")
+        if stat is not None and stat not in cells:
+            cells[stat] = cell
+    return cells
+
+
+def extract(cells: Cells, schema: Schema) -> dict:
+    """Fills `schema` from the cells of one row."""
+    return {
+        key: extract(cells, field) if isinstance(field, dict) else field(cells)
+        for key, field in schema.items()
+    }
+
+
+def extract_rows(
+    rows: Iterable[Tag],
+    schema: Schema,
+    where: Optional[Callable[[Cells], bool]] = None,
+) -> List[dict]:
+    """
+    Extracts one dictionary per table row.
+
+    Args:
+        rows (Iterable[Tag]): The `<tr>` elements, e.g. `table.find_all("tr")`.
+        schema (Schema): The fields to extract, see `text`, `link_text`, `href`,
+            `attr` and `split_link_text`.
+        where (Callable, optional): Keeps only the rows whose cells it accepts.
+
+    Returns:
+        List[dict]: The extracted rows.
+
+    eg:
+        extract_rows(table.find_all("tr"), {"date": text("date")})
+    """
+    records = []
+    for row in rows:
+        cells = row_cells(row)
+        if where is None or where(cells):
+            records.append(extract(cells, schema))
+    return records
+
+
+def text(stat: str) -> Callable[[Cells], Any]:
+    """Field reading the text of the `stat` cell, NaN when there is no such cell."""
+
+    def field(cells: Cells) -> Any:
+        cell = cells.get(stat)
+        return cell.text.strip() if cell is not None else np.nan
+
+    return field
+
+
+def link_text(stat: str) -> Callable[[Cells], Any]:
+    """Field reading the text of the link in the `stat` cell, NaN without a link."""
+
+    def field(cells: Cells) -> Any:
+        cell = cells.get(stat)
+        link = cell.find("a") if cell is not None else None
+        return link.text.strip() if link is not None else np.nan
+
+    return field
+
+
+def href(stat: str, prefix: str = "") -> Callable[[Cells], Any]:
+    """Field reading the target of the link in the `stat` cell, prefixed with `prefix`."""
+
+    def field(cells: Cells) -> Any:
+        cell = cells.get(stat)
+        link = cell.find("a") if cell is not None else None
+        return prefix + link["href"] if link is not None else np.nan
+
+    return field
+
+
+def attr(stat: str, name: str, tag: str = "span") -> Callable[[Cells], Any]:
+    """Field reading the `name` attribute of the first `tag` of the `stat` cell having it."""
+
+    def field(cells: Cells) -> Any:
+        cell = cells.get(stat)
+        element = cell.find(tag, {name: True}) if cell is not None else None
+        return element[name] if element is not None else np.nan
+
+    return field
+
+
+def split_link_text(stat: str, sep: str, index: int) -> Callable[[Cells], Any]:
+    """Field reading one part of the link text of the `stat` cell split on `sep`."""
+    link = link_text(stat)
+
+    def field(cells: Cells) -> Any:
+        value = link(cells)
+        parts = value.split(sep) if isinstance(value, str) else []
+        return parts[index].strip() if -len(parts) <= index < len(parts) else np.nan
+
+    return field
+
+
+# ====================================== table extraction ==========================================#
+
+# Whitespace collapsed in cell texts, as `pd.read_html` does
+_WHITESPACE = re.compile(r"[\r\n]+|\s{2,}")
+
+
+def _hidden(element: Tag) -> bool:
+    return "display:none" in element.get("style", "").replace(" ", "")
+
+
+def cell_text(cell: Tag) -> str:
+    """
+    Returns the text of a table cell as `pd.read_html` reads it: hidden elements
+    are skipped, `<br>` counts as a line break and whitespace runs are collapsed.
+    """
+    parts: List[str] = []
+
+    def walk(element: Tag) -> None:
+        for child in element.children:
+            if isinstance(child, Tag):
+                if child.name == "br":
+                    parts.append("\n")
+                elif not _hidden(child):
+                    walk(child)
+            elif type(child) is NavigableString:
+                parts.append(str(child))
+
+    walk(cell)
+    return _WHITESPACE.sub(" ", "".join(parts).strip())
+
+
+def _cells(row: Tag) -> List[Tag]:
+    return [
+        cell for cell in row.find_all(("td", "th"), recursive=False) if not _hidden(cell)
+    ]
+
+
+def _section_rows(table: Tag) -> Tuple[List[Tag], List[Tag], List[Tag]]:
+    """Splits the rows of a table into header, body and footer rows."""
+    head = [
+        row
+        for thead in table.find_all("thead")
+        for row in thead.find_all("tr", recursive=False)
+    ]
+    body = [row for tbody in table.find_all("tbody") for row in tbody.find_all("tr")]
+    body += table.find_all("tr", recursive=False)
+    foot = [row for tfoot in table.find_all("tfoot") for row in tfoot.find_all("tr")]
+    head, body, foot = (
+        [row for row in rows if not _hidden(row)] for rows in (head, body, foot)
+    )
+
+    if not head:
+        # Without <thead>, the leading rows made only of <th> are the header
+        while body and all(cell.name == "th" for cell in _cells(body[0])):
+            head.append(body.pop(0))
+    return head, body, foot
+
+
+def _expand_spans(
+    rows: List[Tag], pending: List[Tuple[int, str, int]], overflow: bool
+) -> Tuple[List[List[str]], List[Tuple[int, str, int]]]:
+    """
+    Reads rows into lists of texts, repeating cells over their colspan and rowspan.
+
+    `pending` holds the (column, text, rows left) of cells spanning down from the
+    previous section; the ones still spanning are returned, or emitted as extra
+    rows when `overflow` is False.
+    """
+    texts: List[List[str]] = []
+    for row in rows:
+        values: List[str] = []
+        spanning: List[Tuple[int, str, int]] = []
+        column = 0
+        for cell in _cells(row):
+            while pending and pending[0][0] <= column:
+                _, value, left = pending.pop(0)
+                values.append(value)
+                if left > 1:
+                    spanning.append((column, value, left - 1))
+                column += 1
+
+            value = cell_text(cell)
+            rowspan = int(cell.get("rowspan") or 1)
+            for _ in range(int(cell.get("colspan") or 1)):
+                values.append(value)
+                if rowspan > 1:
+                    spanning.append((column, value, rowspan - 1))
+                column += 1
+
+        for index, value, left in pending:
+            values.append(value)
+            if left > 1:
+                spanning.append((index, value, left - 1))
+        texts.append(values)
+        pending = spanning
+
+    while pending and not overflow:
+        texts.append([value for _, value, _ in pending])
+        pending = [(index, value, left - 1) for index, value, left in pending if left > 1]
+    return texts, pending
+
+
+def table_frame(
+    table: Tag, header: Optional[Union[int, List[int]]] = None
+) -> pd.DataFrame:
+    """
+    Builds a DataFrame from a parsed `<table>`.
+
+    Reads the cells of the tree that is already built instead of serializing the
+    table with `str(table)` for `pd.read_html` to parse it again, and returns the
+    same frame: colspan and rowspan are expanded, ragged rows are padded, and
+    values are typed by the parser behind `pd.read_html` (thousands separators
+    included).
+
+    Args:
+        table (Tag): The table, e.g. `soup.find("table", id="stats_standard_12")`.
+        header (int | List[int], optional): Row(s) holding the column names,
+            counting the header rows first. Several rows give MultiIndex columns.
+            By default, the non-empty header rows are used.
+
+    Returns:
+        pd.DataFrame: The table.
+
+    eg:
+        table_frame(soup.find("table", id="stats_standard_12"), header=1)
+    """
+    head_rows, body_rows, foot_rows = _section_rows(table)
+    head, pending = _expand_spans(head_rows, [], overflow=True)
+    body, pending = _expand_spans(body_rows, pending, overflow=bool(foot_rows))
+    foot, _ = _expand_spans(foot_rows, pending, overflow=False)
+
+    if head and header is None:
+        header = 0 if len(head) == 1 else [i for i, row in enumerate(head) if any(row)]
+    rows = head + body + foot
+
+    width = max((len(row) for row in rows), default=0)
+    rows = [row + [""] * (width - len(row)) for row in rows]
+    with TextParser(rows, header=header, thousands=",") as parser:
+        return parser.read()
@@ -0,0 +1,290 @@
+import time
+import threading
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+    as_completed,
+)
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from .deadline import Deadline, current_deadline
+from .utils import metadata_root, fetch_proxy_candidates, save_json, load_json
+from .logger import logger
+
+
+@dataclass
+class ProxyStats:
+    """
+    Health record of a single proxy.
+
+    Attributes:
+        address (str): The proxy as "ip:port".
+        latency (float): Smoothed response time in seconds.
+        successes (int): Number of successful requests through the proxy.
+        failures (int): Number of failed requests through the proxy.
+        consecutive_failures (int): Failures since the last success.
+        last_checked (float): Unix time of the last request or probe.
+    """
+
+    address: str
+    latency: float
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_checked: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        total = self.successes + self.failures
+        return self.successes / total if total else 0.0
+
+    @property
+    def score(self) -> float:
+        """Higher is better: reliable proxies first, then fast ones."""
+        return self.success_rate / max(self.latency, 1e-3)
+
+
+class ProxyPool:
+    """
+    Pool of live proxies validated concurrently in the background.
+
+    The first call to `get` starts a background refresh and returns None, meaning
+    a direct connection, until validated proxies are available. From then on `get`
+    hands out proxies in O(1) from a ranked snapshot, round-robin over the `top_k`
+    best ones. Callers report the outcome of each request with `report_success` and
+    `report_failure`, which re-rank the pool; a proxy that fails `max_failures`
+    times in a row is evicted, and the pool refreshes itself when fewer than
+    `min_live` proxies remain.
+
+    The pool is saved to `path` after every refresh and reloaded on start, so a
+    restart within `ttl` seconds does not re-validate from scratch.
+
+    Args:
+        check_url (str): URL probed to validate a proxy.
+        check_timeout (float): Timeout in seconds of a single probe.
+        max_workers (int): Number of proxies probed concurrently.
+        min_live (int): Refresh the pool when fewer live proxies remain.
+        max_failures (int): Consecutive failures after which a proxy is evicted.
+        top_k (int): Number of best ranked proxies `get` rotates over.
+        ttl (float): Seconds a validated proxy (and the file on disk) stays trusted.
+        path (Path): JSON file the pool is persisted to, resolved once.
+        source (Callable): Returns the list of candidate "ip:port" strings.
+    """
+
+    def __init__(
+        self,
+        check_url: str = "https://fbref.com/en/matches",
+        check_timeout: float = 5.0,
+        max_workers: int = 32,
+        min_live: int = 3,
+        max_failures: int = 2,
+        top_k: int = 5,
+        ttl: float = 3600.0,
+        path: Path = metadata_root / "proxies.json",
+        source: Callable[[], List[str]] = fetch_proxy_candidates,
+    ) -> None:
+        self.check_url = check_url
+        self.check_timeout = check_timeout
+        self.max_workers = max_workers
+        self.min_live = min_live
+        self.max_failures = max_failures
+        self.top_k = top_k
+        self.ttl = ttl
+        self.path = Path(path).expanduser().resolve()
+        self.source = source
+
+        self._proxies: Dict[str, ProxyStats] = {}
+        self._ranked: List[str] = []
+        self._cursor = 0
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._started = False
+
+    # ====================================== public api ==========================================#
+
+    def get(self) -> Optional[str]:
+        """
+        Returns a live proxy as "ip:port", or None when none is available yet.
+        """
+        if not self._started:
+            self.start()
+
+        best = self._ranked[: self.top_k]
+        if not best:
+            return None
+
+        index = self._cursor = (self._cursor + 1) % len(best)
+        return best[index]
+
+    def start(self) -> None:
+        """Loads the pool from disk and refreshes it in the background if needed."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+
+        self.load()
+        if len(self._ranked) < self.min_live:
+            self.refresh(wait=False)
+
+    def refresh(self, wait: bool = True) -> None:
+        """
+        Downloads fresh candidates and validates them concurrently.
+
+        Args:
+            wait (bool): Block until validation is done instead of running it
+                on a daemon thread. A blocking refresh made within an endpoint
+                call given a `timeout` or `deadline` stops probing when it passes.
+        """
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        if wait:
+            self._refresh(current_deadline())
+        else:
+            threading.Thread(target=self._refresh, daemon=True).start()
+
+    def report_success(self, proxy: str, latency: float) -> None:
+        """Records a successful request made through `proxy`."""
+        with self._lock:
+            stats = self._proxies.get(proxy)
+            if stats is None:
+                return
+            stats.successes += 1
+            stats.consecutive_failures = 0
+            stats.latency = 0.7 * stats.latency + 0.3 * latency
+            stats.last_checked = time.time()
+            self._rank()
+
+    def report_failure(self, proxy: str) -> None:
+        """Records a failed request made through `proxy`, evicting it if needed."""
+        with self._lock:
+            stats = self._proxies.get(proxy)
+            if stats is None:
+                return
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            stats.last_checked = time.time()
+
+            if stats.consecutive_failures >= self.max_failures:
+                logger.info(f"Evicting proxy {proxy}")
+                del self._proxies[proxy]
+                self._rank()
+
+            live = len(self._proxies)
+
+        if live < self.min_live:
+            self.refresh(wait=False)
+
+    def stats(self) -> List[ProxyStats]:
+        """Returns a snapshot of the live proxies, best first."""
+        with self._lock:
+            return [self._proxies[address] for address in self._ranked]
+
+    def __len__(self) -> int:
+        return len(self._ranked)
+
+    # ====================================== persistence ==========================================#
+
+    def load(self) -> None:
+        """Restores the proxies saved to `path` that are younger than `ttl`."""
+        if not self.path.exists():
+            return
+
+        try:
+            content = load_json(self.path)
+        except (OSError, ValueError) as e:
+            logger.error(f"Unable to load proxy pool from {self.path}: {e}")
+            return
+
+        now = time.time()
+        with self._lock:
+            for entry in content.get("proxies", []):
+                stats = ProxyStats(**dict(entry))
+                if now - stats.last_checked < self.ttl:
+                    self._proxies[stats.address] = stats
+            self._rank()
+
+        logger.info(f"Loaded {len(self._ranked)} proxies from {self.path}")
+
+    def save(self) -> None:
+        """Writes the live proxies to `path`."""
+        with self._lock:
+            data = {"proxies": [asdict(stats) for stats in self._proxies.values()]}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        save_json(self.path, data)
+
+    # ====================================== internals ==========================================#
+
+    def _rank(self) -> None:
+        """Rebuilds the ranked snapshot read by `get`. Caller holds the lock."""
+        self._ranked = sorted(
+            self._proxies, key=lambda address: self._proxies[address].score, reverse=True
+        )
+
+    def _check(self, proxy: str, timeout: Optional[float] = None) -> Optional[ProxyStats]:
+        """Probes `proxy` once and returns its stats, or None if it is dead."""
+        start = time.time()
+        try:
+            response = requests.get(
+                self.check_url,
+                proxies={"http": proxy, "https": proxy},
+                timeout=timeout if timeout is not None else self.check_timeout,
+            )
+        except requests.RequestException:
+            return None
+
+        if response.status_code != 200:
+            return None
+
+        now = time.time()
+        return ProxyStats(
+            address=proxy, latency=now - start, successes=1, last_checked=now
+        )
+
+    def _refresh(self, deadline: Optional[Deadline] = None) -> None:
+        try:
+            now = time.time()
+            with self._lock:
+                for address in list(self._proxies):
+                    if now - self._proxies[address].last_checked >= self.ttl:
+                        del self._proxies[address]
+                self._rank()
+                known = set(self._proxies)
+
+            candidates = [proxy for proxy in self.source() if proxy not in known]
+            logger.info(f"Validating {len(candidates)} proxies in the background")
+
+            timeout = deadline.clamp(self.check_timeout) if deadline is not None else None
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(self._check, proxy, timeout) for proxy in candidates
+                ]
+                try:
+                    for future in as_completed(
+                        futures, timeout=deadline.remaining() if deadline is not None else None
+                    ):
+                        stats = future.result()
+                        if stats is None:
+                            continue
+                        with self._lock:
+                            self._proxies[stats.address] = stats
+                            self._rank()
+                except FutureTimeoutError:
+                    logger.info("Deadline reached, proxy validation stopped")
+                    executor.shutdown(wait=False, cancel_futures=True)
+
+            logger.info(f"Proxy pool holds {len(self._ranked)} live proxies")
+            self.save()
+        except Exception as e:
+            logger.error(f"Proxy pool refresh failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
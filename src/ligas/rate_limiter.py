@@ -0,0 +1,244 @@
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterator, Optional
+
+from .utils import metadata_root
+from .logger import logger
+
+# FBref bot policy: no more than 10 requests per minute
+# see https://www.sports-reference.com/bot-traffic.html
+FBREF_MAX_RATE = 10 / 60
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Converts a `Retry-After` header into a number of seconds.
+
+    Args:
+        value (str, optional): The header value, either delay-seconds or an HTTP date.
+
+    Returns:
+        float | None: Seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(tz=timezone.utc)).total_seconds())
+
+
+@dataclass
+class BucketState:
+    """
+    Mutable state of a token bucket.
+
+    Attributes:
+        tokens (float): Tokens currently in the bucket, negative when callers are queued.
+        updated (float): Clock time of the last refill.
+        rate (float): Current refill rate in requests per second.
+        successes (int): Consecutive successes since the last rate change.
+    """
+
+    tokens: float
+    updated: float
+    rate: float
+    successes: int = 0
+
+
+class RateLimiter:
+    """
+    Adaptive token bucket pacing requests to FBref.
+
+    Tokens refill at `rate` per second up to `capacity`; `acquire` only blocks when
+    the bucket is empty. The rate follows an AIMD rule: it is multiplied by
+    `decrease_factor` whenever the server answers 429 (and the bucket is paused for
+    the `Retry-After` delay when one is given), and it grows by `increase_step`
+    after every `success_threshold` consecutive successes, never above `max_rate`.
+
+    Args:
+        rate (float): Initial rate in requests per second.
+        capacity (float): Maximum burst size.
+        min_rate (float): Lower bound of the adaptive rate.
+        max_rate (float): Upper bound of the adaptive rate.
+        decrease_factor (float): Multiplier applied to the rate on 429.
+        increase_step (float): Requests per second added after sustained success.
+        success_threshold (int): Consecutive successes needed before speeding up.
+        clock (Callable): Monotonic clock, in seconds.
+        sleep (Callable): Function used to block the caller.
+    """
+
+    def __init__(
+        self,
+        rate: float = FBREF_MAX_RATE,
+        capacity: float = 1.0,
+        min_rate: float = 1 / 120,
+        max_rate: float = FBREF_MAX_RATE,
+        decrease_factor: float = 0.5,
+        increase_step: float = 1 / 600,
+        success_threshold: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.success_threshold = success_threshold
+        self._clock = clock
+        self._sleep = sleep
+
+        self.initial_rate = min(max(rate, min_rate), max_rate)
+        self._bucket = self._new_state()
+        self._lock = threading.Lock()
+
+    def _new_state(self) -> BucketState:
+        return BucketState(
+            tokens=self.capacity, updated=self._clock(), rate=self.initial_rate
+        )
+
+    @contextmanager
+    def _locked(self) -> Iterator[BucketState]:
+        """Yields the bucket state with exclusive access to it."""
+        with self._lock:
+            yield self._bucket
+
+    @property
+    def rate(self) -> float:
+        """Current rate in requests per second."""
+        with self._locked() as bucket:
+            return bucket.rate
+
+    def _refill(self, bucket: BucketState, now: float) -> None:
+        """Adds the tokens earned since the last update."""
+        elapsed = now - bucket.updated
+        if elapsed > 0:
+            bucket.tokens = min(self.capacity, bucket.tokens + elapsed * bucket.rate)
+            bucket.updated = now
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Takes one token, blocking until it is available.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait. When the token would
+                only be available later, none is taken and the call returns at once.
+
+        Returns:
+            float | None: Seconds spent waiting, None if the token could not be
+                taken within `timeout`.
+        """
+        with self._locked() as bucket:
+            self._refill(bucket, self._clock())
+            wait = (1 - bucket.tokens) / bucket.rate if bucket.tokens < 1 else 0.0
+            if timeout is not None and wait > timeout:
+                return None
+            # Reserve the token now so concurrent callers queue up behind each other
+            bucket.tokens -= 1
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        """Records a successful response, speeding up after sustained success."""
+        with self._locked() as bucket:
+            bucket.successes += 1
+            if bucket.successes >= self.success_threshold:
+                bucket.successes = 0
+                bucket.rate = min(self.max_rate, bucket.rate + self.increase_step)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """
+        Records a 429 response: slows down and honours `Retry-After`.
+
+        Args:
+            retry_after (float, optional): Seconds the server asked us to wait.
+        """
+        with self._locked() as bucket:
+            self._refill(bucket, self._clock())
+            bucket.successes = 0
+            bucket.rate = max(self.min_rate, bucket.rate * self.decrease_factor)
+            if retry_after:
+                # Push the bucket into debt so nobody gets a token before the delay ends
+                bucket.tokens = min(bucket.tokens, -retry_after * bucket.rate)
+            rate = bucket.rate
+
+        logger.info(f"Rate limited by FBref, slowing down to {rate * 60:.2f} requests/min")
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    Rate limiter whose bucket is shared by every process on the host.
+
+    The bucket lives in a SQLite ledger under the cache root and every update
+    runs in an exclusive transaction, so N workers importing `ligas` together stay
+    within one request budget and all of them slow down when any of them is
+    rate limited. Wall-clock time is used since monotonic clocks are per process.
+
+    Enable it with `Fbref.rate_limiter = SharedRateLimiter()`; `Fbref.use_cache_manager`
+    moves the ledger under the root of the cache manager.
+
+    Args:
+        path (Path): SQLite file holding the ledger, resolved once.
+        name (str): Bucket name, processes sharing a name share a budget.
+        **kwargs: Forwarded to `RateLimiter`.
+    """
+
+    def __init__(
+        self,
+        path: Path = metadata_root / "ratelimit.sqlite",
+        name: str = "fbref",
+        clock: Callable[[], float] = time.time,
+        **kwargs,
+    ) -> None:
+        self.path = Path(path).expanduser().resolve()
+        self.name = name
+        super().__init__(clock=clock, **kwargs)
+
+    @contextmanager
+    def _locked(self) -> Iterator[BucketState]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        try:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS bucket ("
+                "name TEXT PRIMARY KEY, tokens REAL, updated REAL, rate REAL, successes INTEGER)"
+            )
+            # BEGIN IMMEDIATE takes the write lock up front, serializing processes
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT tokens, updated, rate, successes FROM bucket WHERE name = ?",
+                (self.name,),
+            ).fetchone()
+            bucket = BucketState(*row) if row else self._new_state()
+
+            try:
+                yield bucket
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+            connection.execute(
+                "INSERT OR REPLACE INTO bucket VALUES (?, ?, ?, ?, ?)",
+                (self.name, bucket.tokens, bucket.updated, bucket.rate, bucket.successes),
+            )
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
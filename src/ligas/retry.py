@@ -0,0 +1,183 @@
+import time
+import random
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, FrozenSet, Optional, Tuple, Type
+
+import requests
+
+from .exceptions import FbrefCircuitOpenException
+from .logger import logger
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Decides whether a failed request is retried and how long to wait before.
+
+    Delays follow exponential backoff with full jitter: attempt `n` waits a random
+    time between 0 and `min(backoff_cap, backoff_base * 2 ** (n - 1))` seconds,
+    and never less than the server's `Retry-After`.
+
+    Attributes:
+        max_attempts (int): Total number of attempts, the first one included.
+        backoff_base (float): Base delay in seconds.
+        backoff_cap (float): Maximum delay in seconds.
+        jitter (bool): Randomize delays so parallel workers do not retry in lockstep.
+        retry_statuses (FrozenSet[int]): HTTP statuses considered transient.
+        retry_exceptions (Tuple[Type[Exception], ...]): Errors considered transient.
+    """
+
+    max_attempts: int = 4
+    backoff_base: float = 2.0
+    backoff_cap: float = 120.0
+    jitter: bool = True
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_exceptions: Tuple[Type[Exception], ...] = (
+        requests.ConnectionError,
+        requests.Timeout,
+    )
+
+    def is_transient(
+        self, status: Optional[int], error: Optional[Exception] = None
+    ) -> bool:
+        """Returns True if the outcome of an attempt is worth retrying."""
+        if error is not None:
+            return isinstance(error, self.retry_exceptions)
+        return status in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Returns the seconds to wait after the failed attempt number `attempt`.
+
+        Args:
+            attempt (int): Number of the attempt that just failed, starting at 1.
+            retry_after (float, optional): Delay requested by the server.
+        """
+        backoff = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return max(backoff, retry_after or 0.0)
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker stopping traffic while a site keeps refusing us.
+
+    After `failure_threshold` consecutive failures the circuit of a host opens and
+    every request to it fails fast with `FbrefCircuitOpenException`. Once
+    `reset_timeout` seconds have passed a single trial request is let through
+    (half-open); its success closes the circuit, its failure opens it again.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open the circuit.
+        reset_timeout (float): Seconds the circuit stays open.
+        clock (Callable): Monotonic clock, in seconds.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures: Dict[str, int] = {}
+        self._opened: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def state(self, host: str) -> str:
+        """Returns "closed", "open" or "half-open"."""
+        with self._lock:
+            opened = self._opened.get(host)
+            if opened is None:
+                return "closed"
+            if self._clock() - opened < self.reset_timeout:
+                return "open"
+            return "half-open"
+
+    def before_request(self, host: str) -> None:
+        """
+        Raises `FbrefCircuitOpenException` if requests to `host` are suspended.
+        """
+        with self._lock:
+            opened = self._opened.get(host)
+            if opened is None:
+                return
+            elapsed = self._clock() - opened
+            if elapsed < self.reset_timeout:
+                raise FbrefCircuitOpenException(host, self.reset_timeout - elapsed)
+            # Half-open: let this request through, keep others out until it reports
+            self._opened[host] = self._clock()
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._failures.pop(host, None)
+            if self._opened.pop(host, None) is not None:
+                logger.info(f"Circuit to {host} closed")
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if failures >= self.failure_threshold:
+                if host not in self._opened:
+                    logger.error(f"Circuit to {host} opened after {failures} failures")
+                self._opened[host] = self._clock()
+
+
+@dataclass
+class AttemptRecord:
+    """
+    Outcome of a single HTTP attempt.
+
+    Attributes:
+        url (str): Requested URL.
+        attempt (int): Attempt number for this URL, starting at 1.
+        status (int | None): HTTP status, None if no response was received.
+        error (str | None): Name of the exception raised, if any.
+        elapsed (float): Seconds spent on the attempt.
+        delay (float): Seconds waited before the next attempt, 0 if none.
+        timestamp (float): Unix time the attempt finished.
+    """
+
+    url: str
+    attempt: int
+    status: Optional[int]
+    error: Optional[str]
+    elapsed: float
+    delay: float = 0.0
+    timestamp: float = field(default_factory=time.time)
+
+
+class AttemptMetrics:
+    """
+    Thread-safe log of recent attempts with running totals.
+
+    Args:
+        maxlen (int): Number of recent `AttemptRecord` kept in `history`.
+    """
+
+    def __init__(self, maxlen: int = 1000) -> None:
+        self.history: deque = deque(maxlen=maxlen)
+        self.totals: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, record: AttemptRecord) -> None:
+        with self._lock:
+            self.history.append(record)
+            self.totals["attempts"] += 1
+            if record.attempt > 1:
+                self.totals["retries"] += 1
+            if record.error is not None:
+                self.totals[f"error {record.error}"] += 1
+            else:
+                self.totals[f"status {record.status}"] += 1
+
+    def summary(self) -> dict:
+        """Returns the running totals as a plain dictionary."""
+        with self._lock:
+            return dict(self.totals)
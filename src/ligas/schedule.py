@@ -0,0 +1,181 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, ClassVar, List, Optional, Sequence
+
+import numpy as np
+from bs4 import Tag
+
+from .parsing import Schema, attr, extract_rows, href, link_text, split_link_text, text
+
+MATCH_REPORT = "Match Report"
+HEAD_TO_HEAD = "Head-to-Head"
+
+
+@dataclass
+class ScheduleTable:
+    """
+    Every match of a league season, parsed once from its Scores and Fixtures page.
+
+    `Fixtures`, `MatchReport`, `HeadHead`, `Matches` and the `*ByTeam` endpoints
+    are views over the same table: played matches (with a match report), upcoming
+    ones (with a head-to-head preview), those of a date or of a team. The table is
+    cached per league and season, so calling several of them for the same season
+    costs a single fetch and a single parse.
+
+    Attributes:
+        league (str): The league, e.g. "Serie A".
+        year (str): The season, e.g. "2023-2024".
+        rows (List[dict]): One flat record per match, see `FIELDS`.
+    """
+
+    league: str
+    year: str
+    rows: List[dict] = field(default_factory=list)
+
+    # Flat record kept for each match; links are completed with the base URL
+    FIELDS: ClassVar[Schema] = {
+        "report": text("match_report"),
+        "match link": href("date"),
+        "match-date": text("date"),
+        "data-venue-time": attr("start_time", "data-venue-time"),
+        "kickoff": attr("start_time", "data-venue-epoch"),
+        "referee": text("referee"),
+        "home xg": text("home_xg"),
+        "away xg": text("away_xg"),
+        "home link": href("home_team"),
+        "away link": href("away_team"),
+        "home score": split_link_text("score", "–", 0),
+        "away score": split_link_text("score", "–", 1),
+        "Attendance": text("attendance"),
+        "venue": text("venue"),
+        "home": link_text("home_team"),
+        "away": link_text("away_team"),
+    }
+
+    @classmethod
+    def parse(cls, table: Tag, league: str, year: str, baseurl: str) -> "ScheduleTable":
+        """
+        Builds the table from the `<table>` of a Scores and Fixtures page.
+
+        Rows without a match report cell (spacers, repeated headers) are skipped.
+
+        Args:
+            table (Tag): The schedule table.
+            league (str): The league of the schedule.
+            year (str): The season of the schedule.
+            baseurl (str): Prefix of the match and team links.
+        """
+        rows = extract_rows(
+            table.find_all("tr"),
+            cls.FIELDS,
+            where=lambda cells: cells.get("match_report") is not None
+            and cells["match_report"].name == "td",
+        )
+        for row in rows:
+            for key in ("match link", "home link", "away link"):
+                if isinstance(row[key], str):
+                    row[key] = baseurl + row[key]
+        return cls(league=league, year=year, rows=rows)
+
+    def kickoffs(self) -> List[float]:
+        """
+        Returns the kickoff time of every match as a unix timestamp, sorted.
+
+        FBref gives the kickoff as an epoch; when it is missing, the date and the
+        venue time are read as UTC, and matches without a date are left out.
+        """
+        kickoffs = []
+        for row in self.rows:
+            epoch = row.get("kickoff")
+            if isinstance(epoch, str) and epoch.isdigit():
+                kickoffs.append(float(epoch))
+                continue
+            date, time = row["match-date"], row["data-venue-time"]
+            if not isinstance(date, str) or not date:
+                continue
+            moment = f"{date} {time if isinstance(time, str) and time else '00:00'}"
+            try:
+                kickoff = datetime.strptime(moment, "%Y-%m-%d %H:%M")
+            except ValueError:
+                continue
+            kickoffs.append(kickoff.replace(tzinfo=timezone.utc).timestamp())
+        return sorted(kickoffs)
+
+    def select(
+        self,
+        reports: Sequence[str] = (MATCH_REPORT, HEAD_TO_HEAD),
+        date: Optional[str] = None,
+        team: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        Returns the records of the matches whose report link is one of `reports`,
+        optionally played on `date` or by `team`.
+        """
+        return [
+            row
+            for row in self.rows
+            if any(report in row["report"] for report in reports)
+            and (date is None or row["match-date"] == date)
+            and (team is None or team in (row["home"], row["away"]))
+        ]
+
+    def matches(
+        self,
+        reports: Sequence[str] = (MATCH_REPORT, HEAD_TO_HEAD),
+        date: Optional[str] = None,
+        team: Optional[str] = None,
+        xg: bool = True,
+        attendance_first: bool = False,
+        team_stats: Optional[Callable[[str], Any]] = None,
+    ) -> List[dict]:
+        """
+        Returns the selected matches in the format of the fixture endpoints.
+
+        Args:
+            reports, date, team: Select the matches, see `select`.
+            xg (bool): Include the expected goals of both teams.
+            attendance_first (bool): Place "Attendance" before "score".
+            team_stats (Callable, optional): Called with each team name to add its
+                "team stats", e.g. `lambda team: Fbref.TeamInfos(team, league)`.
+        """
+        return [
+            self.format(row, xg, attendance_first, team_stats)
+            for row in self.select(reports, date, team)
+        ]
+
+    @staticmethod
+    def format(
+        row: dict,
+        xg: bool = True,
+        attendance_first: bool = False,
+        team_stats: Optional[Callable[[str], Any]] = None,
+    ) -> dict:
+        """Nests the flat record of a match into the dictionary returned to users."""
+
+        def side(name: str) -> dict:
+            stats = {}
+            if xg:
+                stats["xg"] = row[f"{name} xg"]
+            stats["link team stats"] = row[f"{name} link"]
+            if team_stats is not None:
+                team = row[name]
+                stats["team stats"] = team_stats(team) if isinstance(team, str) else np.nan
+            return stats
+
+        match = {
+            "match link": row["match link"],
+            "match-date": row["match-date"],
+            "data-venue-time": row["data-venue-time"],
+            "referee": row["referee"],
+            "stats": {"home": side("home"), "away": side("away")},
+        }
+        score = {"home": row["home score"], "away": row["away score"]}
+        if attendance_first:
+            match["Attendance"] = row["Attendance"]
+            match["score"] = score
+        else:
+            match["score"] = score
+            match["Attendance"] = row["Attendance"]
+        match["venue"] = row["venue"]
+        match["teams"] = {"home": row["home"], "away": row["away"]}
+        return match
@@ -0,0 +1,59 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
+
+from bs4 import BeautifulSoup, Tag
+
+# FBref ships some tables of a page inside HTML comments and renders them with
+# JavaScript; they are read from the comments
+_COMMENT = re.compile(rb"<!--(.*?)-->", re.S)
+_STATS_CLASS = re.compile("stats")
+
+
+def commented_tables(markup: bytes) -> bytes:
+    """Returns the HTML comments of a page that hold tables, joined, or b"" if none do."""
+    comments = (comment.group(1) for comment in _COMMENT.finditer(markup))
+    return b"\n".join(comment for comment in comments if b"<table" in comment)
+
+
+@dataclass
+class TeamPage:
+    """
+    The stats tables of a team page, indexed by id in a single walk of the page.
+
+    `TeamInfos` reads about ten tables from each team page; they are looked up in
+    this index instead of searching the whole document once per table, so the
+    cost of a page grows with its size, not with the number of tables read.
+
+    Attributes:
+        tables (Dict[str, Tag]): Stats tables keyed by id, in page order, followed
+            by the tables found in HTML comments.
+    """
+
+    tables: Dict[str, Tag] = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, soups: Iterable[BeautifulSoup]) -> "TeamPage":
+        """
+        Indexes the stats tables of parsed documents.
+
+        Args:
+            soups (Iterable[BeautifulSoup]): The page, then the tables of its
+                comments, see `commented_tables`.
+        """
+        page = cls()
+        for soup in soups:
+            for table in soup.find_all("table", id=True):
+                if table["id"] not in page.tables and any(
+                    _STATS_CLASS.search(name) for name in table.get("class", [])
+                ):
+                    page.tables[table["id"]] = table
+        return page
+
+    def table(self, pattern: str) -> Optional[Tag]:
+        """
+        Returns the first stats table whose id matches the regular expression
+        `pattern`, e.g. "passing" for "stats_passing_12", or None.
+        """
+        search = re.compile(pattern)
+        return next((table for id_, table in self.tables.items() if search.search(id_)), None)
@@ -0,0 +1,349 @@
+import time
+import random
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .utils import browserHeaders, browser
+from .logger import logger
+
+try:
+    import httpx
+    import h2  # noqa: F401, required by httpx for HTTP/2
+except ImportError:
+    httpx = None
+
+
+class Transport:
+    """
+    Pooled keep-alive HTTP transport shared by every Fbref request.
+
+    A single `requests.Session` is kept for the lifetime of the transport, so the
+    TCP/TLS connection to fbref.com is opened once and reused by every page load.
+    Cookies set by the server and the browser headers chosen at creation time are
+    carried over from one request to the next, which also makes the traffic look
+    like one consistent browser session.
+
+    Args:
+        pool_connections (int): Number of per-host connection pools to keep alive.
+        pool_maxsize (int): Maximum number of connections kept alive per host.
+        connect_timeout (float): Default connect timeout in seconds.
+        read_timeout (float): Default read timeout in seconds.
+        headers (dict, optional): Headers sent with every request. When omitted a
+            random profile is picked from `browserHeaders`.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 30.0,
+        headers: Optional[dict] = None,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+
+        if headers is None:
+            headers = browserHeaders.get(random.choice(browser))
+
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        self._mount()
+
+    def _mount(self) -> None:
+        """Mounts a fresh pooled adapter for both http and https."""
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def configure(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Updates the pool size and default timeouts of the transport.
+
+        Changing the pool size remounts the adapters, so connections that are
+        currently idle are dropped and re-opened on the next request.
+
+        Args:
+            pool_connections (int, optional): Number of per-host pools.
+            pool_maxsize (int, optional): Maximum connections per host.
+            connect_timeout (float, optional): Default connect timeout in seconds.
+            read_timeout (float, optional): Default read timeout in seconds.
+        """
+        if pool_connections is not None or pool_maxsize is not None:
+            self.pool_connections = pool_connections or self.pool_connections
+            self.pool_maxsize = pool_maxsize or self.pool_maxsize
+            self._mount()
+
+        self.timeout = (
+            connect_timeout if connect_timeout is not None else self.timeout[0],
+            read_timeout if read_timeout is not None else self.timeout[1],
+        )
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[dict] = None,
+        proxies: Optional[dict] = None,
+        timeout=None,
+    ) -> requests.Response:
+        """
+        Sends a GET request through the pooled session.
+
+        Args:
+            url (str): The URL to fetch.
+            headers (dict, optional): Extra headers merged over the session headers.
+            proxies (dict, optional): Proxies to use for this request only.
+            timeout (float | tuple, optional): Overrides the default (connect, read) timeout.
+
+        Returns:
+            requests.Response: The server's response.
+        """
+        return self.session.get(
+            url,
+            headers=headers,
+            proxies=proxies,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+
+    def close(self) -> None:
+        """Closes every pooled connection held by the session."""
+        logger.info("Closing HTTP transport")
+        self.session.close()
+
+
+class HTTP2Transport(Transport):
+    """
+    Transport multiplexing requests to fbref.com over one HTTP/2 connection.
+
+    Requires the optional `http2` extra (`pip install ligas[http2]`, which installs
+    `httpx[http2]`). Concurrent requests made from several threads share a single
+    connection instead of opening one each; responses are converted to
+    `requests.Response` and httpx errors to their `requests` equivalents, so the
+    retry, cache and rate limiting code above it is unchanged.
+
+    Requests sent through a proxy (see `ProxyPool`) use one HTTP/2 client per
+    proxy, the `max_proxy_clients` most recently used being kept open. With an
+    httpx too old to take a proxy, they fall back to HTTP/1.1 over the pooled
+    session inherited from `Transport`, with a warning. Servers that do not
+    speak HTTP/2 are talked to in HTTP/1.1.
+
+    Use `make_transport(http2=True)` to fall back to `Transport` automatically
+    when the extra is not installed.
+
+    Args:
+        max_proxy_clients (int): Number of proxied clients kept open.
+        **kwargs: Forwarded to `Transport`.
+    """
+
+    def __init__(self, max_proxy_clients: int = 8, **kwargs) -> None:
+        if httpx is None:
+            raise ImportError("HTTP/2 support requires `pip install ligas[http2]`")
+        self.client = None
+        self.max_proxy_clients = max_proxy_clients
+        self._proxied: "OrderedDict[str, httpx.Client]" = OrderedDict()
+        self._proxied_lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def _client(self, proxy: Optional[str] = None) -> "httpx.Client":
+        """Returns a new HTTP/2 client, sending its requests through `proxy` if given."""
+        options = dict(
+            http2=True,
+            headers=dict(self.session.headers),
+            limits=httpx.Limits(
+                max_connections=self.pool_maxsize,
+                max_keepalive_connections=self.pool_maxsize,
+            ),
+        )
+        if proxy is not None:
+            options["proxy"] = proxy if "://" in proxy else f"http://{proxy}"
+        return httpx.Client(**options)
+
+    def _proxied_client(self, proxy: str) -> Optional["httpx.Client"]:
+        """Returns the client of `proxy`, None if httpx cannot use proxies this way."""
+        with self._proxied_lock:
+            client = self._proxied.get(proxy)
+            if client is not None:
+                self._proxied.move_to_end(proxy)
+                return client
+            try:
+                client = self._client(proxy)
+            except TypeError:
+                logger.warning(
+                    "This httpx version cannot send HTTP/2 requests through a proxy, "
+                    + "falling back to HTTP/1.1"
+                )
+                return None
+            self._proxied[proxy] = client
+            if len(self._proxied) > self.max_proxy_clients:
+                _, oldest = self._proxied.popitem(last=False)
+                oldest.close()
+            return client
+
+    def _close_proxied(self) -> None:
+        with self._proxied_lock:
+            for client in self._proxied.values():
+                client.close()
+            self._proxied.clear()
+
+    def _mount(self) -> None:
+        super()._mount()
+        if self.client is not None:
+            self.client.close()
+            self._close_proxied()
+        self.client = self._client()
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[dict] = None,
+        proxies: Optional[dict] = None,
+        timeout=None,
+    ) -> requests.Response:
+        client = self.client
+        proxy = (proxies or {}).get(urlsplit(url).scheme)
+        if proxy:
+            client = self._proxied_client(proxy)
+            if client is None:
+                return super().get(url, headers=headers, proxies=proxies, timeout=timeout)
+
+        timeout = timeout if timeout is not None else self.timeout
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+
+        start = time.monotonic()
+        try:
+            reply = client.get(url, headers=headers, timeout=timeout)
+        except httpx.TimeoutException as error:
+            raise requests.Timeout(str(error)) from error
+        except httpx.TransportError as error:
+            raise requests.ConnectionError(str(error)) from error
+
+        response = requests.Response()
+        response._content = reply.content
+        response.status_code = reply.status_code
+        response.headers = CaseInsensitiveDict(reply.headers)
+        response.encoding = reply.encoding
+        response.url = str(reply.url)
+        response.elapsed = timedelta(seconds=time.monotonic() - start)
+        response.reason = reply.reason_phrase
+        return response
+
+    def close(self) -> None:
+        super().close()
+        self.client.close()
+        self._close_proxied()
+
+
+def make_transport(http2: bool = False, **kwargs) -> Transport:
+    """
+    Builds the transport used by `Fbref`.
+
+    Args:
+        http2 (bool): Multiplex requests over HTTP/2, proxied ones included. Falls
+            back to HTTP/1.1 with a log message when the optional `http2` extra is
+            not installed, and for proxied requests with a warning when the
+            installed httpx cannot use proxies.
+        **kwargs: Forwarded to the transport, e.g. `pool_maxsize`.
+
+    Returns:
+        Transport: An `HTTP2Transport` or a `Transport`.
+
+    eg:
+        Fbref.transport = make_transport(http2=True)
+    """
+    if http2:
+        if httpx is not None:
+            return HTTP2Transport(**kwargs)
+        logger.info("httpx[http2] is not installed, falling back to HTTP/1.1")
+    return Transport(**kwargs)
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls into a single execution.
+
+    While a call for a key is running, other callers asking for the same key wait
+    for it and receive the same result (or exception) instead of running their
+    own. Nothing is cached: once the call completes the next caller runs it again.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        timeout: Optional[float] = None,
+        retry_on: Tuple[Type[BaseException], ...] = (),
+    ) -> Any:
+        """
+        Runs `fn` unless a call for `key` is already in flight, then waits for it.
+
+        Args:
+            key (str): Identifies identical calls, e.g. the requested URL.
+            fn (Callable): The call to run, without arguments.
+            timeout (float, optional): Maximum seconds to wait for a call already in
+                flight. It does not apply to the caller running `fn`.
+            retry_on (Tuple[type, ...]): Errors of a call in flight that are not
+                shared: a waiter receiving one runs (or joins) the call again
+                instead, e.g. errors caused by the budget of the caller who ran it.
+
+        Returns:
+            Any: The result of `fn`, shared by every caller of the same flight.
+
+        Raises:
+            concurrent.futures.TimeoutError: If the call in flight does not complete
+                within `timeout`.
+        """
+        end = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                leader = future is None
+                if leader:
+                    future = self._calls[key] = Future()
+                else:
+                    self.coalesced += 1
+
+            if leader:
+                break
+            try:
+                return future.result(
+                    timeout=max(0.0, end - time.monotonic()) if end is not None else None
+                )
+            except retry_on:
+                continue
+
+        try:
+            result = fn()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
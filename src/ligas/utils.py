@@ -1,6 +1,7 @@
 import json
 import os
 import shutil
+import sys
 from pathlib import Path
 from  datetime import datetime, timezone, timedelta
 from typing import Any
@@ -14,9 +15,9 @@ import requests
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
-from bs4 import BeautifulSoup
 import random
 from io import StringIO
+from .parsing import make_soup
 from .logger import logger
 
 
@@ -112,46 +113,30 @@ def load_bin(path):
     logger.info(f"binary file loaded from: {path}")
     return data
 
-@ensure_annotations
-def get_cache_directory(cache_delta_days : int) -> Path:
-    """Returns the path of the directory for today's date.
-        Removes directories older than `cache_delta_days`.
-    
-    Args:
-        cache_delta_days (int): cache duration days
+def default_cache_root() -> Path:
+    """Returns the directory ligas persists its files to between runs.
+
+    `LIGAS_CACHE_DIR` overrides it; otherwise the platform's user cache
+    directory is used, so the location does not depend on the working directory.
 
     Returns:
-         path (Path): path of the directory
+        Path: absolute cache root
     """
-    today_date = datetime.now().strftime("%Y-%m-%d")
-    # The root directory where subdirectories are created
-    base_directory = Path(".") 
-    directory = base_directory / os.path.join("ligas/metadata/",today_date)
-
-    # Remove directories older than `cache_duration_days`
-    expiration_date = datetime.now() - timedelta(days= cache_delta_days)
-    for folder in base_directory.iterdir():
-        if folder.is_dir():
-            try:
-                folder_date = datetime.strptime(folder.name, "%Y-%m-%d")
-                if folder_date < expiration_date:
-                    logger.info(f"Deleting expired directory: {folder}")
-                    for file in folder.iterdir():
-                        # Delete each file in the directory
-                        file.unlink()  
-                    # Delete the directory
-                    folder.rmdir()
-            except ValueError:
-                continue  
-             
-    # Create today's directory if it doesn't exist
-    if not directory.exists():
-        directory.mkdir(parents=True)
-        logger.info(f"Directory '{today_date}' has been created.")
-    else:
-        logger.info(f"Directory '{today_date}' already exists.")
-
-    return directory
+    override = os.environ.get("LIGAS_CACHE_DIR")
+    if override:
+        return Path(override).expanduser().resolve()
+    if os.name == "nt":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+        return (base / "ligas" / "Cache").resolve()
+    if sys.platform == "darwin":
+        return (Path.home() / "Library" / "Caches" / "ligas").resolve()
+    base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return (base.expanduser() / "ligas").resolve()
+
+
+# Root directory holding every file ligas persists between runs
+metadata_root = default_cache_root()
+
 
 @ensure_annotations
 def get_size(path: Path) -> str:
@@ -247,7 +232,7 @@ def get_proxy_():
     try:
         response = requests.get("https://free-proxy-list.net/")
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = make_soup(response.content)
         table = soup.find("table")
         proxiesDf = pd.read_html(StringIO(str(table)))[0].fillna("-")
         proxies = list(proxiesDf["IP Address"] + ":" + proxiesDf["Port"].astype(str))
@@ -279,36 +264,6 @@ def check_proxy_(proxy) -> bool:
 # =============================================== free proxy list net max wait time =================================================================
 
     
-def get_proxy(max_wait_time=10):
-    """
-    Try to obtain a proxy from free-proxy-list.net for a given time.
-    If no proxy is found after max_wait_time seconds, returns None.
-    """
-    start_time = time.time()
-    while time.time() - start_time < max_wait_time:
-        try:
-            response = requests.get("https://free-proxy-list.net/")
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
-            table = soup.find("table")
-            proxiesDf = pd.read_html(StringIO(str(table)))[0].fillna("-")
-            proxies = list(proxiesDf["IP Address"] + ":" + proxiesDf["Port"].astype(str))
-            proxies = sorted(proxies, key=lambda x: random.random())
-
-            logger.info("Searching for a working proxy...")
-            for proxy in proxies:
-                if check_proxy(proxy):
-                    logger.info(f"Proxy found: {proxy}")
-                    return proxy
-
-            logger.info("No working proxies found, retrying in a few seconds...")
-            
-        except requests.RequestException as e:
-            logger.error(f"Error accessing free-proxy-list.net: {e}")
-
-    logger.info("No proxies found within the time limit. Using the default proxy.")
-    return None
-
 def check_proxy(proxy) -> bool:
     """Check if the proxy is working."""
     try:
@@ -322,6 +277,30 @@ def check_proxy(proxy) -> bool:
         return False
 
 
+def fetch_proxy_candidates() -> list:
+    """
+    Downloads the current list of public proxies from free-proxy-list.net
+    without checking them.
+
+    Returns:
+        list: proxies as "ip:port" strings, https-capable ones only. Empty
+            when the list cannot be downloaded.
+    """
+    try:
+        response = requests.get("https://free-proxy-list.net/", timeout=20)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logger.error(f"Error accessing free-proxy-list.net: {e}")
+        return []
+
+    soup = make_soup(response.content)
+    table = soup.find("table")
+    proxiesDf = pd.read_html(StringIO(str(table)))[0].fillna("-")
+    if "Https" in proxiesDf.columns:
+        proxiesDf = proxiesDf[proxiesDf["Https"] == "yes"]
+    return list(proxiesDf["IP Address"] + ":" + proxiesDf["Port"].astype(str))
+
+
 # =============================================== Compositions =======================================================
 
 compositions = {
@@ -1 +1,19 @@
-from .unit_test import testLigasfbrefApi
\ No newline at end of file
+from .unit_test import testLigasfbrefApi
+from .transport_test import testLigasTransport, testLigasSingleFlight
+from .proxy_pool_test import testLigasProxyPool
+from .rate_limiter_test import testLigasRateLimiter
+from .retry_test import testLigasRetry
+from .async_fbref_test import testLigasAsyncFbref
+from .fetch_many_test import testLigasFetchMany
+from .page_cache_test import testLigasPageCache
+from .hedging_test import testLigasHedging
+from .deadline_test import testLigasDeadline
+from .parser_test import testLigasParser
+from .schedule_test import testLigasSchedule
+from .history_test import testLigasHistory
+from .team_page_test import testLigasTeamPage
+from .memory_cache_test import testLigasMemoryCache
+from .cache_manager_test import testLigasCacheManager
+from .cache_policy_test import testLigasCachePolicy
+from .stale_cache_test import testLigasStaleCache
+from .cache_format_test import testLigasCacheFormat
\ No newline at end of file
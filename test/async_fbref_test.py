@@ -0,0 +1,113 @@
+import time
+import asyncio
+import inspect
+import threading
+import unittest
+from unittest import mock
+
+from ligas import AsyncFbref, Fbref
+
+
+class testLigasAsyncFbref(unittest.TestCase):
+    def test_every_endpoint_is_mirrored(self):
+        endpoints = [
+            name
+            for name, member in vars(Fbref).items()
+            if isinstance(member, classmethod)
+            and hasattr(member.__func__, "__wrapped__")
+            and not name.startswith("_")
+        ]
+
+        for name in endpoints:
+            self.assertTrue(inspect.iscoroutinefunction(getattr(AsyncFbref, name)), name)
+
+    def test_calls_run_concurrently_within_the_bound(self):
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        def fake_top_scorers(league):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return {"league": league}
+
+        async def main():
+            async with AsyncFbref(max_concurrency=2) as fbref:
+                return await asyncio.gather(
+                    *(fbref.TopScorers(f"league {i}") for i in range(6))
+                )
+
+        with mock.patch.object(Fbref, "TopScorers", fake_top_scorers):
+            results = asyncio.run(main())
+
+        self.assertEqual(results[3], {"league": "league 3"})
+        self.assertEqual(peak[0], 2)
+
+    def test_close_does_not_block_the_event_loop(self):
+        release = threading.Event()
+        ticks = []
+
+        def slow_top_scorers(league):
+            # Released by the ticker, unless close() blocks the loop
+            return {"released": release.wait(1)}
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+            release.set()
+
+        async def main():
+            fbref = AsyncFbref(max_concurrency=1)
+            call = asyncio.ensure_future(fbref.TopScorers("Serie A"))
+            await asyncio.sleep(0.01)
+            await asyncio.gather(fbref.close(), ticker())
+            return await call
+
+        with mock.patch.object(Fbref, "TopScorers", slow_top_scorers):
+            result = asyncio.run(main())
+
+        self.assertEqual(result, {"released": True})
+        self.assertEqual(len(ticks), 3)
+
+    def test_http2_transport_is_kept_per_client(self):
+        shared = Fbref.transport
+        transport = mock.Mock(pool_maxsize=10)
+
+        async def main():
+            async with AsyncFbref(http2=True) as fbref:
+                self.assertIs(fbref.client.transport, transport)
+                self.assertIs(Fbref.transport, shared)
+                return await fbref.TopScorers("Serie A")
+
+        top_scorers = classmethod(lambda cls, league: cls.transport)
+        with mock.patch("ligas.async_fbref.make_transport", return_value=transport):
+            with mock.patch.object(Fbref, "TopScorers", top_scorers):
+                result = asyncio.run(main())
+
+        self.assertIs(result, transport)
+        self.assertIs(Fbref.transport, shared)
+        transport.close.assert_called_once_with()
+
+    def test_keyword_arguments_are_forwarded(self):
+        calls = []
+
+        def fake_team_infos(team, league, **kwargs):
+            calls.append((team, league, kwargs))
+            return {}
+
+        async def main():
+            async with AsyncFbref() as fbref:
+                await fbref.TeamInfos("Inter", "Serie A", timeout=5, with_status=True)
+
+        with mock.patch.object(Fbref, "TeamInfos", fake_team_infos):
+            asyncio.run(main())
+
+        self.assertEqual(calls, [("Inter", "Serie A", {"timeout": 5, "with_status": True})])
+
+
+if __name__ == "__main__":
+    unittest.main()
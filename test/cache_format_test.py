@@ -0,0 +1,104 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+from ligas.cache_format import (
+    CACHE_SUFFIX,
+    MAGIC,
+    SCHEMA_VERSION,
+    available_codecs,
+    compress,
+    read_entry,
+    read_header,
+    write_entry,
+)
+from ligas.cache_policy import CacheEntry
+from ligas.schedule import ScheduleTable
+
+
+def team_stats() -> dict:
+    players = pd.DataFrame(
+        {
+            "Player": [f"Player {i}" for i in range(30)],
+            "Pos": ["FW", "MF", "DF"] * 10,
+            "MP": np.arange(30),
+            "xG": np.linspace(0, 3, 30),
+        }
+    )
+    players.attrs["team"] = "Inter"
+    over = pd.DataFrame(
+        [[1, 2.5, "-"], [3, 4.0, "x"]],
+        columns=pd.MultiIndex.from_tuples(
+            [("", "Player"), ("Performance", "Gls"), ("Performance", "Gls")]
+        ),
+    )
+    return {"rank": 1, "current stats": {"players": players, "keeper": over}, "previous stats": {}}
+
+
+class testLigasCacheFormat(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / f"TeamInfos{CACHE_SUFFIX}"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_with_every_codec(self):
+        data = team_stats()
+        table = ScheduleTable("Serie A", "2024-2025", [{"home": "Inter", "kickoff": np.nan}])
+        for codec in available_codecs():
+            with self.subTest(codec=codec):
+                write_entry(CacheEntry([data, table], 1e9, 5.0), self.path, codec)
+                entry = read_entry(self.path)
+
+                self.assertEqual((entry.expires, entry.created), (1e9, 5.0))
+                loaded, schedule = entry.data
+                for name in ("players", "keeper"):
+                    pd.testing.assert_frame_equal(
+                        loaded["current stats"][name], data["current stats"][name]
+                    )
+                self.assertEqual(loaded["current stats"]["players"].attrs, {"team": "Inter"})
+                self.assertEqual(schedule.rows[0]["home"], "Inter")
+                self.assertEqual(read_header(self.path)["codec"], codec)
+
+    def test_entries_are_smaller_than_joblib_pickles(self):
+        data = team_stats()
+        write_entry(CacheEntry(data), self.path)
+        legacy = Path(self.tmp.name) / "legacy.json"
+        joblib.dump(data, legacy)
+        self.assertLess(self.path.stat().st_size, legacy.stat().st_size)
+
+    def test_other_versions_and_corrupted_entries_are_ignored(self):
+        write_entry(CacheEntry({"a": 1}), self.path)
+        with mock.patch("ligas.cache_format.SCHEMA_VERSION", SCHEMA_VERSION + 1):
+            self.assertIsNone(read_entry(self.path))
+            self.assertIsNone(read_header(self.path))
+
+        content = self.path.read_bytes()
+        self.path.write_bytes(content[:-4])
+        self.assertIsNone(read_entry(self.path))
+        self.assertIsNotNone(read_header(self.path))
+
+        joblib.dump({"a": 1}, self.path)
+        self.assertIsNone(read_entry(self.path))
+        self.assertIsNone(read_entry(self.path.with_name("missing")))
+
+    def test_failed_write_keeps_the_previous_entry(self):
+        write_entry(CacheEntry({"a": 1}), self.path)
+        with mock.patch("ligas.cache_format.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                write_entry(CacheEntry({"a": 2}), self.path)
+
+        self.assertEqual(read_entry(self.path).data, {"a": 1})
+        self.assertEqual([p.name for p in self.path.parent.iterdir()], [self.path.name])
+        self.assertTrue(self.path.read_bytes().startswith(MAGIC))
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            compress(b"", "brotli")
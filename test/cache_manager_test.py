@@ -0,0 +1,166 @@
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+from ligas import Fbref
+from ligas.cache_format import CACHE_SUFFIX, write_entry
+from ligas.cache_manager import CacheManager, DATE_FORMAT
+from ligas.cache_policy import CacheEntry
+from ligas.proxy_pool import ProxyPool
+from ligas.rate_limiter import SharedRateLimiter
+from ligas.utils import default_cache_root
+
+from .fakes import make_response
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def day(offset: int) -> str:
+    return (datetime.now() + timedelta(days=offset)).strftime(DATE_FORMAT)
+
+
+class testLigasCacheManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name) / "metadata"
+        self.clock = FakeClock()
+        self.manager = CacheManager(
+            self.root, duration_days=3, janitor_interval=60, clock=self.clock
+        )
+
+    def tearDown(self):
+        if self.manager._janitor is not None:
+            self.manager._janitor.join()
+        self.tmp.cleanup()
+
+    def test_results_directory_is_created_once(self):
+        path = self.manager.path("entry.json")
+        self.assertEqual(path, self.root.resolve() / "results" / "entry.json")
+        self.assertTrue(path.parent.is_dir())
+
+        # Later lookups only build the path
+        path.parent.rmdir()
+        self.assertEqual(self.manager.path("entry.json"), path)
+        self.assertFalse(path.parent.exists())
+
+    def test_root_is_resolved_once(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as here:
+            os.chdir(here)
+            try:
+                manager = CacheManager("ligas/metadata")
+                os.chdir(self.tmp.name)
+                self.assertEqual(manager.root, Path(here).resolve() / "ligas/metadata")
+            finally:
+                os.chdir(cwd)
+
+    def test_default_root_does_not_depend_on_cwd(self):
+        with mock.patch.dict(os.environ, {"LIGAS_CACHE_DIR": self.tmp.name}):
+            self.assertEqual(default_cache_root(), Path(self.tmp.name).resolve())
+
+        env = {k: v for k, v in os.environ.items() if k != "LIGAS_CACHE_DIR"}
+        env["XDG_CACHE_HOME"] = self.tmp.name
+        cwd = os.getcwd()
+        with mock.patch.dict(os.environ, env, clear=True):
+            try:
+                os.chdir(self.tmp.name)
+                first = default_cache_root()
+                os.chdir(cwd)
+                self.assertEqual(default_cache_root(), first)
+            finally:
+                os.chdir(cwd)
+        self.assertTrue(first.is_absolute())
+
+    def test_purge_deletes_only_expired_days(self):
+        for name in [day(-10), day(-4), day(-1), "pages"]:
+            (self.root / name).mkdir(parents=True)
+            (self.root / name / "entry.json").write_text("{}")
+
+        self.assertEqual(self.manager.purge(), 2)
+        self.assertEqual(sorted(p.name for p in self.root.iterdir()), sorted([day(-1), "pages"]))
+
+    def test_purge_deletes_unreadable_entries(self):
+        results = self.root / "results"
+        write_entry(CacheEntry({"a": 1}), results / f"kept{CACHE_SUFFIX}")
+        write_entry(CacheEntry({"a": 1}), results / f"old{CACHE_SUFFIX}")
+        (results / "legacy.json").write_bytes(b"joblib")
+        (results / "write.tmp").write_bytes(b"")
+        (results / "crashed.tmp").write_bytes(b"")
+        os.utime(results / "crashed.tmp", (0, 0))
+
+        with mock.patch("ligas.cache_format.SCHEMA_VERSION", 0):
+            write_entry(CacheEntry({"a": 0}), results / f"old{CACHE_SUFFIX}")
+
+        self.assertEqual(self.manager.purge(), 3)
+        self.assertEqual(
+            sorted(p.name for p in results.iterdir()), [f"kept{CACHE_SUFFIX}", "write.tmp"]
+        )
+
+    def test_purge_deletes_entries_past_the_stale_window(self):
+        manager = CacheManager(self.root, max_stale=3600)
+        results = self.root / "results"
+        now = time.time()
+        write_entry(CacheEntry({"a": 1}), results / f"forever{CACHE_SUFFIX}")
+        write_entry(CacheEntry({"a": 1}, now - 60), results / f"stale{CACHE_SUFFIX}")
+        write_entry(CacheEntry({"a": 1}, now - 7200), results / f"gone{CACHE_SUFFIX}")
+
+        self.assertEqual(manager.purge(), 1)
+        self.assertEqual(
+            sorted(p.name for p in results.iterdir()),
+            [f"forever{CACHE_SUFFIX}", f"stale{CACHE_SUFFIX}"],
+        )
+
+        manager.max_stale = None
+        write_entry(CacheEntry({"a": 1}, now - 7200), results / f"gone{CACHE_SUFFIX}")
+        self.assertEqual(manager.purge(), 0)
+
+    def test_purge_deletes_expired_pages(self):
+        manager = CacheManager(self.root, page_ttl=60)
+        self.assertEqual(manager.page_cache.root, self.root.resolve() / "pages")
+        manager.page_cache.put("https://fbref.com/old", make_response())
+        manager.page_cache.put("https://fbref.com/new", make_response())
+        old = manager.page_cache.path("https://fbref.com/old")
+        os.utime(old, (0, 0))
+
+        self.assertEqual(manager.purge(), 1)
+        self.assertFalse(old.exists())
+        self.assertIsNotNone(manager.page_cache.get("https://fbref.com/new"))
+
+    def test_fbref_keeps_its_files_under_the_manager_root(self):
+        manager = CacheManager(self.root)
+        limiter = SharedRateLimiter(path=Path(self.tmp.name) / "elsewhere.sqlite")
+        with mock.patch.multiple(
+            Fbref,
+            cache_manager=Fbref.cache_manager,
+            page_cache=Fbref.page_cache,
+            proxy_pool=ProxyPool(),
+            rate_limiter=limiter,
+        ):
+            Fbref.use_cache_manager(manager)
+
+            self.assertIs(Fbref.cache_manager, manager)
+            self.assertIs(Fbref.page_cache, manager.page_cache)
+            self.assertEqual(Fbref.proxy_pool.path, self.root.resolve() / "proxies.json")
+            self.assertEqual(limiter.path, self.root.resolve() / "ratelimit.sqlite")
+
+    def test_janitor_runs_in_background_once_per_interval(self):
+        with mock.patch.object(CacheManager, "purge") as purge:
+            self.manager.path("entry.json")
+            self.manager._janitor.join()
+            self.manager.path("entry.json")
+            self.assertEqual(purge.call_count, 1)
+
+            self.clock.now = 61
+            self.manager.path("entry.json")
+            self.manager._janitor.join()
+            self.assertEqual(purge.call_count, 2)
@@ -0,0 +1,131 @@
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+from ligas import Fbref
+from ligas.cache_format import read_entry
+from ligas.cache_policy import CacheEntry, CachePolicy
+from ligas.schedule import ScheduleTable
+
+from .pages import FakeSite, LEAGUE, PREVIOUS
+
+HOUR = 3600.0
+# 2024-10-01 12:00 UTC, during the 2024-2025 season
+NOW = datetime(2024, 10, 1, 12, tzinfo=timezone.utc).timestamp()
+
+
+def schedule(*kickoffs: float) -> ScheduleTable:
+    rows = [
+        {"kickoff": str(int(kickoff)), "match-date": "", "data-venue-time": ""}
+        for kickoff in kickoffs
+    ]
+    return ScheduleTable("Serie A", "2024-2025", rows)
+
+
+class testLigasCachePolicy(unittest.TestCase):
+    def setUp(self):
+        self.policy = CachePolicy(clock=lambda: NOW)
+
+    def expires(self, name, arguments, data=None, table=None):
+        return self.policy.expires(name, arguments, data, lambda year, league: table)
+
+    def test_completed_seasons_never_expire(self):
+        self.assertTrue(self.policy.completed("2023-2024"))
+        self.assertFalse(self.policy.completed("2024-2025"))
+        self.assertIsNone(self.expires("Fixtures", {"year": "2023-2024", "league": LEAGUE}))
+        self.assertIsNone(
+            self.expires("TopScorer", {"league": LEAGUE, "currentSeason": "2022-2023"})
+        )
+
+    def test_calendar_year_seasons(self):
+        self.assertTrue(self.policy.completed("2023"))
+        self.assertFalse(self.policy.completed("2024"))
+        self.assertIsNone(self.expires("Fixtures", {"year": "2022", "league": "World Cup"}))
+        self.assertEqual(
+            self.expires("Fixtures", {"year": "2024", "league": "MLS"}), NOW + 24 * HOUR
+        )
+
+    def test_history_expires(self):
+        self.assertEqual(self.expires("get_valid_seasons", {"league": LEAGUE}), NOW + 24 * HOUR)
+
+        # During the season, once the next match is over
+        table = schedule(NOW - HOUR, NOW + 2 * HOUR)
+        self.assertEqual(
+            self.expires("TopScorers", {"league": LEAGUE}, table=table), NOW + 1.5 * HOUR
+        )
+        current = {"league": LEAGUE, "currentSeason": "2024-2025"}
+        self.assertEqual(self.expires("TopScorer", current, table=table), NOW + 1.5 * HOUR)
+        # Between seasons, after `history_ttl`
+        self.assertEqual(
+            self.expires("_history", {"league": LEAGUE}, table=schedule(NOW - 30 * HOUR)),
+            NOW + 24 * HOUR,
+        )
+
+    def test_history_expiry_is_configurable(self):
+        self.policy.history_ttl = HOUR
+        self.assertEqual(self.expires("TopScorers", {"league": LEAGUE}), NOW + HOUR)
+        self.policy.history_ttl = None
+        self.assertIsNone(self.expires("get_valid_seasons", {"league": LEAGUE}))
+
+    def test_current_season_expires_after_the_next_match(self):
+        table = schedule(NOW - 3 * HOUR, NOW - HOUR, NOW + 2 * HOUR, NOW + 30 * HOUR)
+        current = {"year": "2024-2025", "league": LEAGUE}
+
+        # The match that kicked off an hour ago is over in 1.5 hours
+        self.assertEqual(self.expires("_schedule", current, table), NOW + 1.5 * HOUR)
+        self.assertEqual(self.expires("Fixtures", current, table=table), NOW + 1.5 * HOUR)
+        self.assertEqual(
+            self.expires("TeamsInfos", {"league": LEAGUE}, table=table), NOW + 1.5 * HOUR
+        )
+
+    def test_current_season_bounds(self):
+        self.assertEqual(
+            self.expires("_schedule", {"year": "2024-2025"}, schedule(NOW - 2.4 * HOUR)),
+            NOW + self.policy.min_ttl,
+        )
+        self.assertEqual(
+            self.expires("_schedule", {"year": "2024-2025"}, schedule(NOW + 30 * 24 * HOUR)),
+            NOW + self.policy.max_ttl,
+        )
+
+    def test_default_without_schedule(self):
+        self.assertEqual(self.expires("TeamsInfos", {"league": LEAGUE}), NOW + 24 * HOUR)
+
+    def test_kickoffs_fall_back_on_date_and_venue_time(self):
+        table = ScheduleTable(
+            "Serie A",
+            "2024-2025",
+            [
+                {"kickoff": float("nan"), "match-date": "2024-10-01", "data-venue-time": "18:30"},
+                {"kickoff": float("nan"), "match-date": "", "data-venue-time": ""},
+            ],
+        )
+        self.assertEqual(table.kickoffs(), [NOW + 6.5 * HOUR])
+
+    def test_cache_data_refetches_expired_entries_only(self):
+        site = FakeSite()
+        policy = CachePolicy(clock=lambda: NOW)
+        with tempfile.TemporaryDirectory() as root, mock.patch.multiple(
+            Fbref,
+            _get=site.get,
+            _cache_path=lambda name, args, kwargs: Path(root) / f"{name}_{args}_{kwargs}",
+            result_cache=None,
+            cache_policy=policy,
+        ):
+            Fbref.Fixtures(PREVIOUS, LEAGUE)
+            entry = read_entry(Path(root) / f"_schedule_{(PREVIOUS, LEAGUE)}_{{}}")
+            self.assertIsInstance(entry, CacheEntry)
+            self.assertIsNotNone(entry.expires)
+
+            Fbref.Fixtures(PREVIOUS, LEAGUE)
+            self.assertEqual(len(site.requested), 2)
+
+            # Once the season is over, it is fetched again and then kept for good,
+            # along with the league history, which has expired too
+            policy._clock = lambda: datetime(2100, 1, 1, tzinfo=timezone.utc).timestamp()
+            Fbref.Fixtures(PREVIOUS, LEAGUE)
+            self.assertEqual(len(site.requested), 4)
+            entry = read_entry(Path(root) / f"Fixtures_{(PREVIOUS, LEAGUE)}_{{}}")
+            self.assertIsNone(entry.expires)
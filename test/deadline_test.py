@@ -0,0 +1,102 @@
+import time
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+import requests
+
+from ligas import Fbref
+from ligas.deadline import Deadline, current_deadline, deadline_scope
+from ligas.exceptions import FbrefTimeoutException
+from ligas.memory_cache import MemoryCache
+from ligas.rate_limiter import RateLimiter
+from ligas.retry import AttemptMetrics, CircuitBreaker, RetryPolicy
+
+from .fakes import FakeTransport
+
+
+class testLigasDeadline(unittest.TestCase):
+    def patch(self, script, rate_limiter=None, **policy):
+        transport = FakeTransport(script)
+        patches = {
+            "transport": transport,
+            "proxy_pool": None,
+            "page_cache": None,
+            "rate_limiter": rate_limiter
+            or RateLimiter(rate=1000, max_rate=1000, capacity=1000),
+            "retry_policy": RetryPolicy(**policy),
+            "circuit_breaker": CircuitBreaker(),
+            "metrics": AttemptMetrics(),
+        }
+        for name, value in patches.items():
+            patcher = mock.patch.object(Fbref, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return transport
+
+    def test_parse_keeps_the_earliest_deadline(self):
+        deadline = Deadline.parse(deadline=time.time() + 60, timeout=5)
+
+        self.assertLessEqual(deadline.remaining(), 5)
+        self.assertIsNone(Deadline.parse())
+
+    def test_nested_scopes_only_tighten_the_deadline(self):
+        with deadline_scope(Deadline.after(5)) as outer:
+            with deadline_scope(Deadline.after(60)) as inner:
+                self.assertIs(inner, outer)
+            with deadline_scope(Deadline.after(1)) as inner:
+                self.assertIs(current_deadline(), inner)
+            self.assertIs(current_deadline(), outer)
+        self.assertIsNone(current_deadline())
+
+    def test_transport_timeout_is_clamped_to_the_budget(self):
+        transport = self.patch([200])
+
+        with deadline_scope(Deadline.after(2)):
+            Fbref._get("https://fbref.com/en/")
+
+        connect, read = transport.calls[0]["timeout"]
+        self.assertLessEqual(connect, 2)
+        self.assertLessEqual(read, 2)
+
+    def test_backoff_longer_than_the_budget_fails_fast(self):
+        transport = self.patch([requests.ConnectionError()], backoff_base=30, jitter=False)
+
+        start = time.monotonic()
+        with deadline_scope(Deadline.after(5)):
+            with pytest.raises(FbrefTimeoutException):
+                Fbref._get("https://fbref.com/en/")
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(len(transport.calls), 1)
+
+    def test_rate_limiter_wait_beyond_the_budget_fails_fast(self):
+        limiter = RateLimiter(rate=0.01, min_rate=0.01, capacity=1)
+        limiter.acquire()
+        transport = self.patch([200], rate_limiter=limiter)
+
+        with deadline_scope(Deadline.after(1)):
+            with pytest.raises(FbrefTimeoutException):
+                Fbref._get("https://fbref.com/en/")
+        self.assertEqual(transport.calls, [])
+
+    def test_endpoint_accepts_timeout_outside_its_cache_key(self):
+        calls = []
+
+        def endpoint(cls, league):
+            calls.append(current_deadline())
+            return {"league": league}
+
+        wrapped = Fbref.cache_data(endpoint)
+        with tempfile.TemporaryDirectory() as root:
+            with mock.patch.object(
+                Fbref, "_cache_path", lambda name, args, kwargs: Path(root) / f"{args}{kwargs}"
+            ), mock.patch.object(Fbref, "result_cache", MemoryCache()):
+                self.assertEqual(wrapped(Fbref, "Serie A", timeout=10), {"league": "Serie A"})
+                self.assertIsNotNone(calls[0])
+
+                with pytest.raises(FbrefTimeoutException):
+                    wrapped(Fbref, "EPL", deadline=time.time() - 1)
+        self.assertEqual(len(calls), 1)
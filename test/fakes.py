@@ -0,0 +1,36 @@
+import threading
+from typing import List, Optional
+
+import requests
+
+
+def make_response(
+    status: int = 200, content: bytes = b"<html></html>", headers: Optional[dict] = None
+) -> requests.Response:
+    """Builds a requests.Response without touching the network"""
+    response = requests.Response()
+    response.status_code = status
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeTransport:
+    """Transport replaying a scripted list of responses or exceptions"""
+
+    def __init__(self, script: List) -> None:
+        self.script = list(script)
+        self.calls: List[dict] = []
+        self.timeout = (10.0, 30.0)
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, proxies=None, timeout=None):
+        with self._lock:
+            self.calls.append({"url": url, "headers": headers, "timeout": timeout})
+            outcome = self.script.pop(0) if len(self.script) > 1 else self.script[0]
+
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, int):
+            return make_response(outcome)
+        return outcome
@@ -0,0 +1,89 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from ligas import Fbref
+from ligas.cache_format import write_entry
+from ligas.cache_policy import CacheEntry
+from ligas.entity_config import FetchTask
+from ligas.memory_cache import MemoryCache
+
+
+class testLigasFetchMany(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.calls = []
+
+        def cache_path(name, args, kwargs):
+            return Path(self.tmp.name) / f"{name}_{'_'.join(args)}.json"
+
+        def fake_endpoint(name):
+            def endpoint(*args):
+                self.calls.append((name, args))
+                return {name: args}
+
+            return endpoint
+
+        patches = [
+            mock.patch.object(Fbref, "_cache_path", cache_path),
+            mock.patch.object(Fbref, "result_cache", MemoryCache()),
+            mock.patch.object(Fbref, "Fixtures", fake_endpoint("Fixtures")),
+            mock.patch.object(Fbref, "TeamsInfos", fake_endpoint("TeamsInfos")),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        super().setUp()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+        super().tearDown()
+
+    def test_identical_tasks_run_once(self):
+        tasks = [
+            ("Fixtures", ("2023-2024", "Serie A")),
+            FetchTask("Fixtures", ("2023-2024", "Serie A")),
+            ("TeamsInfos", ("Serie A",)),
+        ]
+
+        results = list(Fbref.fetch_many(tasks))
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(
+            results[0][1].result(), {results[0][0].endpoint: results[0][0].args}
+        )
+
+    def test_cached_then_priority_order(self):
+        root = Path(self.tmp.name)
+        write_entry(CacheEntry({}), root / "TeamsInfos_EPL.json")
+        # Expired entries are refetched, they are not cached calls
+        write_entry(CacheEntry({}, expires=time.time() - 10), root / "Fixtures_2023-2024_EPL.json")
+        tasks = [
+            FetchTask("Fixtures", ("2023-2024", "EPL"), priority=5),
+            FetchTask("Fixtures", ("2022-2023", "EPL"), priority=1),
+            FetchTask("TeamsInfos", ("EPL",), priority=9),
+        ]
+
+        list(Fbref.fetch_many(tasks, max_workers=1))
+
+        self.assertEqual(
+            self.calls,
+            [
+                ("TeamsInfos", ("EPL",)),
+                ("Fixtures", ("2022-2023", "EPL")),
+                ("Fixtures", ("2023-2024", "EPL")),
+            ],
+        )
+
+    def test_unknown_endpoint(self):
+        with pytest.raises(AttributeError):
+            list(Fbref.fetch_many([("_get", ("https://fbref.com",))]))
+
+
+if __name__ == "__main__":
+    unittest.main()
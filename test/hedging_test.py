@@ -0,0 +1,76 @@
+import time
+import threading
+import unittest
+from unittest import mock
+
+from ligas import Fbref
+from ligas.hedging import HedgePolicy
+from ligas.rate_limiter import RateLimiter
+
+from .fakes import make_response
+
+
+class SlowFirstTransport:
+    """Transport whose first request hangs for `delay` seconds"""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, proxies=None, timeout=None):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        if call == 1:
+            time.sleep(self.delay)
+            return make_response(200, b"slow")
+        return make_response(200, b"fast")
+
+
+class testLigasHedging(unittest.TestCase):
+    def patch(self, transport, policy):
+        patches = {
+            "transport": transport,
+            "proxy_pool": None,
+            "page_cache": None,
+            "hedge_policy": policy,
+            "rate_limiter": RateLimiter(rate=1000, max_rate=1000, capacity=1000),
+        }
+        for name, value in patches.items():
+            patcher = mock.patch.object(Fbref, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_delay_follows_recent_latency(self):
+        policy = HedgePolicy(percentile=50, min_samples=3, min_delay=0)
+
+        self.assertIsNone(policy.delay())
+        for latency in [1, 2, 3]:
+            policy.record(latency)
+        self.assertEqual(policy.delay(), 2)
+
+    def test_slow_request_is_hedged_and_first_answer_wins(self):
+        policy = HedgePolicy(min_samples=3, min_delay=0.05)
+        for _ in range(3):
+            policy.record(0.01)
+        transport = SlowFirstTransport(delay=0.5)
+        self.patch(transport, policy)
+
+        start = time.monotonic()
+        response = Fbref._get("https://fbref.com/en/")
+
+        self.assertEqual(response.content, b"fast")
+        self.assertLess(time.monotonic() - start, 0.4)
+        self.assertEqual((policy.hedged, policy.hedge_wins), (1, 1))
+
+    def test_no_hedging_without_enough_samples(self):
+        policy = HedgePolicy(min_samples=3, min_delay=0.05)
+        self.patch(SlowFirstTransport(delay=0.1), policy)
+
+        self.assertEqual(Fbref._get("https://fbref.com/en/").content, b"slow")
+        self.assertEqual(policy.hedged, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from ligas import Fbref
+from ligas.memory_cache import MemoryCache
+from ligas.exceptions import FbrefInvalidSeasonsException
+from ligas.history import LeagueHistory
+from ligas.parsing import make_soup
+
+from .pages import CURRENT, FakeSite, LEAGUE, PREVIOUS, history_page
+
+
+class testLigasHistory(unittest.TestCase):
+    def setUp(self):
+        rows = make_soup(history_page()).find_all("tr")
+        self.history = LeagueHistory.parse(rows, LEAGUE)
+
+    def test_columns_are_indexed_by_season(self):
+        self.assertEqual(self.history.seasons, [CURRENT, PREVIOUS])
+        self.assertEqual(self.history.index[PREVIOUS], 1)
+        self.assertEqual(
+            self.history.url(PREVIOUS), f"/en/comps/11/{PREVIOUS}/{PREVIOUS}-Serie-A-Stats"
+        )
+        self.assertNotIn("1900-1901", self.history)
+
+    def test_top_scorer_record(self):
+        self.assertEqual(
+            self.history.top_scorer(CURRENT, "https://fbref.com"),
+            {
+                "year": CURRENT,
+                "top_scorer": "Scorer 0",
+                "goals": "24",
+                "stats_link": "https://fbref.com/en/players/0/Scorer-0",
+                "club": "Inter",
+            },
+        )
+
+    def test_history_endpoints_share_one_fetch(self):
+        site = FakeSite()
+        with tempfile.TemporaryDirectory() as root, mock.patch.multiple(
+            Fbref,
+            _get=site.get,
+            _cache_path=lambda name, args, kwargs: Path(root) / f"{name}_{args}_{kwargs}",
+            result_cache=MemoryCache(),
+        ):
+            Fbref.get_valid_seasons(LEAGUE)
+            Fbref.TopScorers(LEAGUE)
+            Fbref.TopScorer(LEAGUE, CURRENT)
+            with pytest.raises(FbrefInvalidSeasonsException):
+                Fbref.TopScorer(LEAGUE, "1900-1901")
+
+        histories = [url for url in site.requested if url.endswith("Serie-A-Seasons")]
+        self.assertEqual(len(histories), 1)
@@ -0,0 +1,117 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ligas import Fbref
+from ligas.cache_format import CACHE_SUFFIX, dump
+from ligas.memory_cache import MISSING, MemoryCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class testLigasMemoryCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = MemoryCache(max_entries=2, max_bytes=100, ttl=60, clock=self.clock)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.put("a", 1, 10)
+        self.cache.put("b", 2, 10)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.cache.put("c", 3, 10)
+
+        self.assertNotIn("b", self.cache)
+        self.assertEqual([self.cache.get(k) for k in "ac"], [1, 3])
+        self.assertEqual(
+            self.cache.summary(),
+            {"hits": 3, "misses": 0, "evictions": 1, "entries": 2, "bytes": 20},
+        )
+
+    def test_size_bound(self):
+        self.cache.put("a", 1, 60)
+        self.cache.put("b", 2, 60)
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.size, 60)
+
+        self.cache.put("huge", 3, 101)
+        self.assertNotIn("huge", self.cache)
+        self.assertIn("b", self.cache)
+
+    def test_entries_expire(self):
+        self.cache.put("a", None, 1)
+        self.assertIsNone(self.cache.get("a", MISSING))
+        self.clock.now = 60
+        self.assertIs(self.cache.get("a", MISSING), MISSING)
+        self.assertEqual(self.cache.summary()["misses"], 1)
+        self.assertEqual(self.cache.size, 0)
+
+    def test_concurrent_use(self):
+        cache = MemoryCache(max_entries=50, max_bytes=10**6)
+
+        def worker(n):
+            for i in range(200):
+                cache.put((n, i % 80), i, 7)
+                cache.get((n, (i * 7) % 80))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(cache), 50)
+        self.assertEqual(cache.size, 50 * 7)
+        summary = cache.summary()
+        self.assertEqual(summary["hits"] + summary["misses"], 8 * 200)
+
+    def test_cache_data_serves_repeated_calls_from_memory(self):
+        calls = []
+
+        def endpoint(cls, league):
+            calls.append(league)
+            return {"league": league}
+
+        wrapped = Fbref.cache_data(endpoint)
+        cache = MemoryCache()
+        with tempfile.TemporaryDirectory() as root, mock.patch.multiple(
+            Fbref,
+            _cache_path=lambda name, args, kwargs: Path(root) / f"{name}_{args}_{kwargs}",
+            result_cache=cache,
+        ):
+            first = wrapped(Fbref, "Serie A")
+            with mock.patch("ligas.fbref.read_entry") as read_entry:
+                self.assertIs(wrapped(Fbref, "Serie A"), first)
+                read_entry.assert_not_called()
+
+            cache.clear()
+            self.assertEqual(wrapped(Fbref, "Serie A"), first)
+
+        self.assertEqual(calls, ["Serie A"])
+        self.assertEqual(cache.summary()["hits"], 1)
+        self.assertEqual(cache.summary()["misses"], 2)
+
+    def test_entries_are_sized_by_their_uncompressed_payload(self):
+        data = {"players": ["player"] * 1000}
+        wrapped = Fbref.cache_data(lambda cls: data)
+        cache = MemoryCache()
+        with tempfile.TemporaryDirectory() as root, mock.patch.multiple(
+            Fbref,
+            _cache_path=lambda name, args, kwargs: Path(root) / f"{name}{CACHE_SUFFIX}",
+            result_cache=cache,
+        ):
+            wrapped(Fbref)
+            self.assertEqual(cache.summary()["bytes"], len(dump(data)))
+            self.assertLess(Path(root, f"<lambda>{CACHE_SUFFIX}").stat().st_size, len(dump(data)))
+
+            # Entries loaded from disk keep the size recorded in their header
+            cache.clear()
+            wrapped(Fbref)
+            self.assertEqual(cache.summary()["bytes"], len(dump(data)))
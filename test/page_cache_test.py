@@ -0,0 +1,168 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ligas import Fbref
+from ligas.cache_format import read_entry, write_entry
+from ligas.cache_policy import CacheEntry, CachePolicy
+from ligas.memory_cache import MemoryCache
+from ligas.page_cache import PageCache, canonical_url
+from ligas.rate_limiter import RateLimiter
+
+from .fakes import FakeTransport, make_response
+
+
+class testLigasPageCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = PageCache(root=Path(self.tmp.name))
+        super().setUp()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+        super().tearDown()
+
+    def test_canonical_url(self):
+        self.assertEqual(
+            canonical_url("HTTPS://FBref.com//en/comps/11/schedule?b=2&a=1#top"),
+            "https://fbref.com/en/comps/11/schedule?a=1&b=2",
+        )
+
+    def test_round_trip_and_expiry(self):
+        page = make_response(200, b"<table></table>", {"Content-Type": "text/html"})
+        self.cache.put("https://fbref.com//en/matches", page)
+
+        cached = self.cache.get("https://fbref.com/en/matches")
+
+        self.assertEqual(cached.content, b"<table></table>")
+        self.assertEqual(cached.headers["content-type"], "text/html")
+
+        self.cache.ttl = 0
+        self.assertIsNone(self.cache.get("https://fbref.com/en/matches"))
+        self.assertEqual(self.cache.purge(), 1)
+
+    def test_errors_are_not_cached(self):
+        self.cache.put("https://fbref.com/en/", make_response(500))
+
+        self.assertIsNone(self.cache.get("https://fbref.com/en/"))
+
+    def patch_fbref(self, transport):
+        patches = {
+            "transport": transport,
+            "proxy_pool": None,
+            "page_cache": self.cache,
+            "rate_limiter": RateLimiter(rate=1000, max_rate=1000, capacity=1000),
+        }
+        for name, value in patches.items():
+            patcher = mock.patch.object(Fbref, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_get_reads_pages_from_disk(self):
+        transport = FakeTransport([make_response(200, b"schedule")])
+        self.patch_fbref(transport)
+
+        for url in ["https://fbref.com//en/schedule", "https://fbref.com/en/schedule"]:
+            self.assertEqual(Fbref._get(url).content, b"schedule")
+
+        self.assertEqual(len(transport.calls), 1)
+
+    def test_expired_pages_are_revalidated(self):
+        url = "https://fbref.com/en/schedule"
+        transport = FakeTransport([make_response(304)])
+        self.patch_fbref(transport)
+        self.cache.put(url, make_response(200, b"schedule", {"ETag": '"v1"'}))
+        self.cache.ttl = 0
+
+        response = Fbref._get(url)
+
+        self.assertEqual(response.content, b"schedule")
+        self.assertEqual(transport.calls[0]["headers"], {"If-None-Match": '"v1"'})
+
+        self.cache.ttl = 60
+        self.assertIsNotNone(self.cache.get(url))
+
+    def test_refreshing_an_expired_result_skips_older_pages(self):
+        url = "https://fbref.com/en/schedule"
+        transport = FakeTransport([make_response(200, b"played")])
+        self.patch_fbref(transport)
+        self.cache.put(url, make_response(200, b"scheduled"))
+        now = time.time()
+        os.utime(self.cache.path(url), (now - 100, now - 100))
+
+        endpoint = Fbref.cache_data(lambda cls: cls._get(url).content)
+        result = Path(self.tmp.name) / "result"
+        with mock.patch.multiple(
+            Fbref,
+            _cache_path=lambda name, args, kwargs: result,
+            result_cache=MemoryCache(),
+            cache_policy=CachePolicy(default_ttl=60),
+        ):
+            # The page was fetched before the result expired: it is fetched again
+            write_entry(CacheEntry(b"scheduled", now - 10, now - 200), result)
+            self.assertEqual(endpoint(Fbref), b"played")
+            self.assertEqual(len(transport.calls), 1)
+
+            # Outside a refresh, the page cache still applies
+            self.assertEqual(Fbref._get(url).content, b"played")
+            self.assertEqual(len(transport.calls), 1)
+
+    def age(self, url, clock):
+        """Expires the result and moves its cached page before the expiry."""
+        clock[0] += 200
+        past = clock[0] - 1000
+        os.utime(self.cache.path(url), (past, past))
+
+    def test_unchanged_pages_renew_an_expired_result_without_parsing(self):
+        url = "https://fbref.com/en/schedule"
+        transport = FakeTransport(
+            [make_response(200, b"schedule", {"ETag": '"v1"'}), make_response(304)]
+        )
+        self.patch_fbref(transport)
+        parsed = []
+
+        def endpoint(cls):
+            content = cls._get(url).content
+            parsed.append(content)
+            return {"schedule": content.decode()}
+
+        wrapped = Fbref.cache_data(endpoint)
+        clock = [time.time() - 200]
+        result = Path(self.tmp.name) / "result"
+        with mock.patch.multiple(
+            Fbref,
+            _cache_path=lambda name, args, kwargs: result,
+            result_cache=None,
+            cache_policy=CachePolicy(default_ttl=60, clock=lambda: clock[0]),
+        ):
+            first = wrapped(Fbref)
+            self.age(url, clock)
+            self.assertEqual(wrapped(Fbref), first)
+
+        self.assertEqual(len(parsed), 1)
+        self.assertEqual(transport.calls[1]["headers"], {"If-None-Match": '"v1"'})
+        self.assertEqual(read_entry(result).expires, clock[0] + 60)
+
+    def test_changed_pages_are_parsed_again(self):
+        url = "https://fbref.com/en/schedule"
+        transport = FakeTransport([make_response(200, b"v1"), make_response(200, b"v2")])
+        self.patch_fbref(transport)
+        wrapped = Fbref.cache_data(lambda cls: cls._get(url).content)
+        clock = [time.time() - 200]
+        with mock.patch.multiple(
+            Fbref,
+            _cache_path=lambda name, args, kwargs: Path(self.tmp.name) / "result",
+            result_cache=None,
+            cache_policy=CachePolicy(default_ttl=60, clock=lambda: clock[0]),
+        ):
+            self.assertEqual(wrapped(Fbref), b"v1")
+            self.age(url, clock)
+            self.assertEqual(wrapped(Fbref), b"v2")
+        self.assertEqual(len(transport.calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,242 @@
+"""Offline copies of the FBref pages parsed by the endpoints, trimmed to a few rows"""
+
+from typing import Dict, List
+
+from ligas.fbref import cuurentYear
+from ligas.page_cache import canonical_url
+
+from .fakes import make_response
+
+LEAGUE = "Serie A"
+CURRENT = f"{cuurentYear}-{cuurentYear + 1}"
+PREVIOUS = f"{cuurentYear - 1}-{cuurentYear}"
+SEASONS = [CURRENT, PREVIOUS]
+
+TEAMS = [
+    ("Inter", "d609edc0"),
+    ("Milan", "dc56fe14"),
+    ("Napoli", "d48ad4ff"),
+]
+
+FIXTURES = [
+    # date, home, away, score, report
+    ("2025-08-23", "Inter", "Milan", "2–1", "Match Report"),
+    ("2025-08-23", "Napoli", "Inter", "0–0", "Match Report"),
+    ("2025-08-30", "Milan", "Napoli", "", "Head-to-Head"),
+]
+
+
+def page(body: str, title: str = "FBref") -> str:
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+        + f"<title>{title}</title></head>\n<body>\n{body}\n</body></html>"
+    )
+
+
+def season_link(year: str) -> str:
+    return f"/en/comps/11/{year}/{year}-Serie-A-Stats"
+
+
+def team_link(name: str, code: str, year: str = "") -> str:
+    return f"/en/squads/{code}/{year + '/' if year else ''}{name}-Stats"
+
+
+def history_page() -> str:
+    rows = "".join(
+        f"""
+<tr>
+  <th scope="row" class="left " data-stat="year_id"><a href="{season_link(year)}">{year}</a></th>
+  <td class="left " data-stat="champ">Inter - 89</td>
+  <td class="left " data-stat="top_scorers"><a href="/en/players/{index}/Scorer-{index}">Scorer {index}</a> - <span>{24 - index}</span></td>
+</tr>"""
+        for index, year in enumerate(SEASONS)
+    )
+    return page(
+        f"""
+<div id="content">
+<table class="stats_table sortable min_width" id="seasons">
+<caption>Serie A Seasons</caption>
+<thead><tr>
+  <th aria-label="Season" data-stat="year_id" scope="col">Season</th>
+  <th data-stat="champ" scope="col">Champion</th>
+  <th data-stat="top_scorers" scope="col">Top Scorer</th>
+</tr></thead>
+<tbody>{rows}
+</tbody>
+</table>
+</div>"""
+    )
+
+
+def season_page(year: str) -> str:
+    rows = "".join(
+        f"""
+<tr>
+  <th scope="row" class="right " data-stat="rank">{rank}</th>
+  <td class="left " data-stat="team"><img src="https://cdn.ssref.net/req/1/tlogo/fb/mini.{code}.png" class="teamlogo" alt="{name} Club Crest">&nbsp;<a href="{team_link(name, code, '' if year == CURRENT else year)}">{name}</a></td>
+  {''.join(f'<td class="right " data-stat="stat{i}">{rank * 10 + i}</td>' for i in range(1, 14))}
+  <td class="left " data-stat="last_5"><div class="poptip">W</div> <div class="poptip">D</div></td>
+  <td class="left " data-stat="attendance_per_g">60,000</td>
+  <td class="left " data-stat="top_team_scorers"><a href="/en/players/{rank}/x">Player {rank}</a> - 10</td>
+  <td class="left " data-stat="top_keeper"><a href="/en/players/{rank}/y">Keeper {rank}</a></td>
+</tr>"""
+        for rank, (name, code) in enumerate(TEAMS, start=1)
+    )
+    return page(
+        f"""
+<div id="meta">
+  <div class="media-item logo"><img class="teamlogo" src="https://cdn.ssref.net/req/1/tlogo/fb/11.png" alt="Serie A Logo"></div>
+  <div>
+    <h1>{year} Serie A Stats</h1>
+    <p><strong>Governing Country:</strong> <a href="/en/country/ITA/Italy-Football">Italy</a></p>
+    <p><strong>Level:</strong> <span>1</span></p>
+    <p><strong>Gender:</strong>
+      Male</p>
+    <p><strong>Most Goals:</strong> <a href="/en/players/1/x">Scorer 0</a> 24</p>
+  </div>
+</div>
+<table class="stats_table sortable min_width force_mobilize" id="results{year}111_overall">
+<thead><tr><th data-stat="rank">Rk</th><th data-stat="team">Squad</th></tr></thead>
+<tbody>{rows}
+</tbody>
+</table>"""
+    )
+
+
+def schedule_page() -> str:
+    rows: List[str] = []
+    for index, (date, home, away, score, report) in enumerate(FIXTURES):
+        if index == 2:
+            rows.append('<tr class="spacer partial_table"><td colspan="14"></td></tr>')
+            rows.append(
+                '<tr class="thead"><th data-stat="gameweek">Wk</th>'
+                + '<th data-stat="date">Date</th></tr>'
+            )
+        score_cell = f'<a href="/en/matches/{index}/report">{score}</a>' if score else ""
+        rows.append(
+            f"""
+<tr>
+  <th scope="row" class="right " data-stat="gameweek">{index + 1}</th>
+  <td class="left " data-stat="dayofweek">Sat</td>
+  <td class="left " data-stat="date" csk="{date.replace('-', '')}"><a href="/en/matches/{date}">{date}</a></td>
+  <td class="right " data-stat="start_time" csk="18:30:00"><span class="venuetime" data-venue-time="18:30" data-venue-epoch="1724430600">18:30</span> <span class="localtime">(18:30)</span></td>
+  <td class="right " data-stat="home_team"><a href="{team_link(home, dict(TEAMS)[home])}">{home}</a></td>
+  <td class="right " data-stat="home_xg">1.{index}</td>
+  <td class="center " data-stat="score">{score_cell}</td>
+  <td class="right " data-stat="away_xg">0.{index}</td>
+  <td class="left " data-stat="away_team"><a href="{team_link(away, dict(TEAMS)[away])}">{away}</a></td>
+  <td class="right " data-stat="attendance">{70000 + index:,}</td>
+  <td class="left " data-stat="venue">Stadio {home}</td>
+  <td class="left " data-stat="referee">Referee {index}</td>
+  <td class="left " data-stat="match_report"><a href="/en/matches/{index}">{report}</a></td>
+  <td class="left iz" data-stat="notes"></td>
+</tr>"""
+        )
+    return page(
+        f"""
+<table class="stats_table sortable min_width" id="sched_{CURRENT}_11_1">
+<caption>Scores &amp; Fixtures Table</caption>
+<thead><tr>
+  <th data-stat="gameweek">Wk</th><th data-stat="date">Date</th><th data-stat="home_team">Home</th>
+  <th data-stat="score">Score</th><th data-stat="away_team">Away</th>
+</tr></thead>
+<tbody>{''.join(rows)}
+</tbody>
+</table>"""
+    )
+
+
+def stats_table(table_id: str, columns: List[str], rows: List[List[str]], over_header: bool = True) -> str:
+    over = (
+        '<tr class="over_header"><th aria-label="" colspan="2"></th>'
+        + f'<th colspan="{len(columns) - 2}" class="over_header center">Performance</th></tr>'
+        if over_header
+        else ""
+    )
+    head = "".join(f'<th scope="col" data-stat="c{i}">{c}</th>' for i, c in enumerate(columns))
+    body = "".join(
+        "<tr>"
+        + f'<th scope="row" class="left " data-stat="player"><a href="/en/players/{i}/p">{row[0]}</a></th>'
+        + "".join(f'<td class="right " data-stat="c{j}">{v}</td>' for j, v in enumerate(row[1:], 1))
+        + "</tr>"
+        for i, row in enumerate(rows)
+    )
+    return (
+        f'<table class="stats_table sortable min_width" id="{table_id}">'
+        + f"<thead>{over}<tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+    )
+
+
+def team_page(name: str) -> str:
+    players = [
+        [f"{name} Forward", "FW", "30", "24", "3"],
+        [f"{name} Keeper", "GK", "", "0", "0"],
+        [f"Jos&eacute; {name}", "MF", "12", "1", "7"],
+    ]
+    columns = ["Player", "Pos", "MP", "Gls", "Ast"]
+    tables = [stats_table("stats_standard_12", columns, players)]
+    tables.append(
+        stats_table(
+            "matchlogs_for",
+            ["Date", "Comp", "Result", "GF", "GA"],
+            [["2025-08-23", "Serie A", "W", "2", "1"], ["2025-08-30", "Serie A", "D", "0", "0"]],
+            over_header=False,
+        )
+    )
+    for category in [
+        "keeper",
+        "passing",
+        "shooting",
+        "passing_types",
+        "gca",
+        "defense",
+        "possession",
+        "playing_time",
+    ]:
+        table = stats_table(f"stats_{category}_12", columns, players)
+        if category == "playing_time":
+            # Shipped in a comment and rendered by JavaScript, as on FBref
+            table = f'<div class="placeholder"></div>\n<!--\n{table}\n-->'
+        tables.append(table)
+    return page("\n".join(tables), title=f"{name} Stats")
+
+
+def site() -> Dict[str, str]:
+    """Returns the HTML served for each canonical URL"""
+    pages = {
+        "https://fbref.com/en/comps/11/history/Serie-A-Seasons": history_page(),
+        "https://fbref.com/en/players/0/Scorer-0": page(
+            stats_table(
+                "scout_summary_FW",
+                ["Statistic", "Per 90", "Percentile"],
+                [["Goals", "0.80", "99"], ["Assists", "0.12", "45"]],
+                over_header=False,
+            ).replace('data-stat="player"', 'data-stat="statistic"')
+            .replace('data-stat="c1"', 'data-stat="per90"')
+            .replace('data-stat="c2"', 'data-stat="percentile"')
+        ),
+    }
+    for year in SEASONS:
+        pages[f"https://fbref.com{season_link(year)}"] = season_page(year)
+        pages[
+            f"https://fbref.com/en/comps/11/{year}/schedule/{year}-Serie-A-Scores-and-Fixtures"
+        ] = schedule_page()
+    for name, code in TEAMS:
+        for year in ["", PREVIOUS]:
+            pages[f"https://fbref.com{team_link(name, code, year)}"] = team_page(name)
+    return {canonical_url(url): html for url, html in pages.items()}
+
+
+class FakeSite:
+    """Serves the offline pages in place of `Fbref._get`"""
+
+    def __init__(self) -> None:
+        self.pages = site()
+        self.requested: List[str] = []
+
+    def get(self, url: str):
+        url = canonical_url(url)
+        self.requested.append(url)
+        if url not in self.pages:
+            raise KeyError(f"No offline page for {url}")
+        return make_response(200, self.pages[url].encode("utf-8"))
@@ -0,0 +1,172 @@
+import math
+from io import StringIO
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from ligas import Fbref
+from ligas.memory_cache import MemoryCache
+from ligas.parsing import (
+    available_parsers,
+    best_parser,
+    css_class,
+    extract_rows,
+    href,
+    link_text,
+    make_soup,
+    row_cells,
+    split_link_text,
+    table_frame,
+    text,
+)
+
+from bs4 import SoupStrainer
+
+from .pages import CURRENT, FakeSite, LEAGUE, PREVIOUS, stats_table
+
+
+def normalize(value):
+    """Turns endpoint results into plain comparable values"""
+    if isinstance(value, pd.DataFrame):
+        return normalize(value.to_dict("split"))
+    if isinstance(value, dict):
+        return {k: normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize(v) for v in value]
+    if hasattr(value, "seasonUrls"):
+        return normalize(value.seasonUrls)
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+ENDPOINTS = [
+    ("get_valid_seasons", (LEAGUE,)),
+    ("LeagueInfos", (PREVIOUS, LEAGUE)),
+    ("TopScorers", (LEAGUE,)),
+    ("TopScorer", (LEAGUE, CURRENT)),
+    ("Fixtures", (PREVIOUS, LEAGUE)),
+    ("MatchReport", (PREVIOUS, LEAGUE)),
+    ("HeadHead", (PREVIOUS, LEAGUE)),
+    ("Matches", ("2025-08-23", PREVIOUS, LEAGUE)),
+    ("TeamsInfos", (LEAGUE,)),
+    ("TeamInfos", ("Inter", LEAGUE)),
+    ("FixturesByTeam", ("Inter", PREVIOUS, LEAGUE)),
+    ("MatchReportByTeam", ("Inter", PREVIOUS, LEAGUE)),
+    ("HeadHeadByTeam", ("Milan", PREVIOUS, LEAGUE)),
+]
+
+
+def run_endpoints(parser: str, **patches) -> dict:
+    """Runs every endpoint against the offline site with `parser`"""
+    with tempfile.TemporaryDirectory() as root, mock.patch.multiple(
+        Fbref,
+        parser=parser,
+        _get=FakeSite().get,
+        _cache_path=lambda name, args, kwargs: Path(root) / f"{name}_{args}_{kwargs}",
+        result_cache=MemoryCache(),
+        **patches,
+    ):
+        return {
+            name: normalize(getattr(Fbref, name)(*args)) for name, args in ENDPOINTS
+        }
+
+
+class testLigasParser(unittest.TestCase):
+    def test_best_parser_is_lxml(self):
+        self.assertEqual(best_parser(), "lxml")
+        self.assertEqual(Fbref.parser, "lxml")
+
+    def test_unknown_parser_is_rejected(self):
+        with pytest.raises(ValueError):
+            make_soup("<p></p>", "regex")
+
+    def test_strainer_builds_only_the_matching_subtrees(self):
+        html = (
+            '<div id="meta"><p>x</p></div><table class="stats_table sortable" id="a">'
+            + '<tr><td>1</td></tr></table><table class="other"><tr><td>2</td></tr></table>'
+        )
+        for parser in available_parsers():
+            with self.subTest(parser=parser):
+                soup = make_soup(
+                    html, parser, SoupStrainer("table", attrs={"class": css_class("stats_table")})
+                )
+                self.assertEqual([t["id"] for t in soup.find_all("table")], ["a"])
+                if parser != "html5lib":
+                    self.assertIsNone(soup.find("div"))
+
+    def test_targeted_parsing_matches_full_parsing(self):
+        full = run_endpoints(
+            "lxml", _soup=classmethod(lambda cls, content, only=None: make_soup(content, "lxml"))
+        )
+        self.assertEqual(run_endpoints("lxml"), full)
+
+    def test_row_is_extracted_from_its_cells(self):
+        soup = make_soup(
+            '<table><tr><th data-stat="wk">1</th><td data-stat="home"><a href="/a">Inter</a></td>'
+            + '<td data-stat="score"><a>2–1</a></td><td data-stat="home">dup</td></tr>'
+            + '<tr><th data-stat="wk">2</th><td data-stat="home">Milan</td></tr></table>'
+        )
+        rows = soup.find_all("tr")
+
+        self.assertEqual(list(row_cells(rows[0])), ["wk", "home", "score"])
+        records = extract_rows(
+            rows,
+            {
+                "week": text("wk"),
+                "team": {"name": link_text("home"), "url": href("home", "https://fbref.com")},
+                "goals": split_link_text("score", "–", 0),
+            },
+            where=lambda cells: "score" in cells,
+        )
+        self.assertEqual(
+            records,
+            [{"week": "1", "team": {"name": "Inter", "url": "https://fbref.com/a"}, "goals": "2"}],
+        )
+
+        missing = extract_rows(rows[1:], {"name": link_text("home"), "ref": text("referee")})
+        self.assertTrue(all(math.isnan(v) for v in missing[0].values()))
+
+    def test_table_frame_matches_read_html(self):
+        columns = ["Player", "Pos", "MP", "Gls"]
+        tables = [
+            (stats_table("a", columns, [["A", "FW", "1,234", "2"], ["B", "", "3", ""]]), 1),
+            (stats_table("b", columns, [["A", "FW", "1", "2.5"]]), [0, 1]),
+            (stats_table("c", ["Date", "GF"], [["2025-08-23", "2"]], over_header=False), 0),
+            (
+                "<table><tr><th>x</th><th colspan='2'>y</th></tr>"
+                + "<tr><td rowspan='2'>1</td><td>a\n  b</td><td>c<br>d</td></tr>"
+                + "<tr><td>2</td></tr><tr class='thead'><th>x</th><th>y</th><th>y</th></tr>"
+                + "<tr><td>3<span style='display: none'>hidden</span></td></tr>"
+                + "<tfoot><tr><td>Total</td><td>6</td><td></td></tr></tfoot></table>",
+                None,
+            ),
+        ]
+        for html, header in tables:
+            expected = pd.read_html(StringIO(html), header=header)[0]
+            for parser in available_parsers():
+                with self.subTest(html=html[:40], parser=parser):
+                    actual = table_frame(make_soup(html, parser).find("table"), header=header)
+                    pd.testing.assert_frame_equal(actual, expected)
+
+    def test_endpoints_match_across_backends(self):
+        parsers = available_parsers()
+        if len(parsers) < 2:
+            self.skipTest("a single HTML parser is installed")
+
+        reference = run_endpoints("html.parser")
+        fixtures = reference["Fixtures"][f"{LEAGUE}-Scores-and-Fixture"]
+        self.assertEqual(fixtures[0]["score"], {"home": "2", "away": "1"})
+        self.assertEqual(len(reference["Matches"][f"{LEAGUE}-Scores-and-Fixture"]), 2)
+
+        for parser in parsers:
+            if parser == "html.parser":
+                continue
+            with self.subTest(parser=parser):
+                results = run_endpoints(parser)
+                for name, _ in ENDPOINTS:
+                    self.assertEqual(results[name], reference[name], name)
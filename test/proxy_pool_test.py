@@ -0,0 +1,101 @@
+import time
+import threading
+import tempfile
+import unittest
+from pathlib import Path
+
+from ligas.proxy_pool import ProxyPool, ProxyStats
+
+
+class OfflineProxyPool(ProxyPool):
+    """ProxyPool whose probe accepts every proxy ending with an even digit"""
+
+    def _check(self, proxy, timeout=None):
+        if int(proxy[-1]) % 2:
+            return None
+        return ProxyStats(
+            address=proxy, latency=int(proxy[-1]) + 1, successes=1, last_checked=time.time()
+        )
+
+
+class testLigasProxyPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "proxies.json"
+        self.source = lambda: [f"10.0.0.{i}:808{i}" for i in range(6)]
+        super().setUp()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+        super().tearDown()
+
+    def test_refresh_keeps_live_proxies_ranked(self):
+        pool = OfflineProxyPool(source=self.source, path=self.path, min_live=1)
+        pool.refresh()
+
+        self.assertEqual(len(pool), 3)
+        self.assertEqual(pool.stats()[0].address, "10.0.0.0:8080")
+
+    def test_get_rotates_and_failures_evict(self):
+        pool = OfflineProxyPool(source=self.source, path=self.path, min_live=0)
+        pool._started = True
+        pool.refresh()
+
+        self.assertEqual(len({pool.get() for _ in range(3)}), 3)
+
+        pool.report_failure("10.0.0.2:8082")
+        pool.report_failure("10.0.0.2:8082")
+
+        self.assertNotIn("10.0.0.2:8082", [s.address for s in pool.stats()])
+
+    def test_get_rotates_over_the_best_proxies(self):
+        pool = OfflineProxyPool(source=self.source, path=self.path, min_live=0, top_k=2)
+        pool._started = True
+        pool.refresh()
+
+        self.assertEqual({pool.get() for _ in range(6)}, {"10.0.0.0:8080", "10.0.0.2:8082"})
+
+        # A fast answer through the slowest proxy ranks it among the best
+        for _ in range(10):
+            pool.report_success("10.0.0.4:8084", 0.01)
+
+        self.assertEqual(pool.stats()[0].address, "10.0.0.4:8084")
+        self.assertIn("10.0.0.4:8084", {pool.get() for _ in range(2)})
+
+    def test_concurrent_refreshes_run_once(self):
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def source():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return []
+
+        pool = OfflineProxyPool(source=source, path=self.path)
+        pool.refresh(wait=False)
+        started.wait(5)
+        threads = [threading.Thread(target=pool.refresh) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        release.set()
+
+        self.assertEqual(len(calls), 1)
+
+    def test_pool_is_restored_from_disk_within_ttl(self):
+        OfflineProxyPool(source=self.source, path=self.path).refresh()
+
+        restored = OfflineProxyPool(source=lambda: [], path=self.path)
+        restored.load()
+        expired = OfflineProxyPool(source=lambda: [], path=self.path, ttl=0)
+        expired.load()
+
+        self.assertEqual(len(restored), 3)
+        self.assertEqual(len(expired), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
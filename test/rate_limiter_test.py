@@ -0,0 +1,79 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from ligas.rate_limiter import RateLimiter, SharedRateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class testLigasRateLimiter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        super().setUp()
+
+    def limiter(self, **kwargs) -> RateLimiter:
+        return RateLimiter(clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_only_blocks_when_bucket_is_empty(self):
+        limiter = self.limiter(rate=1, max_rate=1, capacity=2)
+
+        self.assertEqual(limiter.acquire(), 0)
+        self.assertEqual(limiter.acquire(), 0)
+        self.assertAlmostEqual(limiter.acquire(), 1.0)
+
+        self.clock.now += 5
+        self.assertEqual(limiter.acquire(), 0)
+
+    def test_aimd_rate(self):
+        limiter = self.limiter(
+            rate=1, max_rate=1, min_rate=0.1, increase_step=0.1, success_threshold=2
+        )
+
+        limiter.on_rate_limited()
+        self.assertAlmostEqual(limiter.rate, 0.5)
+
+        for _ in range(4):
+            limiter.on_success()
+        self.assertAlmostEqual(limiter.rate, 0.7)
+
+    def test_retry_after_pauses_the_bucket(self):
+        limiter = self.limiter(rate=1, max_rate=1)
+        limiter.acquire()
+        limiter.on_rate_limited(retry_after=30)
+
+        self.assertGreaterEqual(limiter.acquire(), 30)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("120"), 120)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0)
+        self.assertIsNone(parse_retry_after(None))
+
+    def test_shared_limiters_share_one_budget(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "ratelimit.sqlite"
+            first, second = [
+                SharedRateLimiter(
+                    path=path, rate=1, max_rate=1, clock=self.clock, sleep=self.clock.sleep
+                )
+                for _ in range(2)
+            ]
+
+            self.assertEqual(first.acquire(), 0)
+            self.assertAlmostEqual(second.acquire(), 1.0)
+
+            second.on_rate_limited()
+            self.assertAlmostEqual(first.rate, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
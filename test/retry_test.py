@@ -0,0 +1,106 @@
+import unittest
+from unittest import mock
+
+import pytest
+import requests
+
+import ligas.fbref
+from ligas import Fbref
+from ligas.exceptions import (
+    FbrefCircuitOpenException,
+    FbrefRateLimitException,
+    FbrefRequestException,
+)
+from ligas.rate_limiter import RateLimiter
+from ligas.retry import AttemptMetrics, CircuitBreaker, RetryPolicy
+
+from .fakes import FakeTransport, make_response
+
+
+class testLigasRetry(unittest.TestCase):
+    def patch(self, script, **policy):
+        transport = FakeTransport(script)
+        patches = {
+            "transport": transport,
+            "proxy_pool": None,
+            "page_cache": None,
+            "rate_limiter": RateLimiter(rate=1000, max_rate=1000, capacity=1000),
+            "retry_policy": RetryPolicy(backoff_base=0, **policy),
+            "circuit_breaker": CircuitBreaker(failure_threshold=3),
+            "metrics": AttemptMetrics(),
+        }
+        for name, value in patches.items():
+            patcher = mock.patch.object(Fbref, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return transport
+
+    def test_transient_errors_are_retried(self):
+        transport = self.patch([requests.ConnectionError(), 503, 200])
+
+        response = Fbref._get("https://fbref.com/en/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(transport.calls), 3)
+        self.assertEqual(Fbref.metrics.summary()["retries"], 2)
+
+    def test_not_found_is_not_retried(self):
+        transport = self.patch([404])
+
+        with pytest.raises(FbrefRequestException):
+            Fbref._get("https://fbref.com/en/")
+        self.assertEqual(len(transport.calls), 1)
+
+    def test_rate_limit_raised_once_attempts_are_exhausted(self):
+        self.patch([make_response(429, headers={"Retry-After": "0"})], max_attempts=2)
+
+        with pytest.raises(FbrefRateLimitException):
+            Fbref._get("https://fbref.com/en/")
+
+    def test_retry_after_is_waited_by_the_rate_limiter_only(self):
+        self.patch([make_response(429, headers={"Retry-After": "30"}), 200])
+        clock = [0.0]
+        waits = {"limiter": [], "backoff": []}
+
+        def sleeper(name):
+            def sleep(seconds):
+                waits[name].append(seconds)
+                clock[0] += seconds
+
+            return sleep
+
+        limiter = RateLimiter(
+            rate=1000,
+            max_rate=1000,
+            capacity=1000,
+            clock=lambda: clock[0],
+            sleep=sleeper("limiter"),
+        )
+        with mock.patch.object(Fbref, "rate_limiter", limiter), mock.patch.object(
+            ligas.fbref.time, "sleep", sleeper("backoff")
+        ):
+            response = Fbref._get("https://fbref.com/en/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sum(waits["backoff"]), 0)
+        self.assertGreaterEqual(sum(waits["limiter"]), 30)
+
+    def test_circuit_opens_after_repeated_failures(self):
+        self.patch([504], max_attempts=3)
+
+        with pytest.raises(FbrefRequestException):
+            Fbref._get("https://fbref.com/en/")
+        self.assertEqual(Fbref.circuit_breaker.state("fbref.com"), "open")
+
+        with pytest.raises(FbrefCircuitOpenException):
+            Fbref._get("https://fbref.com/en/")
+
+    def test_delay_honours_retry_after(self):
+        policy = RetryPolicy(backoff_base=1, jitter=False)
+
+        self.assertEqual(policy.delay(3), 4)
+        self.assertEqual(policy.delay(1, retry_after=30), 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
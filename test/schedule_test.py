@@ -0,0 +1,58 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ligas import Fbref
+from ligas.memory_cache import MemoryCache
+from ligas.parsing import make_soup
+from ligas.schedule import HEAD_TO_HEAD, MATCH_REPORT, ScheduleTable
+
+from .pages import FakeSite, LEAGUE, PREVIOUS, schedule_page
+
+
+class testLigasSchedule(unittest.TestCase):
+    def setUp(self):
+        table = make_soup(schedule_page()).find("table")
+        self.schedule = ScheduleTable.parse(table, LEAGUE, PREVIOUS, "https://fbref.com")
+
+    def test_parse_skips_spacer_and_header_rows(self):
+        self.assertEqual(len(self.schedule.rows), 3)
+        self.assertEqual(
+            self.schedule.rows[0]["match link"], "https://fbref.com/en/matches/2025-08-23"
+        )
+
+    def test_views_filter_the_rows(self):
+        self.assertEqual(len(self.schedule.select((MATCH_REPORT,))), 2)
+        self.assertEqual(len(self.schedule.select((HEAD_TO_HEAD,))), 1)
+        self.assertEqual(len(self.schedule.select(date="2025-08-30")), 1)
+        self.assertEqual(len(self.schedule.select(team="Napoli")), 2)
+
+    def test_format_nests_the_record(self):
+        match = self.schedule.matches((MATCH_REPORT,), xg=False, team_stats=len)[0]
+
+        self.assertEqual(match["score"], {"home": "2", "away": "1"})
+        self.assertEqual(
+            match["stats"]["away"],
+            {
+                "link team stats": "https://fbref.com/en/squads/dc56fe14/Milan-Stats",
+                "team stats": 5,
+            },
+        )
+        self.assertEqual(match["teams"], {"home": "Inter", "away": "Milan"})
+
+    def test_fixture_endpoints_share_one_fetch(self):
+        site = FakeSite()
+        with tempfile.TemporaryDirectory() as root, mock.patch.multiple(
+            Fbref,
+            _get=site.get,
+            _cache_path=lambda name, args, kwargs: Path(root) / f"{name}_{args}_{kwargs}",
+            result_cache=MemoryCache(),
+        ):
+            Fbref.Fixtures(PREVIOUS, LEAGUE)
+            Fbref.MatchReport(PREVIOUS, LEAGUE)
+            Fbref.HeadHead(PREVIOUS, LEAGUE)
+            Fbref.Matches("2025-08-23", PREVIOUS, LEAGUE)
+
+        schedules = [url for url in site.requested if "Scores-and-Fixtures" in url]
+        self.assertEqual(len(schedules), 1)
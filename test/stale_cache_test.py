@@ -0,0 +1,110 @@
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+import requests
+
+from ligas import Fbref
+from ligas.cache_format import write_entry
+from ligas.cache_policy import CacheEntry, CachePolicy
+from ligas.exceptions import FbrefRateLimitException
+from ligas.memory_cache import MemoryCache
+
+NOW = 1_700_000_000.0
+
+
+class testLigasStaleCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.policy = CachePolicy(default_ttl=60, clock=lambda: NOW)
+        self.outcome = {"league": "fresh"}
+        self.calls = []
+        self.release = threading.Event()
+        self.release.set()
+
+        def endpoint(cls, league):
+            self.calls.append(league)
+            self.release.wait(5)
+            if isinstance(self.outcome, Exception):
+                raise self.outcome
+            return self.outcome
+
+        self.endpoint = Fbref.cache_data(endpoint)
+        patcher = mock.patch.multiple(
+            Fbref,
+            _cache_path=lambda name, args, kwargs: self.root / f"{name}_{args}_{kwargs}",
+            result_cache=MemoryCache(),
+            cache_policy=self.policy,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.release.set()
+        self.tmp.cleanup()
+
+    def store(self, data, expires):
+        write_entry(CacheEntry(data, expires, NOW - 3600), self.root / "endpoint_('Serie A',)_{}")
+
+    def test_stale_entry_is_served_on_rate_limiting(self):
+        self.store({"league": "stale"}, NOW - 10)
+        self.outcome = FbrefRateLimitException()
+
+        data, status = self.endpoint(Fbref, "Serie A", with_status=True)
+        self.assertEqual(data, {"league": "stale"})
+        self.assertTrue(status.stale)
+        self.assertIs(status.error, self.outcome)
+        self.assertEqual(status.created, NOW - 3600)
+
+        # Stale results are not kept in memory: the next call tries again
+        self.outcome = requests.ConnectionError()
+        self.assertEqual(self.endpoint(Fbref, "Serie A"), {"league": "stale"})
+        self.assertEqual(len(self.calls), 2)
+
+    def test_errors_are_raised_without_a_servable_entry(self):
+        self.outcome = FbrefRateLimitException()
+        with pytest.raises(FbrefRateLimitException):
+            self.endpoint(Fbref, "Serie A")
+
+        self.store({"league": "stale"}, NOW - 10)
+        self.outcome = ValueError("parsing failed")
+        with pytest.raises(ValueError):
+            self.endpoint(Fbref, "Serie A")
+
+        self.outcome = FbrefRateLimitException()
+        self.policy.max_stale = 5
+        with pytest.raises(FbrefRateLimitException):
+            self.endpoint(Fbref, "Serie A")
+
+        self.policy.max_stale = None
+        self.policy.stale_on_error = False
+        with pytest.raises(FbrefRateLimitException):
+            self.endpoint(Fbref, "Serie A")
+
+    def test_stale_while_revalidate(self):
+        self.policy.stale_while_revalidate = True
+        self.store({"league": "stale"}, NOW - 10)
+        self.release.clear()
+
+        data, status = self.endpoint(Fbref, "Serie A", with_status=True)
+        self.assertEqual(data, {"league": "stale"})
+        self.assertTrue(status.revalidating)
+        # A refresh is already running: it is not scheduled twice
+        self.assertEqual(self.endpoint(Fbref, "Serie A"), {"league": "stale"})
+
+        self.release.set()
+        for _ in range(500):
+            if not Fbref._revalidating:
+                break
+            time.sleep(0.01)
+
+        data, status = self.endpoint(Fbref, "Serie A", with_status=True)
+        self.assertEqual(data, {"league": "fresh"})
+        self.assertTrue(status.fresh)
+        self.assertEqual(status.expires, NOW + 60)
+        self.assertEqual(self.calls, ["Serie A"])
@@ -0,0 +1,45 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ligas import Fbref
+from ligas.memory_cache import MemoryCache
+from ligas.parsing import make_soup
+from ligas.team_page import TeamPage, commented_tables
+
+from .pages import FakeSite, LEAGUE, team_page
+
+
+class testLigasTeamPage(unittest.TestCase):
+    def setUp(self):
+        markup = team_page("Inter").encode("utf-8")
+        self.hidden = commented_tables(markup)
+        self.page = TeamPage.parse([make_soup(markup), make_soup(self.hidden)])
+
+    def test_commented_tables_are_indexed(self):
+        self.assertIn(b'id="stats_playing_time_12"', self.hidden)
+        self.assertNotIn(b"stats_keeper_12", self.hidden)
+        self.assertEqual(list(self.page.tables)[-1], "stats_playing_time_12")
+        self.assertEqual(commented_tables(b"<!-- no table here --><table></table>"), b"")
+
+    def test_table_is_the_first_id_match(self):
+        self.assertEqual(self.page.table("passing")["id"], "stats_passing_12")
+        self.assertEqual(self.page.table("passing_type")["id"], "stats_passing_types_12")
+        self.assertEqual(self.page.table("for")["id"], "matchlogs_for")
+        self.assertIsNone(self.page.table("misc"))
+
+    def test_team_stats_are_read_from_both_pages(self):
+        with tempfile.TemporaryDirectory() as root, mock.patch.multiple(
+            Fbref,
+            _get=FakeSite().get,
+            _cache_path=lambda name, args, kwargs: Path(root) / f"{name}_{args}_{kwargs}",
+            result_cache=MemoryCache(),
+        ):
+            infos = Fbref.TeamInfos("Inter", LEAGUE)
+
+        for season in ("current stats", "previous stats"):
+            stats = infos[season]
+            self.assertEqual(set(Fbref.team_stats_categories) - set(stats), set())
+            self.assertEqual(list(stats["playing time"]["Player"])[0], "Inter Forward")
+            self.assertEqual(list(stats["players"]["Url"])[0], "/en/players/0/p")
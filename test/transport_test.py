@@ -0,0 +1,158 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from unittest import mock
+
+from ligas import Fbref
+from ligas import transport as transport_module
+from ligas.transport import Transport, SingleFlight, make_transport
+
+
+class testLigasTransport(unittest.TestCase):
+    def test_fbref_shares_one_transport(self):
+        """
+            Every Fbref call goes through the same pooled session
+        """
+        self.assertIsInstance(Fbref.transport, Transport)
+        self.assertIs(Fbref.transport.session, Fbref.transport.session)
+
+    def test_configure_pool_and_timeouts(self):
+        transport = Transport(pool_maxsize=2, connect_timeout=1, read_timeout=2)
+
+        self.assertEqual(transport.timeout, (1, 2))
+
+        transport.configure(pool_maxsize=8, read_timeout=5)
+        adapter = transport.session.get_adapter("https://fbref.com/")
+
+        self.assertEqual(transport.pool_maxsize, 8)
+        self.assertEqual(adapter._pool_maxsize, 8)
+        self.assertEqual(transport.timeout, (1, 5))
+
+    def test_headers_are_kept_on_session(self):
+        transport = Transport(headers={"User-Agent": "ligas-test"})
+
+        self.assertEqual(transport.session.headers["User-Agent"], "ligas-test")
+
+    def test_http2_falls_back_to_http1_when_unavailable(self):
+        with mock.patch.object(transport_module, "httpx", None):
+            transport = make_transport(http2=True)
+
+        self.assertIs(type(transport), Transport)
+
+    def test_http2_transport_returns_requests_responses(self):
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+
+        def handler(request):
+            if request.url.path == "/down":
+                raise httpx.ConnectError("down", request=request)
+            return httpx.Response(200, content=b"<html></html>", headers={"ETag": "v1"})
+
+        transport = make_transport(http2=True)
+        transport.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        response = transport.get("https://fbref.com/en/")
+
+        self.assertIsInstance(response, requests.Response)
+        self.assertEqual(response.content, b"<html></html>")
+        self.assertEqual(response.headers["etag"], "v1")
+        with pytest.raises(requests.ConnectionError):
+            transport.get("https://fbref.com/down")
+
+    def test_http2_transport_sends_proxied_requests_over_http2(self):
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        proxies = []
+
+        def client(proxy=None):
+            proxies.append(proxy)
+            return httpx.Client(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200))
+            )
+
+        transport = make_transport(http2=True, max_proxy_clients=1)
+        with mock.patch.object(transport, "_client", client), mock.patch.object(
+            transport.session, "get"
+        ) as http1:
+            for proxy in ["10.0.0.1:8080", "10.0.0.1:8080", "10.0.0.2:8080"]:
+                response = transport.get(
+                    "https://fbref.com/en/", proxies={"http": proxy, "https": proxy}
+                )
+                self.assertEqual(response.status_code, 200)
+
+        http1.assert_not_called()
+        self.assertEqual(proxies, ["10.0.0.1:8080", "10.0.0.2:8080"])
+        self.assertEqual(list(transport._proxied), ["10.0.0.2:8080"])
+
+    def test_http2_proxy_clients_use_the_proxy(self):
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        transport = make_transport(http2=True)
+        with mock.patch.object(transport_module.httpx, "Client") as client:
+            transport._client("10.0.0.1:8080")
+
+        self.assertEqual(client.call_args.kwargs["proxy"], "http://10.0.0.1:8080")
+        self.assertTrue(client.call_args.kwargs["http2"])
+
+
+class testLigasSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return b"page"
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(lambda _: flight.do("url", fetch), range(5)))
+
+        self.assertEqual(results, [b"page"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.coalesced, 4)
+
+    def test_errors_reach_every_waiter_and_are_not_kept(self):
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            flight.do("url", fail)
+        self.assertEqual(flight.do("url", lambda: 1), 1)
+
+    def test_waiters_rerun_calls_failing_with_a_retried_error(self):
+        class BudgetError(Exception):
+            pass
+
+        flight = SingleFlight()
+        started = threading.Event()
+        calls = []
+
+        def leader():
+            started.set()
+            time.sleep(0.1)
+            raise BudgetError()
+
+        def follower():
+            calls.append(1)
+            return b"page"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(flight.do, "url", leader, retry_on=(BudgetError,))
+            started.wait(5)
+            second = executor.submit(flight.do, "url", follower, retry_on=(BudgetError,))
+
+            with pytest.raises(BudgetError):
+                first.result()
+            self.assertEqual(second.result(), b"page")
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()